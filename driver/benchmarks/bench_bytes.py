@@ -0,0 +1,66 @@
+"""Byte conversion benchmark.
+
+Times the conversions of `src.common.bytes.bytes` done for every EIS request and every USB transfer: decoding the
+floats sent by the device, and building and decoding frequency masks.
+
+Run from the 'driver' directory:
+
+    python benchmarks/bench_bytes.py
+
+.. _benchmarks-bench_bytes:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/bench_bytes.py
+
+"""
+from __future__ import absolute_import
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.common.bytes import bytes
+from src.common.frequency.frequency_plan import N_FREQUENCY_BITS
+from src.config.config import F_MIN, N_SAMPLES, N_PERIODS
+
+from sweep_data import SWEEP_SIZES, get_plan, get_transfer
+from timing import best_time
+
+CHUNK_SIZE = 64
+"""int: The number of bytes read from the device per transfer.
+"""
+
+
+def run():
+    """Run the benchmark.
+
+    Returns:
+        dict: The time per call in seconds of each case, keyed by case name.
+
+    """
+    results = {}
+    chunk = get_transfer(CHUNK_SIZE // 4)
+    n_chunks = 2 * N_SAMPLES * N_PERIODS // (CHUNK_SIZE // 4 - 1) + 1  #: the first float of a chunk is a position
+
+    results['bytes_to_double_chunk'] = best_time(lambda: bytes.bytes_to_double(chunk), number=100)
+    results['bytes_to_double_frequency'] = results['bytes_to_double_chunk'] * n_chunks
+
+    f_max = F_MIN * 2 ** (N_FREQUENCY_BITS - 1)
+
+    for n_freqs in SWEEP_SIZES:
+        mask = get_plan(n_freqs).mask
+
+        results['map_ones_to_decimal_%i' % n_freqs] = best_time(lambda: bytes.map_ones_to_decimal(mask, F_MIN),
+                                                                number=1000)
+
+        if n_freqs > 1:
+            results['balance_binary_string_%i' % n_freqs] = \
+                best_time(lambda: bytes.balance_binary_string(F_MIN, f_max, n_freqs - 2, F_MIN), number=1000)
+            results['distribute_bits_%i' % n_freqs] = \
+                best_time(lambda: bytes.distribute_bits(n_freqs - 2, N_FREQUENCY_BITS - 2), number=1000)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, seconds in sorted(run().items()):
+        print "%-32s %12.1f us" % (name, seconds * 1e6)
@@ -0,0 +1,71 @@
+"""CSV writing and reading benchmark.
+
+Times `src.common.file.csv_files.write_current_voltage_csv` at the end of sweeps of different sizes, writing to a
+temporary directory, and `src.common.file.sweep_csv.SweepCSV` reading the files back, either whole or a single
+frequency.
+
+Run from the 'driver' directory:
+
+    python benchmarks/bench_csv.py
+
+.. _benchmarks-bench_csv:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/bench_csv.py
+
+"""
+from __future__ import absolute_import
+
+import datetime
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.common.file import csv_files
+from src.common.file.sweep_csv import SweepCSV
+
+from sweep_data import SWEEP_SIZES, get_sweep
+from timing import best_time
+
+
+def run():
+    """Run the benchmark.
+
+    Returns:
+        dict: The time per call in seconds of each case, keyed by case name.
+
+    """
+    results = {}
+    dir_name = tempfile.mkdtemp()
+    start_time = datetime.datetime(2017, 1, 1)
+
+    try:
+        for n_freqs in SWEEP_SIZES:
+            sweep = get_sweep(n_freqs)
+
+            def write():
+                csv_files.write_current_voltage_csv(dir_name, 'bench', sweep, 0, 3.7, '0123456789', start_time,
+                                                    lambda messages: None)
+                os.remove(os.path.join(dir_name, 'bench.csv'))
+
+            results['write_csv_%i' % n_freqs] = best_time(write)
+
+            csv_files.write_current_voltage_csv(dir_name, 'read', sweep, 0, 3.7, '0123456789', start_time,
+                                                lambda messages: None)
+            path = os.path.join(dir_name, 'read.csv')
+
+            results['read_csv_%i' % n_freqs] = best_time(lambda: SweepCSV.open(path).load())
+            results['read_csv_%i_one_freq' % n_freqs] = best_time(lambda: SweepCSV.open(path).load([n_freqs // 2]))
+
+            os.remove(path)
+
+    finally:
+        shutil.rmtree(dir_name)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, seconds in sorted(run().items()):
+        print "%-32s %12.1f us" % (name, seconds * 1e6)
@@ -0,0 +1,177 @@
+"""Frequency distribution benchmark.
+
+Times `src.common.bytes.bytes.distribute_bits` against the dynamic program it replaced, over every distribution of the
+24-bit frequency mask, and checks that the new distributions are never costlier than the old ones.
+
+Run from the 'driver' directory:
+
+    python benchmarks/bench_distribute_bits.py
+
+.. _benchmarks-bench_distribute_bits:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/bench_distribute_bits.py
+
+"""
+from __future__ import absolute_import
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.common.bytes import bytes
+
+MAX_MIDDLE_BITS = 22
+"""int: The number of bits between the lowest and the highest frequencies of the 24-bit mask.
+"""
+
+
+def get_cost(distribution):
+    """The cost both algorithms minimize.
+
+    Args:
+        distribution (str): The middle bits.
+
+    Returns:
+        int: The sum of the cubes of the lengths of the runs of 0's between the bounds.
+
+    """
+    return sum(len(run) ** 3 for run in ("1" + distribution + "1").split("1"))
+
+
+def get_num_chained_zero_bits(left, right):
+    """Count the 0's that end `left` and the ones that start `right`.
+
+    Args:
+        left (str): The binary string concatenated from the left.
+        right (str): The binary string concatenated from the right.
+
+    Returns:
+        (int, int): The number of trailing 0's of `left` and of leading 0's of `right`.
+
+    """
+    return len(left) - len(left.rstrip("0")), len(right) - len(right.lstrip("0"))
+
+
+def dp_distribute_bits(bits, max_bits):
+    """The dynamic program `distribute_bits` used before, as a baseline.
+
+    Args:
+        bits (int): The number of 1's to distribute.
+        max_bits (int): The length of the binary string where the 1's will be distributed.
+
+    Returns:
+        str: The binary string with 1's distributed.
+
+    """
+    n_bits = bits if max_bits > bits * 2 else max_bits - bits
+
+    if n_bits == 0:
+        return ("0" if max_bits > bits * 2 else "1") * max_bits
+
+    N = [[-1] * (max_bits + 1) for _ in xrange(n_bits + 1)]
+    E = [[""] * (max_bits + 1) for _ in xrange(n_bits + 1)]
+
+    for j in xrange(max_bits + 1):
+        N[0][j] = j ** 3
+        E[0][j] = "0" * j
+
+    for i in xrange(1, n_bits + 1):
+        N[i][0] = 0
+        E[i][0] = "1"
+
+    N[1][1] = 0
+    E[1][1] = "1"
+
+    for i in xrange(1, n_bits + 1):
+        for k in xrange(i, max_bits + 1):
+            if i == 1 and k == 1:
+                continue
+
+            q = float("inf")
+            q_e = ""
+
+            for j in xrange(1, k):
+                for l in xrange(1, i + 1):
+                    val = N[l][j] + N[i - l][k - j]
+
+                    if val < q:
+                        left = E[l][j]
+                        right = E[i - l][k - j]
+
+                        reps = 0
+                        while reps < 4 and left[-1] == "0" and right[0] == "0":
+                            if reps % 2 == 1:
+                                right = right[::-1]
+
+                            left = left[::-1]
+                            reps += 1
+
+                        if left[-1] == "0" and right[0] == "0":
+                            le = left
+                            r = right
+
+                            init_val = val
+                            min_val = float("inf")
+
+                            for x in xrange(4):
+                                m, n = get_num_chained_zero_bits(le, r)
+                                v = init_val - m ** 3 - n ** 3 + (m + n) ** 3
+
+                                if v < min_val:
+                                    min_val = v
+                                    left = le
+                                    right = r
+
+                                if x % 2 == 1:
+                                    r = r[::-1]
+
+                                le = le[::-1]
+
+                            val = min_val
+
+                        if val < q:
+                            q = val
+                            q_e = left + right
+
+            N[i][k] = q
+            E[i][k] = q_e
+
+    distribution = E[n_bits][max_bits]
+
+    if max_bits > 2 * bits:
+        return distribution
+
+    return "".join("1" if bit == "0" else "0" for bit in distribution)
+
+
+def run():
+    """Run the benchmark.
+
+    Returns:
+        dict: The time in seconds of each case, keyed by case name.
+
+    Raises:
+        AssertionError: If some new distribution is costlier than the old one.
+
+    """
+    cases = [(bits, max_bits) for max_bits in xrange(MAX_MIDDLE_BITS + 1) for bits in xrange(max_bits + 1)]
+
+    for bits, max_bits in cases:
+        new, old = bytes.distribute_bits(bits, max_bits), dp_distribute_bits(bits, max_bits)
+
+        assert len(new) == max_bits and new.count("1") == bits, (bits, max_bits, new)
+        assert get_cost(new) <= get_cost(old), (bits, max_bits, new, old)
+
+    def sweep(fn):
+        return lambda: [fn(bits, max_bits) for bits, max_bits in cases]
+
+    return dict(distribute_all=min(timeit.repeat(sweep(bytes.distribute_bits), number=1, repeat=3)),
+                distribute_all_dp=min(timeit.repeat(sweep(dp_distribute_bits), number=1, repeat=1)),
+                distribute_worst=min(timeit.repeat(lambda: bytes.distribute_bits(11, 22), number=100)) / 100,
+                distribute_worst_dp=min(timeit.repeat(lambda: dp_distribute_bits(11, 22), number=1, repeat=1)))
+
+
+if __name__ == '__main__':
+    for name, seconds in sorted(run().items()):
+        print "%-32s %12.1f us" % (name, seconds * 1e6)
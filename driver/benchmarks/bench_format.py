@@ -0,0 +1,122 @@
+"""Paragraph wrapping benchmark.
+
+Times `src.common.file.format.format_string` against the quadratic dynamic program it replaced, on paragraphs of
+increasing length, and checks both produce the same output. It also times the console's common case, that is,
+formatting the same message templates over and over through the cache.
+
+Run from the 'driver' directory:
+
+    python benchmarks/bench_format.py
+
+.. _benchmarks-bench_format:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/bench_format.py
+
+"""
+from __future__ import absolute_import
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.common.file import format as format_file
+from src.common.log.console_message import MESSAGE_FORMATS, BACKEND_MESSAGES, CHAR_LENGTH
+from src.components.console import MAX_CHARS_CONSOLE
+
+from timing import best_time
+
+LENGTHS = [10, 100, 1000, 5000]
+"""list of int: The number of words of each paragraph timed.
+"""
+
+
+def quadratic_format_string(w, m):
+    """The O(n^2) dynamic program `format_string` used before, as a baseline.
+
+    Args:
+        w (list of str): The paragraph (list of words) to be printed neatly.
+        m (int): The maximum number of characters per line.
+
+    Returns:
+        str: The paragraph with the neatest possible format.
+
+    """
+    m = max([m] + [len(word) for word in w])
+    N = [0.0] + [float("inf")] * len(w)
+    S = [0] * (len(w) + 1)
+    total_sum = 0
+
+    for j in range(1, len(w) + 1):
+        total_sum += len(w[j - 1])
+        s = total_sum
+
+        for k in range(j):
+            if k > 0:
+                s -= len(w[k - 1])
+
+            p = m - j + k + 1 - s
+
+            if p >= 0:
+                c = N[k] + (0 if j == len(w) else p ** 3)
+
+                if N[j] > c:
+                    N[j] = c
+                    S[j] = k
+
+    return format_file.reconstruct_neat_string(S, w)
+
+
+def random_paragraph(n, rng):
+    """Generate a paragraph of random words.
+
+    Args:
+        n (int): The number of words.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        list of str: The paragraph.
+
+    """
+    return ['w' * rng.randint(1, 12) for _ in xrange(n)]
+
+
+def run():
+    """Run the benchmark.
+
+    Returns:
+        dict: The time per call in seconds of each case, keyed by case name.
+
+    """
+    rng = random.Random(0)
+    width = MAX_CHARS_CONSOLE * CHAR_LENGTH
+    results = {}
+
+    for n in LENGTHS:
+        w = random_paragraph(n, rng)
+
+        def cold():
+            format_file._cache.clear()
+            return format_file.format_string(w, width)
+
+        results['wrap_%i_words' % n] = best_time(cold)
+
+        if n <= 1000:  #: the baseline takes minutes beyond this
+            assert quadratic_format_string(w, width) == cold()
+            results['wrap_%i_words_quadratic' % n] = best_time(lambda: quadratic_format_string(w, width))
+
+    templates = [msg.split(" ") for msg in MESSAGE_FORMATS + BACKEND_MESSAGES]
+
+    def templated():
+        for words in templates:
+            format_file.format_string(words, width)
+
+    format_file._cache.clear()
+    results['templates_cached'] = best_time(templated, number=100) / len(templates)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, seconds in sorted(run().items()):
+        print "%-32s %12.1f us" % (name, seconds * 1e6)
@@ -0,0 +1,55 @@
+"""Impedance benchmark.
+
+Times `src.methods.fourier.get_impedance`, which the plot calls once per frequency received, and
+`src.methods.fourier.get_impedances`, which computes a whole sweep at once.
+
+Run from the 'driver' directory:
+
+    python benchmarks/bench_fourier.py
+
+.. _benchmarks-bench_fourier:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/bench_fourier.py
+
+"""
+from __future__ import absolute_import
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.methods import fourier
+
+from sweep_data import SWEEP_SIZES, get_plan, get_data_sets
+from timing import best_time
+
+
+def run():
+    """Run the benchmark.
+
+    Returns:
+        dict: The time per call in seconds of each case, keyed by case name.
+
+    """
+    results = {}
+
+    for n_freqs in SWEEP_SIZES:
+        plan = get_plan(n_freqs)
+        data_sets = get_data_sets(plan)
+        samples_per_period = plan.samples_per_period
+
+        def one_by_one():
+            for data_set, spp in zip(data_sets, samples_per_period):
+                fourier.get_impedance(data_set, spp)
+
+        results['get_impedance_%i' % n_freqs] = best_time(one_by_one, number=10)
+        results['get_impedances_%i' % n_freqs] = best_time(lambda: fourier.get_impedances(data_sets,
+                                                                                          samples_per_period),
+                                                           number=10)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, seconds in sorted(run().items()):
+        print "%-32s %12.1f us" % (name, seconds * 1e6)
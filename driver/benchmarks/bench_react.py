@@ -0,0 +1,73 @@
+"""React data structures benchmark.
+
+Times the data structures React goes through on every state change: building a `NamedTuple` and replacing its fields,
+as reducers and components do, and the `DoublyLinkedList` operations used by the Redux dispatcher.
+
+Run from the 'driver' directory:
+
+    python benchmarks/bench_react.py
+
+.. _benchmarks-bench_react:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/bench_react.py
+
+"""
+from __future__ import absolute_import
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from react.data_structures.doubly_linked_list import DoublyLinkedList
+from react.index import NamedTuple
+from src.reducers.usb_reducer import DEFAULT_STATE
+
+from timing import best_time
+
+LIST_SIZES = [10, 1000]
+"""list of int: The number of items of each list benchmarked.
+"""
+
+
+def run():
+    """Run the benchmark.
+
+    Returns:
+        dict: The time per call in seconds of each case, keyed by case name.
+
+    """
+    results = {}
+    state = NamedTuple(DEFAULT_STATE, 'USBState')
+    changes = dict(status=0xD0, message=None, error=(None, None))
+
+    results['named_tuple_new'] = best_time(lambda: NamedTuple(DEFAULT_STATE, 'USBState'), number=100)
+    results['named_tuple_replace'] = best_time(lambda: state._replace(**changes), number=1000)
+
+    for n in LIST_SIZES:
+        def fill():
+            linked_list = DoublyLinkedList()
+
+            for i in xrange(n):
+                linked_list.insert(i)
+
+            return linked_list
+
+        def fill_and_drain():
+            linked_list = fill()
+
+            while not linked_list.is_empty():
+                linked_list.pop()
+
+        full = fill()
+
+        results['linked_list_insert_%i' % n] = best_time(fill, number=10) / n
+        results['linked_list_insert_pop_%i' % n] = best_time(fill_and_drain, number=10) / n
+        results['linked_list_iterate_%i' % n] = best_time(lambda: list(full), number=10) / n
+        results['linked_list_remove_%i' % n] = best_time(lambda: full.remove(-1), number=10)  #: worst case, a miss
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, seconds in sorted(run().items()):
+        print "%-32s %12.1f us" % (name, seconds * 1e6)
@@ -0,0 +1,154 @@
+"""GUI render benchmark.
+
+Builds the whole GUI with the recording backend of `react.fake_backend`, i.e. without a display, and drives it with
+synthetic actions dispatched straight to the store, the way the results of the USB actions are. Each case times an
+update from the dispatch until every callback it scheduled has run, e.g. the console's flush. Run on its own, the
+benchmark also prints how many Tkinter calls and render passes each update costs.
+
+The GUI's own timers are canceled once it's built, so that it never reaches for the device.
+
+Run from the 'driver' directory:
+
+    python benchmarks/bench_render.py
+
+.. _benchmarks-bench_render:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/bench_render.py
+
+"""
+from __future__ import absolute_import
+
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import react.index as react
+from react.fake_backend import FakeBackend
+from react.redux.index import get_store
+from src.actions.actions import ACTION_TYPES, sBUSY, sSIGN
+from src.components.gui import GUI
+from src.config.config import N_SAMPLES, N_PERIODS
+
+from sweep_data import get_plan, get_data_sets
+from timing import best_time
+
+N_FREQS = 12
+"""int: The number of frequencies of the sweep dispatched.
+"""
+SETTLE_TIME = 1000
+"""int: The milliseconds of virtual time run after each update, enough for the callbacks it schedules to run.
+"""
+
+
+def new_action(action_type, data=None, args=None):
+    """Build the results of an action, as dispatched to the store.
+
+    Args:
+        action_type (str): One of `ACTION_TYPES`.
+        data (optional): The data of the results. Default is None.
+        args (optional): The arguments of the results. Default is None.
+
+    Returns:
+        react.data_structures.named_tuple.NamedTuple: The results, without an error.
+
+    """
+    return react.NamedTuple(dict(type=action_type, data=data, error=None, args=args), 'NewAction')
+
+
+def build_gui():
+    """Build the GUI with a new recording backend.
+
+    Returns:
+        (react.fake_backend.FakeBackend, src.components.gui.GUI): The backend and the GUI, with no callback scheduled.
+
+    """
+    backend = FakeBackend()
+    react.set_backend(backend)
+
+    gui = GUI()
+    backend.root.clear()
+
+    return backend, gui
+
+
+def get_cases():
+    """Build the GUI and the updates to benchmark.
+
+    Returns:
+        (react.fake_backend.FakeBackend, list of (str, () -> None)): The backend, and the name and function of each
+            update.
+
+    """
+    backend, gui = build_gui()
+    statuses = itertools.cycle([sBUSY, sSIGN])
+    plan = get_plan(N_FREQS)
+    data_sets = [data_set.tolist() for data_set in get_data_sets(plan)]
+
+    get_store().dispatch('usb', new_action(ACTION_TYPES.CONNECT, 'usb_handle'))  #: Shows the plot
+    gui.frequency_plan = plan
+    gui.set_state(dict(hive_record_ready=True))
+    backend.root.run(SETTLE_TIME)
+
+    def update_status():
+        get_store().dispatch('usb', new_action(ACTION_TYPES.UPDATE_USB_STATUS, next(statuses)))
+        backend.root.run(SETTLE_TIME)
+
+    def run_sweep():  #: All data sets but the last one, which would write the csv file
+        get_store().dispatch('usb', new_action(ACTION_TYPES.START_EIS, [], (plan, N_SAMPLES, N_PERIODS)))
+
+        for data_set in data_sets[:-1]:
+            get_store().dispatch('usb', new_action(ACTION_TYPES.START_EIS_DATA_TRANSFER, data_set))
+
+        backend.root.run(SETTLE_TIME)
+
+    return backend, [('status_update', update_status), ('sweep_%i_freqs' % (N_FREQS - 1), run_sweep)]
+
+
+def count_calls(backend, update):
+    """Count what an update costs.
+
+    Args:
+        backend (react.fake_backend.FakeBackend): The backend the GUI was built with.
+        update (() -> None): The update.
+
+    Returns:
+        (int, int): The number of Tkinter calls and of render passes.
+
+    """
+    react.config(profile=True)
+    react.reset_profile()
+    backend.reset()
+
+    update()
+
+    react.config(profile=False)
+    renders = sum(stats['renders'] for stats in react.get_profile_report()['classes'].itervalues())
+
+    return backend.total, renders
+
+
+def run():
+    """Run the benchmark.
+
+    Returns:
+        dict: The time per call in seconds of each case, keyed by case name.
+
+    """
+    results = dict(build_gui=best_time(build_gui))
+    backend, cases = get_cases()
+
+    for name, update in cases:
+        results[name] = best_time(update, number=2)
+
+    return results
+
+
+if __name__ == '__main__':
+    for name, seconds in sorted(run().items()):
+        print "%-32s %12.1f us" % (name, seconds * 1e6)
+
+    backend, cases = get_cases()
+
+    for name, update in cases:
+        print "%-32s %6i Tkinter calls %6i renders" % ((name,) + count_calls(backend, update))
@@ -0,0 +1,150 @@
+"""Benchmark suite.
+
+Runs every `bench_*.py` module in this directory, or the ones named on the command line, and writes their results as
+JSON, together with the environment they ran in, so that runs can be compared. Every module defines a `run` function
+that returns the time per call in seconds of each of its cases.
+
+Run from the 'driver' directory:
+
+    python benchmarks/run.py -o before.json
+    python benchmarks/run.py -o after.json -c before.json
+    python benchmarks/run.py bench_fourier bench_csv
+
+.. _benchmarks-run:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/run.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import argparse
+import datetime
+import glob
+import importlib
+import json
+import os
+import platform
+import sys
+
+import numpy as np
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+"""str: The directory of the benchmark modules.
+"""
+
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..'))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+
+def get_benchmark_names():
+    """Find the benchmark modules.
+
+    Returns:
+        list of str: The name of every `bench_*.py` module in `BENCHMARKS_DIR`, sorted.
+
+    """
+    return sorted(os.path.splitext(os.path.basename(path))[0]
+                  for path in glob.glob(os.path.join(BENCHMARKS_DIR, 'bench_*.py')))
+
+
+def get_environment():
+    """Describe the environment the benchmarks run in.
+
+    Returns:
+        dict: The date, the Python and numpy versions, and the platform.
+
+    """
+    return dict(date=datetime.datetime.now().isoformat(), python=platform.python_version(), numpy=np.__version__,
+                platform=platform.platform(), machine=platform.machine())
+
+
+def run(names):
+    """Run benchmarks.
+
+    Args:
+        names (list of str): The names of the benchmark modules.
+
+    Returns:
+        dict: The environment, and the results of each module keyed by module name.
+
+    """
+    results = {}
+
+    for name in names:
+        print >> sys.stderr, "Running %s..." % name
+        results[name] = importlib.import_module(name).run()
+
+    return dict(environment=get_environment(), results=results)
+
+
+def format_results(report, baseline=None):
+    """Format the results of a run as a table.
+
+    Args:
+        report (dict): The results, as returned by `run`.
+        baseline (dict, optional): The results of a previous run to compare against. Default is None.
+
+    Returns:
+        str: One line per case, with its time in microseconds, and its time relative to `baseline` if it has the case.
+
+    """
+    lines = []
+
+    for name, cases in sorted(report['results'].items()):
+        old_cases = {} if baseline is None else baseline['results'].get(name, {})
+
+        for case, seconds in sorted(cases.items()):
+            line = "%-24s %-36s %12.1f us" % (name, case, seconds * 1e6)
+
+            if old_cases.get(case):
+                line += "  %6.2fx" % (seconds / old_cases[case])
+
+            lines.append(line)
+
+    return "\n".join(lines)
+
+
+def main(argv):
+    """Run the benchmark suite from the command line.
+
+    Args:
+        argv (list of str): The command line arguments, without the program name.
+
+    Returns:
+        int: The exit status.
+
+    """
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and write its results as JSON.")
+    parser.add_argument('names', nargs='*', help="benchmark modules to run (default: all of them)")
+    parser.add_argument('-o', '--output', help="file to write the results to (default: standard output)")
+    parser.add_argument('-c', '--compare', help="results of a previous run to compare against")
+    args = parser.parse_args(argv)
+
+    names = args.names or get_benchmark_names()
+    unknown = set(names) - set(get_benchmark_names())
+
+    if unknown:
+        parser.error("unknown benchmarks: %s" % ", ".join(sorted(unknown)))
+
+    baseline = None
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    report = run(names)
+    output = json.dumps(report, indent=2, sort_keys=True)
+
+    if args.output is None:
+        print output
+    else:
+        with open(args.output, 'w') as f:
+            f.write(output + "\n")
+
+    print >> sys.stderr, format_results(report, baseline)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,103 @@
+"""Synthetic sweep data shared by the benchmarks.
+
+Every data set has the size the device sends: `N_SAMPLES` samples times `N_PERIODS` periods of voltage followed by as
+many samples of current, for frequency plans of 1 to 24 frequencies. The data is generated from a fixed seed, so that
+every run times the same inputs.
+
+.. _benchmarks-sweep_data:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/sweep_data.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import datetime
+import struct
+
+import numpy as np
+
+from src.common.data_structures.sweep import Sweep
+from src.common.frequency.frequency_plan import get_frequency_plan, N_FREQUENCY_BITS
+from src.config.config import N_SAMPLES, N_PERIODS
+
+SWEEP_SIZES = [1, 12, 24]
+"""list of int: The number of frequencies of each sweep benchmarked.
+"""
+SEED = 0
+"""int: The seed of the random noise added to the data sets.
+"""
+
+
+def get_plan(n_freqs):
+    """Get the plan of a sweep spanning the whole frequency range.
+
+    Args:
+        n_freqs (int): The number of frequencies, from 1 to 24.
+
+    Returns:
+        src.common.frequency.frequency_plan.FrequencyPlan: The plan.
+
+    """
+    if n_freqs == 1:
+        return get_frequency_plan(0, None, 1, N_PERIODS)
+
+    return get_frequency_plan(0, N_FREQUENCY_BITS - 1, n_freqs, N_PERIODS)
+
+
+def get_data_sets(plan):
+    """Generate the data sets of a sweep.
+
+    Args:
+        plan (src.common.frequency.frequency_plan.FrequencyPlan): The plan of the sweep.
+
+    Returns:
+        numpy.ndarray of numpy.float32: One row per frequency, with a noisy sine of voltage followed by a noisy,
+            phase-shifted sine of current, both at the frequency's number of samples per period.
+
+    """
+    rng = np.random.RandomState(SEED)
+    k = N_SAMPLES * N_PERIODS
+    rows = []
+
+    for spp in plan.samples_per_period:
+        phase = 2 * np.pi * np.arange(k) / spp
+        voltage = 0.01 * np.sin(phase) + 1e-4 * rng.randn(k)
+        current = 1e-4 * np.sin(phase - 0.3) + 1e-6 * rng.randn(k)
+        rows.append(np.concatenate((voltage, current)))
+
+    return np.array(rows, dtype=np.float32)
+
+
+def get_sweep(n_freqs):
+    """Build a complete sweep.
+
+    Args:
+        n_freqs (int): The number of frequencies.
+
+    Returns:
+        src.common.data_structures.sweep.Sweep: The sweep, with one data set per frequency.
+
+    """
+    plan = get_plan(n_freqs)
+    sweep = Sweep(plan, N_SAMPLES, N_PERIODS)
+    start = datetime.datetime(2017, 1, 1)
+
+    for i, data_set in enumerate(get_data_sets(plan)):
+        sweep = sweep.append(start + datetime.timedelta(seconds=i), data_set.tolist())
+
+    return sweep
+
+
+def get_transfer(n_values):
+    """Encode values the way the device sends them over USB.
+
+    Args:
+        n_values (int): The number of values.
+
+    Returns:
+        bytearray: The values as little-endian IEEE 754 single-precision floats.
+
+    """
+    values = np.random.RandomState(SEED).uniform(-1, 1, n_values)
+
+    return bytearray(struct.pack('<%if' % n_values, *values))
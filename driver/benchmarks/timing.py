@@ -0,0 +1,32 @@
+"""Benchmark timing utilities.
+
+Shared by every benchmark in this directory, so that all of them measure time the same way: the best of `REPEAT`
+measurements, which is the least disturbed by whatever else the machine is doing.
+
+.. _benchmarks-timing:
+    https://github.com/hivebattery/gui/blob/master/driver/benchmarks/timing.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import timeit
+
+REPEAT = 3
+"""int: The number of times each measurement is repeated, keeping the best one.
+"""
+
+
+def best_time(fn, number=1, repeat=REPEAT):
+    """Time a function.
+
+    Args:
+        fn (() -> Any): The function to time.
+        number (int, optional): The number of calls per measurement. Default is 1.
+        repeat (int, optional): The number of measurements. Default is `REPEAT`.
+
+    Returns:
+        float: The best time per call, in seconds.
+
+    """
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
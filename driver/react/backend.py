@@ -0,0 +1,124 @@
+"""React widget backends.
+
+A backend creates the objects that React's widgets wrap: Tkinter widgets and variables, the root, matplotlib's figure
+canvas, and the file dialogs. By default, React uses `TkBackend`, i.e. real Tkinter widgets. Any other backend
+must provide the same methods, and be set with `set_backend` before the root is created, e.g. the recording fake
+defined in `react.fake_backend`, which needs no display.
+
+Example:
+::
+    import react.index as react
+    from react.fake_backend import FakeBackend
+
+    backend = FakeBackend()
+    react.set_backend(backend)
+    ...  #: Create the GUI as usual
+    backend.root.run(1000)  #: Run the callbacks scheduled over the first second
+    print backend.calls
+
+.. _React Library:
+    https://github.com/hivebattery/gui/blob/master/driver/react/backend.py
+
+"""
+from __future__ import absolute_import
+
+import Tkinter as tk
+from tkFileDialog import askdirectory, askopenfilename
+import matplotlib
+
+matplotlib.use('TkAgg')
+matplotlib.rcParams.update({'figure.autolayout': True})
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+class TkBackend(object):
+    """Tkinter Backend.
+
+    Creates real Tkinter widgets.
+
+    """
+    @staticmethod
+    def widget(name):
+        """Get a widget class.
+
+        Args:
+            name (str): The name of the Tkinter class e.g. 'Label', 'StringVar', 'Menu', or 'Tk' for the root.
+
+        Returns:
+            type: The Tkinter class, whose constructor takes the master as its first argument (except for the root
+                and variables) and the options as keyword arguments.
+
+        """
+        return getattr(tk, name)
+
+    @staticmethod
+    def figure_canvas(figure, master):
+        """Create a canvas that displays a matplotlib figure.
+
+        Args:
+            figure (matplotlib.figure.Figure): The figure.
+            master (Tkinter.Widget): The master of the canvas.
+
+        Returns:
+            matplotlib.backends.backend_tkagg.FigureCanvasTkAgg: The canvas, whose `get_tk_widget` is the widget to
+                display.
+
+        """
+        return FigureCanvasTkAgg(figure, master=master)
+
+    @staticmethod
+    def ask_directory(**kwargs):
+        """Ask the user to choose a directory.
+
+        Args:
+            **kwargs: The options of `tkFileDialog.askdirectory`.
+
+        Returns:
+            str: The directory, or an empty string if the user canceled.
+
+        """
+        return askdirectory(**kwargs)
+
+    @staticmethod
+    def ask_open_filename(**kwargs):
+        """Ask the user to choose a file to open.
+
+        Args:
+            **kwargs: The options of `tkFileDialog.askopenfilename`.
+
+        Returns:
+            str: The path of the file, or an empty string if the user canceled.
+
+        """
+        return askopenfilename(**kwargs)
+
+
+_backend = TkBackend()
+"""TkBackend: The backend every widget is created with.
+"""
+
+
+def get_backend():
+    """`_backend` getter.
+
+    Returns:
+        The current backend.
+
+    """
+    return _backend
+
+
+def set_backend(backend):
+    """`_backend` setter.
+
+    Note:
+        Widgets that already exist keep the backend they were created with, so the backend should be set before the
+        root is created.
+
+    Args:
+        backend: The new backend, with the same methods as `TkBackend`.
+
+    """
+    global _backend
+    _backend = backend
@@ -1,7 +1,7 @@
 """React components.
 
-This is the "interface" that all components will implement. The three special public methods,
-render, component_will_receive_props, and component_will_mount, are meant to be overridden by the
+This is the "interface" that all components will implement. The four special public methods,
+render, component_will_receive_props, component_will_mount, and component_will_unmount, are meant to be overridden by the
 component that implements this interface, otherwise nothing might be displayed since the methods defined
 in this class are nothing more than placeholders. You can find concrete examples in the actual Component
 class definition.
@@ -10,7 +10,7 @@ Todo:
     * Find a better way to handle component identification and comparison.
     * Pass props when calling `component_will_mount`.
     * Make sure the DoublyLinkedList is actually necessary to implement this `React` behavior.
-    * Make sure the `wrapper` operation flow and precedence  is in line with real `React` (this could
+    * Make sure the `render_wrapper` operation flow and precedence  is in line with real `React` (this could
         potentially lead to non-React behavior that's difficult to debug)
     * Verify if letting the user decide exactly when to pass props is a bad idea.
 
@@ -27,6 +27,7 @@ import numpy as np
 from .data_structures.doubly_linked_list import DoublyLinkedList
 from .redux.index import *
 from .config import config
+from . import profiler
 
 _id = 0
 """int
@@ -60,7 +61,8 @@ def connect_reducer(component, actions, props):
     redux props at the end of this method.
 
     Note:
-        See `react.redux.index` to understand `set_reducers_to_default`
+        The props mapped from the reducers' state are passed once the component subscribes to the store (see
+        `react.redux.store`).
 
     Args:
         component (Component): The component to connect the actions with.
@@ -80,7 +82,6 @@ def connect_reducer(component, actions, props):
         combined_props[reducer_name] = NamedTuple(reducer_props, reducer_name + 'props')
 
     component.props = NamedTuple(combined_props, 'props')
-    set_reducers_to_default(component, actions.keys())
 
     return component.props
 
@@ -102,26 +103,24 @@ def get_component_id():
     return curr_id
 
 
-def wrapper(method):
-    """Executes before calling methods of the Component class.
+def render_wrapper(method):
+    """Wraps the `render` method of a Component class.
 
     This is where most of the `React` behavior setup takes place behind the scenes.
 
     Args:
-        method (() -> Any): The method currently being wrapped
+        method (() -> Any): The `render` method being wrapped.
 
     Returns:
-        Whatever the original wrapped method would have returned
+        (() -> Any): The wrapped method.
 
     """
     @wraps(method)
     def wrapped(*args, **kwargs):
         """The actual wrapper function.
 
-        After evaluating certain conditions, this method takes care of any preparation or
-        operation needed by a general purpose React Component. When the `render` method is called on a
-        specific `Component`, certain operations happen in the following order, where steps 1-2 are
-        pre-rendering operations and steps 4- involve post-rendering operations:
+        When the `render` method is called on a specific `Component`, certain operations happen in the following
+        order, where steps 1-2 are pre-rendering operations and steps 4- involve post-rendering operations:
 
             1) Call `component_will_mount` on the component iff the component is hidden
             2) If the component has a parent `Component` i.e. if the component is not Root, acknowledge the
@@ -137,11 +136,8 @@ def wrapper(method):
                 and HC to R \ HC, thus preparing components and widgets to be rendered or hidden.
             5) Hide all widgets in HW and components in HC.
 
-        On the other hand, if the `component_will_receive_props` method is called on a specific `Component`,
-        this wrapper allows the user to explicitly decide exactly when the component's parent should pass it
-        its respective props by calling `ready_props` from within the `component_will_receive_props` overridden method
-        (if the user does not call `ready_props`, this happens automatically after calling
-        `component_will_receive_props`).
+        If `config['profile']` is truthy, the render is also recorded by `react.profiler`, and if `config['trace']` is
+        set, it's traced.
 
         Args:
             *args: Variable length argument list for the method being wrapped, where `args[0]` is always
@@ -149,20 +145,23 @@ def wrapper(method):
             **kwargs: Arbitrary keyword arguments
 
         Returns:
-            FunctionType: The wrapped method or the original method depending on the specific behavior
-            desired.
+            Whatever the original `render` method returns.
 
         """
         self = args[0]
-        func_name = method.__name__
+        profile = config['profile']
+        trace = config['trace']
 
-        if config['log'] == 2:
-            print func_name, args, kwargs
+        if trace is not None:
+            trace("render %r %r", args, kwargs)
 
-        if func_name == 'render':  #: wrap `render` method
             if not hasattr(self, 'never_rendered'):
-                print self
+                trace("first render of %s", self)
 
+        if profile:
+            start = profiler.start_render()
+
+        try:
             if self.hidden or (hasattr(self, 'never_rendered') and self.never_rendered):  #: step 1
                 if hasattr(self, 'never_rendered') and self.never_rendered:
                     self.never_rendered = False
@@ -172,10 +171,11 @@ def wrapper(method):
             self.hidden = False
 
             self.renders.clear()  #: step 2
+            self.render_ids.clear()
             self.widget_renders.clear()
 
             if self.parent is not None:  #: if not Root component
-                self.parent.renders.insert(self)
+                self.parent.add_render(self)
 
             res = method(*args, **kwargs)  #: step 3: calling `render`
 
@@ -190,36 +190,100 @@ def wrapper(method):
 
             for hidden_child in hidden_widgets:  #: step 5
                 if hidden_child.id != 0:
-                    hidden_child.pack_forget()
-                    hidden_child.place_forget()
-                    hidden_child.grid_forget()
+                    hidden_child.forget()
 
             for hidden_child in hidden_components:
                 if not hidden_child.hidden:
                     hidden_child.forget()
+        finally:
+            if profile:  #: even if `render` raised, so that the renders around it are still timed right
+                profiler.end_render(self, start)
+
+        return res
+
+    return wrapped
+
+
+def receive_props_wrapper(method):
+    """Wraps the `component_will_receive_props` method of a Component class.
+
+    This wrapper allows the user to explicitly decide exactly when the component's parent should pass it its
+    respective props by calling `ready_props` from within the `component_will_receive_props` overridden method (if the
+    user does not call `ready_props`, this happens automatically after calling `component_will_receive_props`).
+
+    If `config['profile']` is truthy, the prop keys that triggered the update are also recorded by `react.profiler`, and
+    if `config['trace']` is set, the update is traced.
+
+    Args:
+        method ((react.data_structures.named_tuple.NamedTuple) -> Any): The method being wrapped.
+
+    Returns:
+        ((react.data_structures.named_tuple.NamedTuple) -> Any): The wrapped method.
+
+    """
+    @wraps(method)
+    def wrapped(self, props):
+        trace = config['trace']
 
-            return res
+        if trace is not None:
+            trace("component_will_receive_props %s %r", self, props)
 
-        if func_name == 'component_will_receive_props':
-            self.props_pending = True
-            res = method(*args, **kwargs)
+        if config['profile']:
+            profiler.record_update(self, props._fields)
 
-            if self.props_pending:
-                self.ready_props(args[1])
+        self.props_pending = True
+        res = method(self, props)
 
-            return res
+        if self.props_pending:
+            self.ready_props(props)
 
-        return method(*args, **kwargs)
+        return res
 
     return wrapped
 
 
+def pass_props_wrapper(method):
+    """Wraps the `pass_props` method of a Component class.
+
+    The props propagation time is recorded by `react.profiler` iff `config['profile']` is truthy.
+
+    Args:
+        method ((dict) -> None): The method being wrapped.
+
+    Returns:
+        ((dict) -> None): The wrapped method.
+
+    """
+    @wraps(method)
+    def wrapped(self, state):
+        if not config['profile']:
+            return method(self, state)
+
+        start = profiler.clock()
+        res = method(self, state)
+        profiler.record_propagation(self, profiler.clock() - start)
+
+        return res
+
+    return wrapped
+
+
+_LIFECYCLE_WRAPPERS = dict(render=render_wrapper, component_will_receive_props=receive_props_wrapper,
+                           pass_props=pass_props_wrapper)
+"""dict of str: ((FunctionType) -> FunctionType): The only methods of a Component class that get wrapped, together
+with the function that builds each one's wrapper.
+"""
+
+
 class MetaClass(type):
     """The meta class that wraps React Components.
 
     """
     def __new__(mcs, class_name, bases, class_dict):
-        """ Connects Components with the `wrapper` method.
+        """ Connects Components with their lifecycle wrappers.
+
+        Only the methods listed in `_LIFECYCLE_WRAPPERS` get wrapped, and each one gets a wrapper specialized for it
+        when the class is created; all other methods are left untouched.
 
         Args:
             class_name (str): The name of the class to be wrapped i.e. 'Component'.
@@ -232,8 +296,8 @@ class MetaClass(type):
         """
         new_class_dict = {}
         for attributeName, attribute in class_dict.items():
-            if isinstance(attribute, FunctionType):
-                attribute = wrapper(attribute)
+            if isinstance(attribute, FunctionType) and attributeName in _LIFECYCLE_WRAPPERS:
+                attribute = _LIFECYCLE_WRAPPERS[attributeName](attribute)
             new_class_dict[attributeName] = attribute
         return type.__new__(mcs, class_name, bases, new_class_dict)
 
@@ -300,6 +364,7 @@ class Component(MetaClass('Component', (object,), {})):
             widgets contained in the current component.
         renders (react.data_structures.doubly_linked_list.DoublyLinkedList of Component): A subset of `self.children`
             that contains the components to be rendered.
+        render_ids (set of int): The ids of the components in `self.renders`, for constant time lookups.
         widget_renders (react.data_structures.doubly_linked_list.DoublyLinkedList of Tkinter.Widget): A subset of
             `self.widgets` that contains the widgets to be rendered.
         state (dict): A mapping of the component's state keys and values
@@ -307,7 +372,8 @@ class Component(MetaClass('Component', (object,), {})):
         height (float): The component's height (rounded to the closest int). None means default height.
         x (float): The component's horizontal offset. Default is 0.
         y (float): The component's vertical offset. Default is 0.
-        props (tuple): This component's props (both by reducers and by the parent)
+        props (tuple): This component's props (both by reducers and by the parent). Their keys are indexed by the
+            parent so that `pass_props` only visits the children that consume the keys being passed.
         map_state_to_props ((tuple) -> dict): Indicates how to map the responses generated by the reducers to props for
             this given component (to self.props).
 
@@ -323,8 +389,8 @@ class Component(MetaClass('Component', (object,), {})):
             height (float, optional): `self.height`. Default is None, which means default height.
             x (float, optional): `self.x`. Default is None, which means 0.
             y (float, optional): `self.y` Default is None, which means 0.
-            map_state_to_props ((tuple) -> dict, optional): `self.map_state_to_props`. Default is None, which implies no
-                actions will be reduced.
+            map_state_to_props ((tuple) -> dict, optional): `self.map_state_to_props`. If given, the component
+                subscribes to the store. Default is None, which implies no props will be mapped from the reducers.
             actions (dict of str: (dict of str: ((tuple) -> dict)), optional): Contains a dict for each reducer, which
                 in turn contains that reducer's actions. Default is None, which implies no actions will be imported.
             root_reducer (:obj:`Reducer`, optional):  `self.root_reducer`. Default is None, which means no root reducer.
@@ -336,12 +402,16 @@ class Component(MetaClass('Component', (object,), {})):
         self.children = DoublyLinkedList()
         self.widgets = DoublyLinkedList()
         self.renders = DoublyLinkedList()
+        self.render_ids = set()
         self.widget_renders = DoublyLinkedList()
         self.width = None if width is None else int(np.round(width))
         self.height = None if height is None else int(np.round(height))
         self.x = None if x is None else int(np.round(x))
         self.y = None if y is None else int(np.round(y))
 
+        self.__subscribers = {}
+        self.__subscriptions = {}
+        self.__props = None
         self.__parent = parent
         self.parent = self.__parent
         self.__state = None
@@ -356,6 +426,9 @@ class Component(MetaClass('Component', (object,), {})):
         self.never_rendered = True
         self.props_pending = False
 
+        if map_state_to_props is not None:
+            subscribe(self, map_state_to_props)
+
     def __eq__(self, other):
         """Check for Component equality.
 
@@ -380,6 +453,18 @@ class Component(MetaClass('Component', (object,), {})):
         if value is not None:  #: add this component as a child
             value.add_child(self)
 
+    @property
+    def props(self):
+        """react.data_structures.named_tuple.NamedTuple: This component's props"""
+        return self.__props
+
+    @props.setter
+    def props(self, value):
+        self.__props = value
+
+        if self.parent is not None and value is not None:  #: keep the parent's index up to date
+            self.parent.index_props(self)
+
     @property
     def state(self):
         """dict: A mapping of the component's state keys and values"""
@@ -410,6 +495,56 @@ class Component(MetaClass('Component', (object,), {})):
         """
         self.children.insert(child)
 
+    def remove_child(self, child):
+        """Stop containing a child component.
+
+        Args:
+            child (Component): This component will no longer be a child of this component.
+
+        """
+        self.children.remove(child)
+        self.renders.remove(child)
+        self.render_ids.discard(child.id)
+
+        for key in self.__subscriptions.pop(child.id, ()):
+            del self.__subscribers[key][child.id]
+
+            if not len(self.__subscribers[key]):
+                del self.__subscribers[key]
+
+    def add_render(self, child):
+        """Acknowledge that a child component is being rendered.
+
+        Args:
+            child (Component): This component will be added to `self.renders`.
+
+        """
+        self.renders.insert(child)
+        self.render_ids.add(child.id)
+
+    def index_props(self, child):
+        """Subscribe a child component to the keys of its props.
+
+        Gets called every time the child's props are set, but the index is only updated when the child's prop keys
+        actually change.
+
+        Args:
+            child (Component): The child whose prop keys will be indexed.
+
+        """
+        keys = child.props._fields
+
+        if self.__subscriptions.get(child.id) == keys:
+            return
+
+        for key in self.__subscriptions.get(child.id, ()):
+            del self.__subscribers[key][child.id]
+
+        for key in keys:
+            self.__subscribers.setdefault(key, {})[child.id] = child
+
+        self.__subscriptions[child.id] = keys
+
     def ready_props(self, props):
         """Finalize passing props to child.
 
@@ -446,7 +581,7 @@ class Component(MetaClass('Component', (object,), {})):
         existing_props = {}
 
         for prop_name, prop in state.items():  #: step 1
-            if prop_name not in props_dict.keys():
+            if prop_name not in props_dict:
                 new_props[prop_name] = prop
             else:
                 existing_props[prop_name] = prop
@@ -480,24 +615,26 @@ class Component(MetaClass('Component', (object,), {})):
         We can now assume that all descendants of A will not be interested in the new props either because
         the chain is broken, and there is no connection left to those props.
 
+        Only the rendered children subscribed to the keys in `state` (see `index_props`) are visited, in the order in
+        which they were created, so the cost of passing props doesn't depend on the size of the tree.
+
         Args:
             state (dict): Updated state of props.
 
         """
-        for child in self.renders:
-            assert isinstance(child, Component)
-            props = {}
-            old_props = child.props._asdict()
+        affected = {}
 
-            for key, val in state.items():  #: check for only NEW props
-                if key in old_props.keys():
-                    props[key] = val
+        for key, val in state.items():
+            for child_id, child in self.__subscribers.get(key, {}).items():
+                if child_id in self.render_ids:
+                    affected.setdefault(child_id, (child, {}))[1][key] = val
 
-            if len(props) > 0:  #: otherwise, terminate the recursion
-                child.component_will_receive_props(NamedTuple(props, 'props'))
+        for child_id in sorted(affected.keys()):
+            child, props = affected[child_id]
+            child.component_will_receive_props(NamedTuple(props, 'props'))
 
-                if not child.children.is_empty():
-                    child.pass_props(props)
+            if not child.children.is_empty():
+                child.pass_props(props)
 
     def set_state(self, state):
         """Update component's state.
@@ -526,16 +663,42 @@ class Component(MetaClass('Component', (object,), {})):
     def forget(self):
         """Hide all the widgets in this component's.
 
-        Loops over the `DoublyLinkedList` of widgets in this components and hides them according
-        to Tkinter's spec.
+        Loops over the `DoublyLinkedList` of widgets in this components and hides them with the `forget` method of
+        the geometry manager that displays each one of them.
 
         """
         self.hidden = True
 
         for widget in self.widgets:
-            widget.pack_forget()
-            widget.place_forget()
-            widget.grid_forget()
+            widget.forget()
+
+    def unmount(self):
+        """Tear down the component for good.
+
+        Use this method to dispose of components that are created and destroyed over time e.g. dialogs or
+        per-device panels. These operations happen in the following order:
+
+            1) Unmount all children, depth first.
+            2) Call `component_will_unmount` so that the component can release any resources of its own.
+            3) Destroy all widgets contained in this component, which also unregisters them from
+                `react.widget_wrappers`.
+            4) Detach the component from its parent and the store so that nothing references it anymore.
+
+        """
+        for child in self.children.__copy__():  #: step 1
+            child.unmount()
+
+        self.component_will_unmount()  #: step 2
+
+        for widget in self.widgets.__copy__():  #: step 3
+            widget.destroy()
+
+        self.hidden = True
+
+        unsubscribe(self)  #: step 4
+
+        if self.parent is not None:
+            self.parent.remove_child(self)
 
     def component_will_receive_props(self, props):
         """The component's props are about to be updated.
@@ -558,3 +721,12 @@ class Component(MetaClass('Component', (object,), {})):
 
         """
         pass
+
+    def component_will_unmount(self):
+        """The component is about to be destroyed.
+
+        This method gets called by `unmount` before the component's widgets are destroyed, and should be overridden by
+        another class that extends this class to release timers, event handlers, or any other resources.
+
+        """
+        pass
@@ -8,7 +8,8 @@ by using the getter and setter functions defined in `react.index`.
 
 """
 config = {
-    "log": None,
+    "trace": None,
+    "profile": False,
     "def_width": 1000,
     "def_height": 618,
 }
@@ -16,4 +17,8 @@ config = {
 
 React's configuration properties. These are the only properties that are fully implemented by the `__Gui_Controller`,
 so adding new properties would have no effect unless `react.index` is modified to reflect these new changes.
+
+`trace` is either None or a function that takes a format string and its arguments, which is called with debugging
+information about renders, props updates, and widget creation. It's called from React's hot paths, so it should be
+cheap, e.g. it should defer formatting the message.
 """
\ No newline at end of file
@@ -200,6 +200,7 @@ class DoublyLinkedList(object):
         while not self.__is_sentinel(node):
             if node.value == val:
                 node.splice_out()
+                self.__size -= 1
                 return True
 
             node = node.prev
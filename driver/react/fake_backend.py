@@ -0,0 +1,570 @@
+"""Recording fake of the Tkinter backend.
+
+A backend (see `react.backend`) whose widgets need no display: they keep their options, geometry manager, text, items
+and values in memory, and count every call React makes to them, so that the component tree can be built, rendered and
+updated headlessly e.g. to test it, or to benchmark how many Tkinter calls and render passes an update costs.
+
+Time is virtual: the root's `after` callbacks only run when `FakeRoot.run` advances the clock, and `mainloop` returns
+right away. Figures are still drawn, with matplotlib's Agg renderer, so that plotting costs what it costs with Tkinter
+minus blitting the image to the screen.
+
+Example:
+::
+    import react.index as react
+    from react.fake_backend import FakeBackend
+
+    backend = FakeBackend()
+    react.set_backend(backend)
+    app = GUI()  #: Builds the tree and returns from `mainloop` right away
+    backend.reset()
+    get_store().dispatch(...)
+    backend.root.run()  #: Runs the dispatch and the renders it triggers
+    print backend.total, backend.calls.most_common(5)
+
+.. _React Library:
+    https://github.com/hivebattery/gui/blob/master/driver/react/fake_backend.py
+
+"""
+from __future__ import absolute_import
+
+import heapq
+import itertools
+from collections import Counter
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+LIST_WIDGETS = ('Listbox',)
+"""tuple of str: The widgets whose `insert`, `delete` and `get` work on a list of items rather than on a string.
+"""
+VALUE_WIDGETS = ('Scale', 'Scrollbar')
+"""tuple of str: The widgets whose `get` and `set` work on a value.
+"""
+
+
+class FakeWidget(object):
+    """Fake Tkinter widget.
+
+    Calls to methods that aren't defined here, e.g. `bind` or `see`, are counted and otherwise ignored.
+
+    Attributes:
+        _backend (FakeBackend): The backend that counts the calls, set on the class by `FakeBackend.widget`.
+        master (FakeWidget): The master of the widget, or None for the root.
+        options (dict): The configuration options.
+        manager ((str, dict)): The geometry manager that displays the widget and its options, or None if it's hidden.
+        items (list): The items of a `Listbox`.
+        value: The value of a `Scale` or a `Scrollbar`.
+        destroyed (bool): True once the widget has been destroyed.
+        __text (str): The text of an `Entry` without a `textvariable`.
+        __path (str): The Tkinter path name of the widget.
+
+    """
+    _backend = None
+    _ids = itertools.count(1)
+
+    def __init__(self, master=None, cnf=None, **options):
+        """FakeWidget constructor.
+
+        Args:
+            master (FakeWidget, optional): `self.master`. Default is None.
+            cnf (dict, optional): Options, as Tkinter accepts them. Default is None.
+            **options: `self.options`.
+
+        """
+        self.master = master
+        self.options = dict(cnf or {}, **options)
+        self.manager = None
+        self.items = []
+        self.value = self.options.get('from_', 0)
+        self.destroyed = False
+        self.__text = ''
+
+        parent_path = '' if master is None or str(master) == '.' else str(master)
+        self.__path = '%s.!%s%i' % (parent_path, self.widget_name.lower(), next(FakeWidget._ids))
+
+        self._record('__init__')
+
+    def __str__(self):
+        return self.__path
+
+    def __getattr__(self, item):
+        """Count and ignore calls to the Tkinter methods that aren't faked.
+
+        Args:
+            item (str): The name of the method.
+
+        Returns:
+            (*args, **kwargs) -> None: A method that counts its calls.
+
+        Raises:
+            AttributeError: If `item` is private, so that `hasattr` keeps working for private attributes.
+
+        """
+        if item.startswith('_'):
+            raise AttributeError(item)
+
+        def method(*args, **kwargs):
+            self._record(item)
+
+        return method
+
+    @property
+    def widget_name(self):
+        """str: The name of the Tkinter class this widget fakes e.g. 'Label'."""
+        return self.__class__.__name__
+
+    def _record(self, method):
+        """Count a call.
+
+        Args:
+            method (str): The name of the method called.
+
+        """
+        self._backend.record(self.widget_name, method)
+
+    def __manage(self, manager, options):
+        self._record(manager)
+        self.manager = (manager, options)
+
+    def pack(self, **options):
+        self.__manage('pack', options)
+
+    def place(self, **options):
+        self.__manage('place', options)
+
+    def grid(self, **options):
+        self.__manage('grid', options)
+
+    def pack_forget(self):
+        self._record('pack_forget')
+        self.manager = None
+
+    def place_forget(self):
+        self._record('place_forget')
+        self.manager = None
+
+    def grid_forget(self):
+        self._record('grid_forget')
+        self.manager = None
+
+    def config(self, cnf=None, **options):
+        """Set options, or query them.
+
+        Returns:
+            dict: A copy of `self.options` if no option is set, None otherwise.
+
+        """
+        self._record('config')
+
+        if cnf is None and not options:
+            return dict(self.options)
+
+        if isinstance(cnf, basestring):
+            return self.options.get(cnf)
+
+        self.options.update(cnf or {}, **options)
+
+    configure = config
+
+    def cget(self, key):
+        self._record('cget')
+
+        return self.options.get(key)
+
+    def keys(self):
+        return self.options.keys()
+
+    def get(self, first=None, last=None):
+        """Get the text of an `Entry`, the items of a `Listbox`, or the value of a `Scale` or a `Scrollbar`.
+
+        Args:
+            first (int, optional): The index of the first item of a `Listbox`. Default is None, which means all items.
+            last (int, optional): The index of the last item, included. Default is None, which means only `first`.
+
+        """
+        self._record('get')
+
+        if self.widget_name in VALUE_WIDGETS:
+            return self.value
+
+        if self.widget_name in LIST_WIDGETS:
+            if first is None:
+                return tuple(self.items)
+
+            first, last = self.__index(first), None if last is None else self.__index(last)
+
+            return self.items[first] if last is None else tuple(self.items[first:last + 1])
+
+        return self.__get_text()
+
+    def set(self, *args):
+        self._record('set')
+        self.value = args[0] if len(args) == 1 else args
+
+    def insert(self, index, *elements):
+        """Insert items into a `Listbox`, or text into an `Entry`.
+
+        Args:
+            index (int, str): Where to insert, e.g. 0 or 'end'.
+            *elements: The items, or the strings to concatenate.
+
+        """
+        self._record('insert')
+
+        if self.widget_name in LIST_WIDGETS:
+            i = self.__index(index)
+            self.items[i:i] = elements
+        else:
+            text = self.__get_text()
+            i = len(text) if index == 'end' else int(index)
+            self.__set_text(text[:i] + ''.join(str(element) for element in elements) + text[i:])
+
+    def delete(self, first, last=None):
+        """Delete items from a `Listbox`, or text from an `Entry`.
+
+        Args:
+            first (int, str): The index of the first item or character deleted.
+            last (int, str, optional): The index of the last item deleted (included), or of the character after the
+                last deleted (excluded). Default is None, which means only `first`.
+
+        """
+        self._record('delete')
+
+        if self.widget_name in LIST_WIDGETS:
+            i = self.__index(first)
+            j = i if last is None else self.__index(last)
+            del self.items[i:j + 1]
+        else:
+            text = self.__get_text()
+            i = len(text) if first == 'end' else int(first)
+            j = i + 1 if last is None else len(text) if last == 'end' else int(last)
+            self.__set_text(text[:i] + text[j:])
+
+    def size(self):
+        self._record('size')
+
+        return len(self.items)
+
+    def destroy(self):
+        self._record('destroy')
+        self.destroyed = True
+
+    def __index(self, index):
+        return len(self.items) if index == 'end' else int(index)
+
+    def __get_text(self):
+        variable = self.options.get('textvariable')
+
+        return self.__text if variable is None else str(variable.get())
+
+    def __set_text(self, text):
+        variable = self.options.get('textvariable')
+
+        if variable is None:
+            self.__text = text
+        else:
+            variable.set(text)
+
+
+class FakeVariable(object):
+    """Fake `Tkinter.StringVar` or `Tkinter.IntVar`.
+
+    Attributes:
+        _backend (FakeBackend): The backend that counts the calls, set on the class by `FakeBackend.widget`.
+        __value: The value.
+        __traces (list of (str, (str, str, str) -> None)): The mode and callback of every trace.
+
+    """
+    _backend = None
+
+    def __init__(self, master=None, value=None, name=None):
+        """FakeVariable constructor.
+
+        Args:
+            master: Ignored, as by Tkinter when there is a root.
+            value (str, int, optional): The initial value. Default is None, which means '' or 0, like Tkinter.
+            name: Ignored.
+
+        """
+        self.__value = value if value is not None else 0 if self.__class__.__name__ == 'IntVar' else ''
+        self.__traces = []
+
+        self._backend.record(self.__class__.__name__, '__init__')
+
+    def get(self):
+        self._backend.record(self.__class__.__name__, 'get')
+
+        return self.__value
+
+    def set(self, value):
+        """Set the value and call the write traces, as Tkinter does."""
+        self._backend.record(self.__class__.__name__, 'set')
+        self.__value = value
+
+        for mode, callback in list(self.__traces):
+            if 'w' in mode:
+                callback(str(id(self)), '', 'w')
+
+    def trace_variable(self, mode, callback):
+        """Call a function whenever the variable is accessed.
+
+        Args:
+            mode (str): 'w' for writes (reads and deletions are never traced).
+            callback ((str, str, str) -> None): The function, called with the name of the variable, an empty index
+                and the mode.
+
+        Returns:
+            str: The name of the trace.
+
+        """
+        self._backend.record(self.__class__.__name__, 'trace_variable')
+        self.__traces.append((mode, callback))
+
+        return str(len(self.__traces))
+
+    trace = trace_variable
+
+
+class FakeRoot(FakeWidget):
+    """Fake `Tkinter.Tk`, with a virtual clock.
+
+    Attributes:
+        now (int): The virtual time, in milliseconds.
+        __timers (list of (int, int, str)): The heap of scheduled callbacks, by due time and scheduling order, with
+            their ids.
+        __callbacks (dict of str: () -> None): The scheduled callbacks that haven't run nor been canceled, by id.
+        __ids (itertools.count): Numbers the scheduled callbacks.
+
+    """
+    def __init__(self, *args, **kwargs):
+        """FakeRoot constructor, which ignores Tkinter's arguments e.g. `screenName`."""
+        super(FakeRoot, self).__init__()
+
+        self.now = 0
+        self.__timers = []
+        self.__callbacks = {}
+        self.__ids = itertools.count()
+
+        self._backend.root = self
+
+    def __str__(self):
+        return '.'
+
+    @property
+    def pending(self):
+        """int: The number of scheduled callbacks that haven't run nor been canceled."""
+        return len(self.__callbacks)
+
+    def after(self, ms, func=None, *args):
+        """Schedule a callback.
+
+        Args:
+            ms (int): The delay, in milliseconds of virtual time.
+            func ((*args) -> None, optional): The callback. Default is None, which only counts the call (Tkinter would
+                sleep).
+            *args: The arguments of the callback.
+
+        Returns:
+            str: The id of the callback, for `after_cancel`.
+
+        """
+        self._record('after')
+
+        if func is None:
+            return None
+
+        n = next(self.__ids)
+        timer_id = 'after#%i' % n
+        self.__callbacks[timer_id] = lambda: func(*args)
+        heapq.heappush(self.__timers, (self.now + int(ms), n, timer_id))
+
+        return timer_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, timer_id):
+        self._record('after_cancel')
+        self.__callbacks.pop(timer_id, None)
+
+    def clear(self):
+        """Cancel every scheduled callback e.g. the timers an app starts, to drive it with synthetic updates only."""
+        self.__timers = []
+        self.__callbacks.clear()
+
+    def winfo_screenwidth(self):
+        self._record('winfo_screenwidth')
+
+        return self._backend.screen[0]
+
+    def winfo_screenheight(self):
+        self._record('winfo_screenheight')
+
+        return self._backend.screen[1]
+
+    def mainloop(self, n=0):
+        """Return right away: callbacks only run when `run` is called."""
+        self._record('mainloop')
+
+    def run(self, ms=0):
+        """Advance the virtual clock, running every callback that's due, including the ones they schedule.
+
+        Args:
+            ms (int, optional): How far to advance the clock, in milliseconds. Default is 0, which runs only the
+                callbacks due now, e.g. the ones scheduled with `after_idle`.
+
+        Returns:
+            int: The number of callbacks run.
+
+        """
+        deadline = self.now + ms
+        n_run = 0
+
+        while self.__timers and self.__timers[0][0] <= deadline:
+            due, _, timer_id = heapq.heappop(self.__timers)
+            callback = self.__callbacks.pop(timer_id, None)
+
+            if callback is not None:
+                self.now = due
+                callback()
+                n_run += 1
+
+        self.now = deadline
+
+        return n_run
+
+    def update(self):
+        self._record('update')
+        self.run()
+
+    def update_idletasks(self):
+        self._record('update_idletasks')
+        self.run()
+
+
+class FakeFigureCanvas(object):
+    """Fake `FigureCanvasTkAgg`, which draws the figure with matplotlib's Agg renderer.
+
+    Attributes:
+        __backend (FakeBackend): The backend that counts the calls.
+        __canvas (matplotlib.backends.backend_agg.FigureCanvasAgg): The canvas the figure is drawn on.
+        __widget (FakeWidget): The fake `Tkinter.Canvas` that displays the figure.
+
+    """
+    def __init__(self, backend, figure, master):
+        """FakeFigureCanvas constructor.
+
+        Args:
+            backend (FakeBackend): `self.__backend`.
+            figure (matplotlib.figure.Figure): The figure to draw.
+            master (FakeWidget): The master of the fake `Tkinter.Canvas`.
+
+        """
+        self.__backend = backend
+        self.__canvas = FigureCanvasAgg(figure)
+        self.__widget = backend.widget('Canvas')(master)
+
+    def __getattr__(self, item):
+        return getattr(self.__canvas, item)
+
+    def get_tk_widget(self):
+        return self.__widget
+
+    def draw(self):
+        self.__backend.record('FigureCanvas', 'draw')
+        self.__canvas.draw()
+
+    show = draw
+
+
+class FakeBackend(object):
+    """Recording fake of `react.backend.TkBackend`.
+
+    Attributes:
+        root (FakeRoot): The root, once created.
+        screen ((int, int)): The screen's width and height, in pixels.
+        directory (str): What `ask_directory` answers, where an empty string means the user canceled.
+        filename (str): What `ask_open_filename` answers, where an empty string means the user canceled.
+        __calls (collections.Counter of (str, str): int): The number of calls to each method of each Tkinter class.
+        __classes (dict of str: type): The fake class of each Tkinter class created so far.
+
+    """
+    def __init__(self, screen=(1920, 1080), directory='', filename=''):
+        """FakeBackend constructor.
+
+        Switches matplotlib to the Agg backend, so that figures don't need a display either.
+
+        Args:
+            screen ((int, int), optional): `self.screen`. Default is (1920, 1080).
+            directory (str, optional): `self.directory`. Default is '', i.e. canceled.
+            filename (str, optional): `self.filename`. Default is '', i.e. canceled.
+
+        """
+        plt.switch_backend('agg')
+
+        self.root = None
+        self.screen = screen
+        self.directory = directory
+        self.filename = filename
+        self.__calls = Counter()
+        self.__classes = {}
+
+    @property
+    def calls(self):
+        """collections.Counter of (str, str): int: The number of calls to each method of each Tkinter class e.g.
+        `('Label', 'config')`, since the backend was created or reset."""
+        return self.__calls
+
+    @property
+    def total(self):
+        """int: The number of calls to Tkinter since the backend was created or reset."""
+        return sum(self.__calls.itervalues())
+
+    def reset(self):
+        """Forget the calls counted so far."""
+        self.__calls.clear()
+
+    def record(self, widget_name, method):
+        """Count a call.
+
+        Args:
+            widget_name (str): The Tkinter class e.g. 'Label'.
+            method (str): The method called e.g. 'config'.
+
+        """
+        self.__calls[(widget_name, method)] += 1
+
+    def widget(self, name):
+        """Get the fake of a Tkinter class. See `react.backend.TkBackend.widget`.
+
+        Args:
+            name (str): The name of the Tkinter class e.g. 'Label', 'StringVar', or 'Tk'.
+
+        Returns:
+            type: A subclass of `FakeRoot`, `FakeVariable` or `FakeWidget` named `name`, which counts its calls on
+                this backend.
+
+        """
+        if name not in self.__classes:
+            base = FakeRoot if name == 'Tk' else FakeVariable if name.endswith('Var') else FakeWidget
+            self.__classes[name] = type(name, (base,), dict(_backend=self))
+
+        return self.__classes[name]
+
+    def figure_canvas(self, figure, master):
+        """Create a canvas that draws a figure with Agg. See `react.backend.TkBackend.figure_canvas`."""
+        self.record('FigureCanvas', '__init__')
+
+        return FakeFigureCanvas(self, figure, master)
+
+    def ask_directory(self, **kwargs):
+        """Answer `self.directory`. See `react.backend.TkBackend.ask_directory`."""
+        self.record('Dialog', 'askdirectory')
+
+        return self.directory
+
+    def ask_open_filename(self, **kwargs):
+        """Answer `self.filename`. See `react.backend.TkBackend.ask_open_filename`."""
+        self.record('Dialog', 'askopenfilename')
+
+        return self.filename
@@ -17,7 +17,7 @@ Example:
 
     class GUI(Component):
         def __init__(self):
-            react.config('log', LOG)
+            react.config(trace=None, profile=False)
 
             react.new_root(WIDTH, HEIGHT, center=True, resizable=(False, False), title='Hive Battery',
                            bg="black")
@@ -45,15 +45,15 @@ from __future__ import absolute_import
 import subprocess
 from sys import platform
 import numpy as np
-from tkFileDialog import askdirectory as AskDirectory
-from Tkinter import Tk as Root
 
+from .backend import get_backend, set_backend
 from .constants import *
 from .widget_wrappers import Mainframe, Frame, Label, Entry, Button, Scale, Scrollbar, Listbox, StringVar, \
-    IntVar, Radiobutton, Checkbutton, FigureCanvas, _WIDGETS, Menu
+    IntVar, Radiobutton, Checkbutton, FigureCanvas, Menu, get_widget
 from Tkinter import N, S, W, E, HORIZONTAL, END
 from .config import config as __config
 from .data_structures.named_tuple import NamedTuple
+from . import profiler as __profiler
 
 GOLDEN_RATIO = (1 + 5 ** 0.5) / 2
 """float: Approx. 1.618. Useful to create proportional widgets.
@@ -75,12 +75,38 @@ Contains most of Tkinter's event names.
 """
 
 
+def AskDirectory(**kwargs):
+    """Ask the user to choose a directory with the current backend's dialog.
+
+    Args:
+        **kwargs: The options of `tkFileDialog.askdirectory` e.g. `initialdir`.
+
+    Returns:
+        str: The directory, or an empty string if the user canceled.
+
+    """
+    return get_backend().ask_directory(**kwargs)
+
+
+def AskOpenFilename(**kwargs):
+    """Ask the user to choose a file to open with the current backend's dialog.
+
+    Args:
+        **kwargs: The options of `tkFileDialog.askopenfilename` e.g. `filetypes`.
+
+    Returns:
+        str: The path of the file, or an empty string if the user canceled.
+
+    """
+    return get_backend().ask_open_filename(**kwargs)
+
+
 def new_root(width=__config['def_width'], height=__config['def_height'], center=False, resizable=(False, False),
              title='New project', bg='white', logging_on=False, **kwargs):
     """Instantiate `__Gui_Controller`
 
     This method should only be called once at the beginning of the constructor, as shown in the `Example` section of
-    this module's docstring.
+    this module's docstring. The root is created with the backend set with `set_backend`, which is Tkinter by default.
 
     Note:
         See the `Args` section of `__GuiController` for more information. Although the args do not appear to be
@@ -180,6 +206,20 @@ def add_event_handler(event, handler, key, active=False):
     __GUI_CONTROLLER.event_handlers[event][key] = dict(handler=handler, active=active)
 
 
+def remove_event_handler(event, key):
+    """Custom root event handlers removal.
+
+    Components that add event handlers should remove them when they are unmounted so that the handlers (and the
+    components they reference) are not kept alive forever.
+
+    Args:
+        event (str): Tkinter's exact event name already bound to Root.
+        key (str): The unique handler key.
+
+    """
+    __GUI_CONTROLLER.event_handlers[event].pop(key, None)
+
+
 def set_active_event_handler(event, key, active):
     """Activate root custom event handler.
 
@@ -222,6 +262,49 @@ def cget(key):
     return __config[key]
 
 
+def get_profile_report():
+    """Passthrough for `react.profiler.get_report`
+
+    Note:
+        Nothing is recorded unless profiling has been turned on with `config(profile=True)`.
+
+    Returns:
+        dict: The render statistics per component class and per component instance.
+
+    """
+    return __profiler.get_report()
+
+
+def format_profile_report(sort_by='render_time', limit=None, instances=False):
+    """Passthrough for `react.profiler.format_report`
+
+    Note:
+        See `react.profiler.format_report` for more information.
+
+    Returns:
+        str: The human-readable render statistics.
+
+    """
+    return __profiler.format_report(sort_by, limit, instances)
+
+
+def dump_profile(path):
+    """Passthrough for `react.profiler.dump`
+
+    Args:
+        path (str): The path of the JSON file to write.
+
+    """
+    __profiler.dump(path)
+
+
+def reset_profile():
+    """Passthrough for `react.profiler.reset`
+
+    """
+    __profiler.reset()
+
+
 def set_timeout(mseconds, callback):
     """Set a timeout with `Tkinter.after` (after certain milliseconds).
 
@@ -347,7 +430,7 @@ class __GuiController(object):
             **kwargs: Any other Tkinter props that should be passed to `self.mainframe`.
 
         """
-        self.root = Root()
+        self.root = get_backend().widget('Tk')()
         self.title = title
         self.bg_color = bg
         self.mainframe_props = dict(bg=bg, width=width, heigh=height, **kwargs)
@@ -357,6 +440,7 @@ class __GuiController(object):
         self.__mainframe = None
         self.__menu = None
         self.__log = logging_on
+        self.__bg_click = None
 
         self.__root_displayed = False
 
@@ -497,8 +581,9 @@ class __GuiController(object):
     def set_up_background(self, exclude_type, bg_callback):
         """Trigger a callback after clicking outside of a widget.
 
-        Given a target widget and its type, set up all other widgets so that whenever the user clicks on them,
-        a handler is triggered.
+        Given a target widget type, set up all other widgets so that whenever the user clicks on them, a handler is
+        triggered. A single binding on Tkinter's `all` tag covers every widget, including the ones created later on,
+        so the cost of this method does not depend on the number of widgets.
 
         Args:
             exclude_type (int): The numerical code of the target widget as defined in `react.constants`.
@@ -506,11 +591,10 @@ class __GuiController(object):
                 whenever clicked.
 
         """
-        self.mainframe.bind("<Button-1>", lambda e: self.on_bg_click(bg_callback))
+        if self.__bg_click is None:
+            self.root.bind_all("<Button-1>", self.handle_bg_click, add='+')
 
-        for widget in _WIDGETS:
-            if widget['type'] != exclude_type:
-                widget['widget'].bind("<Button-1>", lambda e: self.on_bg_click(bg_callback))
+        self.__bg_click = (exclude_type, bg_callback)
 
     def handle_event(self, e):
         """Handle root events.
@@ -528,6 +612,21 @@ class __GuiController(object):
             if handler['active']:
                 self.root.after_idle(lambda: handler['handler'](e))
 
+    def handle_bg_click(self, e):
+        """Filter background clicks.
+
+        Looks up the React widget that was clicked and, unless it's of the type excluded by `self.set_up_background`,
+        triggers the background click event. Clicks on widgets unknown to React are ignored.
+
+        Args:
+            e (Tkinter.Event): The event object generated by the click.
+
+        """
+        widget = get_widget(str(e.widget))
+
+        if widget is not None and widget.type != self.__bg_click[0]:
+            self.on_bg_click(self.__bg_click[1])
+
     def on_close_window(self, handler):
         """Close window event.
 
@@ -0,0 +1,293 @@
+"""React profiler.
+
+Collects per-component render statistics when `react.config['profile']` is truthy. The wrappers defined in
+`react.component` and `react.widget_wrappers` feed this module, which keeps one `RenderStats` record per component
+class and one per component instance. The results can be inspected in-process with `get_report`/`format_report` or
+dumped to a JSON file with `dump`.
+
+Note:
+    All times are measured with `timeit.default_timer`, the highest resolution clock available on each platform.
+    Render times are inclusive, i.e. the render time of a component includes the render time of all the children it
+    renders; `self_time` excludes them.
+
+Example:
+::
+    import react.index as react
+
+    react.config(profile=True)
+    ...
+    print react.format_profile_report(limit=10)
+    react.dump_profile('/tmp/profile.json')
+
+.. _React Library:
+    https://github.com/hivebattery/gui/blob/master/driver/react/profiler.py
+
+"""
+from __future__ import absolute_import
+
+import json
+from collections import deque
+from timeit import default_timer as clock
+
+TRACE_LENGTH = 50
+"""int: The number of updates remembered per component instance.
+"""
+
+_class_stats = {}
+"""dict of str: RenderStats: Statistics aggregated per component class.
+"""
+
+_instance_stats = {}
+"""dict of str: RenderStats: Statistics for each component instance, keyed by `'ClassName#id'`.
+"""
+
+_render_stack = []
+"""list of float: The time spent rendering children for each render currently in progress.
+"""
+
+
+class RenderStats(object):
+    """Render statistics for a component class or instance.
+
+    Attributes:
+        name (str): The class name or the instance key.
+        renders (int): How many times `render` was called.
+        render_time (float): Cumulative (inclusive) render time in seconds.
+        max_render_time (float): The slowest render in seconds.
+        self_time (float): Cumulative render time in seconds, excluding the render time of children.
+        propagations (int): How many times `pass_props` was called.
+        propagation_time (float): Cumulative time spent passing props down the chain in seconds.
+        max_propagation_time (float): The slowest props propagation in seconds.
+        updates (int): How many times `component_will_receive_props` was called.
+        update_keys (dict of str: int): How many updates each prop key triggered.
+        geometry_calls (int): How many `pack`, `place` or `grid` calls the component's widgets received.
+        widgets_created (int): How many widgets were created (only for widget classes).
+        widget_time (float): Cumulative widget creation time in seconds (only for widget classes).
+        trace (collections.deque of (float, tuple of str)): The time and prop keys of the latest updates (only for
+            component instances).
+
+    """
+    def __init__(self, name, trace=False):
+        """RenderStats constructor.
+
+        Args:
+            name (str): `self.name`.
+            trace (bool, optional): Whether the latest updates should be remembered. Default is False.
+
+        """
+        self.name = name
+        self.renders = 0
+        self.render_time = 0.0
+        self.max_render_time = 0.0
+        self.self_time = 0.0
+        self.propagations = 0
+        self.propagation_time = 0.0
+        self.max_propagation_time = 0.0
+        self.updates = 0
+        self.update_keys = {}
+        self.geometry_calls = 0
+        self.widgets_created = 0
+        self.widget_time = 0.0
+        self.trace = deque(maxlen=TRACE_LENGTH) if trace else None
+
+    def as_dict(self):
+        """Serialize the statistics.
+
+        Returns:
+            dict: All attributes of this instance, with the trace converted to a list.
+
+        """
+        res = dict(name=self.name, renders=self.renders, render_time=self.render_time,
+                   max_render_time=self.max_render_time, self_time=self.self_time, propagations=self.propagations,
+                   propagation_time=self.propagation_time, max_propagation_time=self.max_propagation_time,
+                   updates=self.updates, update_keys=dict(self.update_keys), geometry_calls=self.geometry_calls,
+                   widgets_created=self.widgets_created, widget_time=self.widget_time)
+
+        if self.trace is not None:
+            res['trace'] = [dict(time=t, keys=list(keys)) for t, keys in self.trace]
+
+        return res
+
+
+def _get_stats(obj):
+    """Fetch (or create) the class and instance statistics of a component.
+
+    Args:
+        obj (react.component.Component): The component being profiled.
+
+    Returns:
+        (RenderStats, RenderStats): The class statistics and the instance statistics.
+
+    """
+    class_name = obj.__class__.__name__
+    key = '%s#%i' % (class_name, obj.id)
+
+    class_stats = _class_stats.get(class_name)
+
+    if class_stats is None:
+        class_stats = _class_stats[class_name] = RenderStats(class_name)
+
+    instance_stats = _instance_stats.get(key)
+
+    if instance_stats is None:
+        instance_stats = _instance_stats[key] = RenderStats(key, trace=True)
+
+    return class_stats, instance_stats
+
+
+def start_render():
+    """Mark the beginning of a render.
+
+    Returns:
+        float: The current time, to be passed back to `end_render`.
+
+    """
+    _render_stack.append(0.0)
+    return clock()
+
+
+def end_render(component, start):
+    """Record a finished render.
+
+    Args:
+        component (react.component.Component): The component that was rendered.
+        start (float): The value returned by `start_render`.
+
+    """
+    elapsed = clock() - start
+    children_time = _render_stack.pop()
+
+    if len(_render_stack):  #: bill this render to the parent's children time
+        _render_stack[-1] += elapsed
+
+    for stats in _get_stats(component):
+        stats.renders += 1
+        stats.render_time += elapsed
+        stats.self_time += elapsed - children_time
+        stats.max_render_time = max(stats.max_render_time, elapsed)
+
+
+def record_propagation(component, elapsed):
+    """Record a call to `pass_props`.
+
+    Args:
+        component (react.component.Component): The component passing props to its children.
+        elapsed (float): The time it took to pass the props in seconds.
+
+    """
+    for stats in _get_stats(component):
+        stats.propagations += 1
+        stats.propagation_time += elapsed
+        stats.max_propagation_time = max(stats.max_propagation_time, elapsed)
+
+
+def record_update(component, keys):
+    """Record a call to `component_will_receive_props`.
+
+    Args:
+        component (react.component.Component): The component receiving props.
+        keys (tuple of str): The prop keys that triggered the update.
+
+    """
+    class_stats, instance_stats = _get_stats(component)
+
+    for stats in (class_stats, instance_stats):
+        stats.updates += 1
+
+        for key in keys:
+            stats.update_keys[key] = stats.update_keys.get(key, 0) + 1
+
+    instance_stats.trace.append((clock(), tuple(keys)))
+
+
+def record_geometry_call(component):
+    """Record a `pack`, `place` or `grid` call on one of the component's widgets.
+
+    Args:
+        component (react.component.Component): The component that contains the widget.
+
+    """
+    if hasattr(component, 'id'):
+        for stats in _get_stats(component):
+            stats.geometry_calls += 1
+
+
+def record_widget(widget_class_name, elapsed):
+    """Record the creation of a widget.
+
+    Args:
+        widget_class_name (str): The widget's class name e.g. 'Label'.
+        elapsed (float): The time it took to create the widget in seconds.
+
+    """
+    key = 'widget:%s' % widget_class_name
+    stats = _class_stats.get(key)
+
+    if stats is None:
+        stats = _class_stats[key] = RenderStats(key)
+
+    stats.widgets_created += 1
+    stats.widget_time += elapsed
+
+
+def reset():
+    """Discard all the statistics collected so far.
+
+    """
+    _class_stats.clear()
+    _instance_stats.clear()
+    del _render_stack[:]
+
+
+def get_report():
+    """Build a report of all the statistics collected so far.
+
+    Returns:
+        dict: Contains the keys `classes` and `instances`, each one mapping names to serialized `RenderStats`.
+
+    """
+    return dict(classes=dict((name, stats.as_dict()) for name, stats in _class_stats.items()),
+                instances=dict((name, stats.as_dict()) for name, stats in _instance_stats.items()))
+
+
+def format_report(sort_by='render_time', limit=None, instances=False):
+    """Build a human-readable report.
+
+    Args:
+        sort_by (str, optional): The `RenderStats` attribute to sort the rows by, in descending order. Default is
+            'render_time'.
+        limit (int, optional): The maximum number of rows. Default is None, which means no limit.
+        instances (bool, optional): Whether to report component instances instead of component classes. Default is
+            False.
+
+    Returns:
+        str: One line per class (or instance) with its render count, timings (in ms) and most frequent prop keys.
+
+    """
+    rows = sorted((_instance_stats if instances else _class_stats).values(), key=lambda s: getattr(s, sort_by),
+                  reverse=True)[:limit]
+    lines = ['%-32s %8s %10s %10s %10s %8s %10s %8s  %s' % ('name', 'renders', 'total ms', 'self ms', 'max ms',
+                                                             'passes', 'props ms', 'geom', 'top keys')]
+
+    for stats in rows:
+        top_keys = sorted(stats.update_keys.items(), key=lambda item: item[1], reverse=True)[:3]
+
+        lines.append('%-32s %8i %10.2f %10.2f %10.2f %8i %10.2f %8i  %s' %
+                     (stats.name, stats.renders or stats.widgets_created,
+                      (stats.render_time or stats.widget_time) * 1000, stats.self_time * 1000,
+                      stats.max_render_time * 1000, stats.propagations, stats.propagation_time * 1000,
+                      stats.geometry_calls, ", ".join('%s=%i' % item for item in top_keys)))
+
+    return "\n".join(lines)
+
+
+def dump(path):
+    """Write the report returned by `get_report` to a JSON file.
+
+    Args:
+        path (str): The path of the file to write.
+
+    """
+    f = open(path, 'wb')
+    f.write(json.dumps(get_report(), indent=2, sort_keys=True))
+    f.close()
@@ -0,0 +1,131 @@
+"""Redux action dispatcher.
+
+Contains the `Dispatcher` class, which runs the actions triggered by components as soon as Tkinter is idle, one action
+per event loop iteration so that the GUI stays responsive. Pending actions are run by priority (see `priority`), in the
+order in which they were triggered within the same priority, and an action that is triggered again with the same
+arguments while it is still pending is only run once.
+
+Example:
+::
+    from react.redux.dispatcher import priority, PRIORITY_HIGH
+
+    @priority(PRIORITY_HIGH)
+    def start_transfer(usb_handle):
+        ...
+        return dict(type='START_TRANSFER', data=data, error=None, args=None)
+
+.. _React Library:
+    https://github.com/hivebattery/gui/blob/master/driver/react/redux/dispatcher.py
+
+"""
+from __future__ import absolute_import
+
+import heapq
+import itertools
+
+from ..index import set_immediate
+
+PRIORITY_HIGH = 0
+"""int: The priority of actions that should run before any other e.g. data transfers.
+"""
+PRIORITY_NORMAL = 1
+"""int: The default priority of actions e.g. status polling.
+"""
+PRIORITY_LOW = 2
+"""int: The priority of actions that can wait e.g. connection checks.
+"""
+
+
+def priority(level):
+    """Set the priority of an action.
+
+    Args:
+        level (int): Either `PRIORITY_HIGH`, `PRIORITY_NORMAL`, or `PRIORITY_LOW`.
+
+    Returns:
+        (((tuple) -> dict) -> ((tuple) -> dict)): A decorator that returns the same action with the given priority.
+
+    """
+    def decorator(action):
+        action.priority = level
+        return action
+
+    return decorator
+
+
+class Dispatcher(object):
+    """Priority-aware action dispatcher.
+
+    Attributes:
+        __queue (list of (int, int, tuple, () -> None)): A heap with the priority, the sequence number, the
+            deduplication key, and the callback of each pending action.
+        __pending (set of tuple): The deduplication keys of the pending actions.
+        __counter (itertools.count): Sequence numbers that keep actions with the same priority in FIFO order.
+        __scheduled (bool): Whether a Tkinter callback is already scheduled to run the next action.
+
+    """
+    def __init__(self):
+        """Dispatcher constructor.
+
+        """
+        self.__queue = []
+        self.__pending = set()
+        self.__counter = itertools.count()
+        self.__scheduled = False
+
+    def __len__(self):
+        """Count the pending actions.
+
+        Returns:
+            int: The number of actions waiting to run.
+
+        """
+        return len(self.__queue)
+
+    def dispatch(self, action, callback, *key):
+        """Queue an action.
+
+        Args:
+            action ((tuple) -> dict): The action, whose priority is read from its `priority` attribute (if it was
+                decorated with `priority`) or is `PRIORITY_NORMAL` otherwise.
+            callback (() -> None): Runs the action.
+            *key: Identifies the action together with `action` itself. If an identical action is still pending, it's
+                not queued again. Actions with unhashable keys are always queued.
+
+        """
+        key = (action,) + key
+
+        try:
+            if key in self.__pending:
+                return
+
+            self.__pending.add(key)
+        except TypeError:  #: unhashable arguments e.g. lists
+            key = None
+
+        heapq.heappush(self.__queue, (getattr(action, 'priority', PRIORITY_NORMAL), next(self.__counter), key,
+                                      callback))
+        self.__schedule()
+
+    def __schedule(self):
+        """Ask Tkinter to run the next action as soon as possible, unless it was already asked to.
+
+        """
+        if not self.__scheduled and len(self.__queue) > 0:
+            self.__scheduled = True
+            set_immediate(self.__run_next)
+
+    def __run_next(self):
+        """Run the pending action with the highest priority and schedule the next one.
+
+        """
+        self.__scheduled = False
+        _, _, key, callback = heapq.heappop(self.__queue)
+
+        if key is not None:
+            self.__pending.discard(key)
+
+        try:
+            callback()
+        finally:
+            self.__schedule()
@@ -1,7 +1,7 @@
 """Redux. Main module.
 
-Connects `React` components with action so that whenever an action resolves, the components receive the results
-as props.
+Connects `React` components with action so that whenever an action resolves, the components subscribed to the store
+receive the results as props.
 
 Todo:
     * Test a root reducer with more than one reducer.
@@ -13,7 +13,8 @@ Todo:
 from __future__ import absolute_import
 
 from ..data_structures.named_tuple import NamedTuple
-from ..index import set_timeout
+from .dispatcher import Dispatcher
+from .store import Store
 
 _root_reducer = None
 """dict of react.redux.reducer.Reducer
@@ -21,6 +22,14 @@ _root_reducer = None
 The main reducer that will store references to all specific reducers.
 """
 
+_store = None
+"""react.redux.store.Store: The store that holds the state of `_root_reducer`.
+"""
+
+_dispatcher = Dispatcher()
+"""react.redux.dispatcher.Dispatcher: Runs the actions triggered by all components.
+"""
+
 
 def combine_reducers(**reducers):
     """Build a root reducer.
@@ -45,62 +54,73 @@ def set_root_reducer(reducer):
             The root reducer with all reducers set as attributes.
 
     """
-    global _root_reducer
+    global _root_reducer, _store
     _root_reducer = reducer
+    _store = Store(reducer)
 
 
-def process_response(action, component, reducer_name, *args):
-    """Reduce action and pass results as props.
+def get_store():
+    """`_store` getter.
 
-    Args:
-        action ((tuple) -> dict): Whatever's returned by this action will be reduced by its respective reducer.
-        component (react.component.Component): The component that will receive the action's result as props.
-        reducer_name (str): The name of the reducer that will process this action.
-        *args: The arguments to be passed to the action.
+    Returns:
+        react.redux.store.Store: The store, or None if no root reducer has been set.
 
     """
-    k = action(*args)
+    return _store
 
-    if k is not None:
-        reducer_dict = {}
 
-        res = NamedTuple(k, 'NewAction')
-        new_state = _root_reducer._asdict()[reducer_name].reduce_action(res)
+def subscribe(component, map_state_to_props, reducer_names=None):
+    """Subscribe a component to the store.
 
-        reducer_dict[reducer_name] = new_state
+    Note:
+        See `react.redux.store.Store.subscribe`.
 
-        data = NamedTuple(reducer_dict, reducer_name.upper() + 'NewState')
-        component.update_props(component.map_state_to_props(data))
+    """
+    _store.subscribe(component, map_state_to_props, reducer_names)
 
 
-def connect_action(action, component, reducer_name, *args):
-    """Trigger the action with Tkinter's background event handler.
+def unsubscribe(component):
+    """Unsubscribe a component from the store, if there is one.
+
+    Note:
+        See `react.redux.store.Store.unsubscribe`.
+
+    """
+    if _store is not None:
+        _store.unsubscribe(component)
+
+
+def process_response(action, component, reducer_name, *args):
+    """Reduce action and pass results as props.
+
+    The results are dispatched to the store, which notifies every subscribed component whose props changed, including
+    the component that triggered the action.
 
     Args:
         action ((tuple) -> dict): Whatever's returned by this action will be reduced by its respective reducer.
-        component (react.component.Component): The component that will receive the action's result as props.
+        component (react.component.Component): The component that triggered the action.
         reducer_name (str): The name of the reducer that will process this action.
         *args: The arguments to be passed to the action.
 
     """
-    set_timeout(100, lambda: process_response(action, component, reducer_name, *args))
+    k = action(*args)
 
+    if k is not None:
+        _store.dispatch(reducer_name, NamedTuple(k, 'NewAction'))
 
-def set_reducers_to_default(component, reducer_names):
-    """Default reducer states.
 
-    Set all reducers to the default state and pass the results as props.
+def connect_action(action, component, reducer_name, *args):
+    """Trigger the action with Tkinter's background event handler.
+
+    The action is queued by `_dispatcher`, which runs it as soon as Tkinter is idle and no action with a higher priority
+    is pending. Triggering the same action with the same arguments while it's still pending has no effect.
 
     Args:
+        action ((tuple) -> dict): Whatever's returned by this action will be reduced by its respective reducer.
         component (react.component.Component): The component that will receive the action's result as props.
-        reducer_names (list of str): The name of the reducer that will process this action.
+        reducer_name (str): The name of the reducer that will process this action.
+        *args: The arguments to be passed to the action.
 
     """
-    new_state_dict = {}
-    root_reducer_dict = _root_reducer._asdict()
-
-    for reducer_name in reducer_names:
-        new_state_dict[reducer_name] = root_reducer_dict[reducer_name].state
-
-    data = NamedTuple(new_state_dict, 'NewState')
-    component.update_props(component.map_state_to_props(data))
\ No newline at end of file
+    _dispatcher.dispatch(action, lambda: process_response(action, component, reducer_name, *args), component.id,
+                         reducer_name, *args)
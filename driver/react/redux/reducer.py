@@ -9,6 +9,7 @@ Contains the `Reducer` class which is added to the root reducer.
 
 from __future__ import absolute_import
 from ..data_structures.named_tuple import NamedTuple
+from .store import changed
 
 
 class Reducer(object):
@@ -26,6 +27,27 @@ class Reducer(object):
     def __init__(self, default_val):
         self.state = NamedTuple(default_val, 'ReducerState')
 
+    def update(self, changes):
+        """Update the reducer's state.
+
+        The store only notifies subscribers when the state object itself is replaced, so the state is left untouched
+        when none of the values actually changed.
+
+        Args:
+            changes (dict): The new values of some of the state's keys.
+
+        Returns:
+            react.data_structures.named_tuple.NamedTuple: The reducer's new state.
+
+        """
+        state = self.state._asdict()
+        changes = dict((key, val) for key, val in changes.items() if changed(state[key], val))
+
+        if len(changes) > 0:
+            self.state = self.state._replace(**changes)
+
+        return self.state
+
     def reduce_action(self, action):
         """Process action and reduce it to a dict.
 
@@ -0,0 +1,184 @@
+"""Redux Store definition.
+
+Contains the `Store` class, which holds the state of every reducer in the root reducer and notifies the components
+subscribed to it whenever the props they select change.
+
+Note:
+    Each subscription memoizes its `map_state_to_props`: it is only evaluated again when the identity of at least one of
+    the reducer states it depends on changes, which is why reducers should keep their state untouched when an action
+    doesn't change anything (see `react.redux.reducer.Reducer.update`). Moreover, only the props whose values actually
+    changed are passed to the subscribed component.
+
+Example:
+::
+    from react.redux.store import Store
+
+    store = Store(root_reducer)
+    store.subscribe(component, lambda state: dict(is_connected=state.usb.is_connected))
+    store.dispatch('usb', NamedTuple(dict(type='CONNECT', data=handle, error=None, args=None), 'NewAction'))
+
+.. _React Library:
+    https://github.com/hivebattery/gui/blob/master/driver/react/redux/store.py
+
+"""
+from __future__ import absolute_import
+
+import numpy as np
+
+from ..data_structures.named_tuple import NamedTuple
+
+
+def changed(old, new):
+    """Check whether a value changed.
+
+    Identical objects never change, and numpy arrays are compared element-wise. Values that can't be compared are
+    assumed to have changed.
+
+    Args:
+        old: The previous value.
+        new: The current value.
+
+    Returns:
+        bool: True if `new` differs from `old`, False otherwise.
+
+    """
+    if old is new:
+        return False
+
+    if isinstance(old, np.ndarray) or isinstance(new, np.ndarray):
+        return not np.array_equal(old, new)
+
+    try:
+        return bool(old != new)
+    except ValueError:  #: e.g. tuples or lists that contain numpy arrays
+        return True
+
+
+class Subscription(object):
+    """A component subscribed to the store.
+
+    Attributes:
+        component (react.component.Component): The component that receives the selected props.
+        reducer_names (tuple of str): The reducers whose states are passed to `map_state_to_props`.
+
+    """
+    def __init__(self, component, map_state_to_props, reducer_names):
+        """Subscription constructor.
+
+        Args:
+            component (react.component.Component): `self.component`.
+            map_state_to_props ((react.data_structures.named_tuple.NamedTuple) -> dict): Selects the component's
+                props out of the reducer states.
+            reducer_names (tuple of str): `self.reducer_names`.
+
+        """
+        self.component = component
+        self.reducer_names = reducer_names
+
+        self.__map_state_to_props = map_state_to_props
+        self.__inputs = None
+        self.__props = {}
+
+    def select(self, state):
+        """Select the props that changed since the last selection.
+
+        Args:
+            state (dict of str: react.data_structures.named_tuple.NamedTuple): The current state of each reducer.
+
+        Returns:
+            dict: The selected props whose values changed, which is empty if none did.
+
+        """
+        inputs = tuple(state[name] for name in self.reducer_names)
+
+        if self.__inputs is not None and all(new is old for new, old in zip(inputs, self.__inputs)):
+            return {}
+
+        self.__inputs = inputs
+        props = self.__map_state_to_props(NamedTuple(dict(zip(self.reducer_names, inputs)), 'State'))
+
+        changes = dict((key, val) for key, val in props.items()
+                       if key not in self.__props or changed(self.__props[key], val))
+        self.__props = props
+
+        return changes
+
+
+class Store(object):
+    """Redux Store.
+
+    Attributes:
+        reducers (dict of str: react.redux.reducer.Reducer): The reducers of the root reducer, by name.
+
+    """
+    def __init__(self, root_reducer):
+        """Store constructor.
+
+        Args:
+            root_reducer (react.data_structures.named_tuple.NamedTuple of react.redux.reducer.Reducer): The root
+                reducer with all reducers set as attributes.
+
+        """
+        self.reducers = dict(root_reducer._asdict())
+
+        self.__state = dict((name, reducer.state) for name, reducer in self.reducers.items())
+        self.__subscriptions = {}
+
+    @property
+    def state(self):
+        """react.data_structures.named_tuple.NamedTuple: The current state of each reducer, by name."""
+        return NamedTuple(self.__state, 'State')
+
+    def subscribe(self, component, map_state_to_props, reducer_names=None):
+        """Subscribe a component to the store.
+
+        The component immediately receives all of its selected props.
+
+        Args:
+            component (react.component.Component): The component that will receive the selected props.
+            map_state_to_props ((react.data_structures.named_tuple.NamedTuple) -> dict): Selects the component's
+                props out of the reducer states.
+            reducer_names (list of str, optional): The reducers `map_state_to_props` depends on. Default is None,
+                which means all reducers.
+
+        """
+        names = tuple(sorted(self.reducers.keys() if reducer_names is None else reducer_names))
+        subscription = Subscription(component, map_state_to_props, names)
+
+        self.__subscriptions[component.id] = subscription
+        component.update_props(subscription.select(self.__state))
+
+    def unsubscribe(self, component):
+        """Stop notifying a component.
+
+        Args:
+            component (react.component.Component): The component to unsubscribe.
+
+        """
+        self.__subscriptions.pop(component.id, None)
+
+    def dispatch(self, reducer_name, action):
+        """Reduce an action and notify the subscribers whose props changed.
+
+        Args:
+            reducer_name (str): The name of the reducer that will process this action.
+            action (react.data_structures.named_tuple.NamedTuple): The results of the action.
+
+        """
+        new_state = self.reducers[reducer_name].reduce_action(action)
+
+        if new_state is self.__state[reducer_name]:
+            return
+
+        self.__state[reducer_name] = new_state
+
+        for component_id in sorted(self.__subscriptions.keys()):
+            subscription = self.__subscriptions.get(component_id)
+
+            if subscription is None or reducer_name not in subscription.reducer_names:
+                continue
+
+            props = subscription.select(self.__state)
+
+            if len(props) > 0:
+                subscription.component.update_props(props)
@@ -29,10 +29,15 @@ Example:
 
             self.welcome_message_str_var.set(self.state.welcome_message)
 
+Note:
+    The wrapped widgets remember the geometry manager and options, the configuration options, and the variable values
+    that were last applied to them, so that calling `pack`, `place`, `grid`, `config`, or `set` with the same
+    arguments on every render doesn't reach Tkinter at all. Use `forget` to hide a widget regardless of the geometry
+    manager that displays it.
+
 Todo:
     * Find a better way to connect the widgets with the components than just accessing the protected
-      module variables such as _WIDGETS, _PARENT_FRAME, and _id
-    * Condense wrapper.
+      module variables such as _PARENT_FRAME and _id
     * Remove redundant `Mainframe` class.
 
 .. _React Library:
@@ -42,47 +47,56 @@ Todo:
 from __future__ import absolute_import
 
 import re
+import weakref
 from types import FunctionType
 from functools import wraps
-import Tkinter as tk
-import matplotlib
 
+from .backend import get_backend
 from .config import config
 from .constants import WIDGET_KEY_MAP
+from . import profiler
 
-matplotlib.use('TkAgg')
-matplotlib.rcParams.update({'figure.autolayout': True})
-
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
+_WIDGETS = weakref.WeakValueDictionary()
+"""weakref.WeakValueDictionary of str: Widget:
 
-_WIDGETS = []
-"""list` of :obj:`dict:
-
-Stores references to all Tkinter widgets in he project. Each dict stores both the widget type as defined by
-`react.constants` and the widget itself.
+Maps the Tkinter path name of every live widget in the project to its React wrapper, whose `type` attribute holds the
+widget type as defined by `react.constants`. Only weak references are kept, so entries vanish as soon as a widget is
+destroyed or garbage collected.
 """
 
 _PARENT_FRAME = None
 """Frame: The default parent frame to be used by all widgets that don't have a parent frame defined.
 """
 
+_UNSET = object()
+"""object: Marks a variable whose current value is unknown.
+"""
+
 _id = 0
 """int: The widgets' unique id.
 
 Each time a new widget is created, `_id` increases by one so that each widget can be easily identified.
 """
 
-_ids = {}
-"""dict` of :obj:`Widget: Maps widgets' hash keys to the actual widget.
-"""
-
 
 def set_parent_frame(v):
     global _PARENT_FRAME
     _PARENT_FRAME = v
 
 
+def get_widget(path_name):
+    """Find the React widget that wraps a Tkinter widget.
+
+    Args:
+        path_name (str): The Tkinter path name of the widget i.e. `str(tk_widget)`.
+
+    Returns:
+        Widget: The wrapper, or None if no live widget has that path name.
+
+    """
+    return _WIDGETS.get(path_name)
+
+
 def get_widget_id():
     global _id
     curr_id = _id
@@ -91,143 +105,316 @@ def get_widget_id():
     return curr_id
 
 
-def wrapper(method):
-    """Executes before creating an instance `Widget`.
+def _build_menu(self, frame, args, kwargs):
+    """Create a `Tkinter.Menu`, which is not registered as a widget.
+
+    Args:
+        self (Menu): The React widget being created.
+        frame (Tkinter.Widget): The Tkinter master.
+        args (tuple): The arguments passed to the React widget's constructor, where `args[0]` is `self`.
+        kwargs (dict): The keyword arguments for the Tkinter constructor.
+
+    Returns:
+        None: Menus are not registered.
+
+    """
+    self.menu = get_backend().widget('Menu')(frame, **kwargs)
+
+
+def _build_variable(self, frame, args, kwargs):
+    """Create a `Tkinter.StringVar` or a `Tkinter.IntVar`, which are not registered as widgets.
+
+    Note:
+        See `_build_menu` for a description of the arguments.
+
+    Returns:
+        None: Variables are not registered.
+
+    """
+    class_name = self.__class__.__name__
+    tk_variable = get_backend().widget(class_name)()
+    setattr(self, class_name.lower(), tk_variable)
+
+    self._value = _UNSET
+    ref = weakref.ref(self)
+
+    def forget_value(*trace_args):
+        """Invalidate the cached value, since it might have been changed by Tkinter e.g. when the user types."""
+        variable = ref()
+
+        if variable is not None:
+            variable._value = _UNSET
+
+    tk_variable.trace_variable('w', forget_value)
+
+
+def _build_figure_canvas(self, frame, args, kwargs):
+    """Create the backend's figure canvas e.g. matplotlib's `FigureCanvasTkAgg`, where `args[2]` is the figure to
+    display.
+
+    Note:
+        See `_build_menu` for a description of the arguments.
+
+    Returns:
+        Tkinter.Canvas: The Tkinter widget to register.
+
+    """
+    self._figure_canvas = get_backend().figure_canvas(args[2], frame)
+    self.figurecanvas = self._figure_canvas.get_tk_widget()
+
+    return self.figurecanvas
+
+
+def _build_mainframe(self, frame, args, kwargs):
+    """Create the mainframe as a `Tkinter.Frame` whose master is Tkinter's root, i.e. `args[2]`.
+
+    Note:
+        See `_build_menu` for a description of the arguments.
+
+    Returns:
+        Tkinter.Frame: The Tkinter widget to register.
+
+    """
+    self.mainframe = get_backend().widget('Frame')(args[2], **kwargs)
+
+    return self.mainframe
+
+
+def _tk_factory(tk_name, get_options=None):
+    """Build a constructor for a plain Tkinter widget.
+
+    Args:
+        tk_name (str): The name of the Tkinter class e.g. 'Label'.
+        get_options ((tuple, dict) -> dict, optional): Computes the extra Tkinter options out of the arguments passed
+            to the React widget's constructor (excluding the keyword arguments). Default is None, which means no extra
+            options.
+
+    Returns:
+        (Widget, Tkinter.Widget, tuple, dict) -> Tkinter.Widget: The constructor, with the same signature as
+            `_build_menu`, which creates the widget with the current backend.
+
+    """
+    attr_name = tk_name.lower()
+
+    def build(self, frame, args, kwargs):
+        if get_options is not None:
+            kwargs.update(get_options(args, kwargs))
+
+        tk_widget = get_backend().widget(tk_name)(frame, **kwargs)
+        setattr(self, attr_name, tk_widget)
+
+        return tk_widget
+
+    return build
+
+
+def _text_options(args, kwargs):
+    """Options for widgets with a text i.e. `Button` and `Label`, where `args[2]` is a string or a `StringVar`."""
+    if isinstance(args[2], basestring):
+        return dict(text=args[2])
+
+    return dict(textvariable=args[2].stringvar)
+
+
+def _radiobutton_options(args, kwargs):
+    """Options for a `Radiobutton`, where `args[2:5]` are the text, the `IntVar`, and the value."""
+    return dict(text=args[2], variable=args[3].intvar, value=args[4])
+
+
+def _checkbutton_options(args, kwargs):
+    """Options for a `Checkbutton`, where `args[2:4]` are the (optional) text and the `IntVar`."""
+    options = dict(variable=args[3].intvar)
+
+    if args[2] is not None:
+        options['text'] = args[2]
+
+    return options
+
+
+def _scale_options(args, kwargs):
+    """Options for a `Scale`, which hides its value unless told otherwise."""
+    return dict(showvalue=kwargs.get('showvalue', 0))
+
+
+_FACTORIES = {
+    "Menu": _build_menu,
+    "StringVar": _build_variable,
+    "IntVar": _build_variable,
+    "FigureCanvas": _build_figure_canvas,
+    "Mainframe": _build_mainframe,
+    "Frame": _tk_factory("Frame"),
+    "Label": _tk_factory("Label", _text_options),
+    "Button": _tk_factory("Button", _text_options),
+    "Entry": _tk_factory("Entry", lambda args, kwargs: dict(textvariable=args[2].stringvar)),
+    "Scale": _tk_factory("Scale", _scale_options),
+    "Scrollbar": _tk_factory("Scrollbar"),
+    "Listbox": _tk_factory("Listbox", lambda args, kwargs: dict(yscrollcommand=args[2])),
+    "Radiobutton": _tk_factory("Radiobutton", _radiobutton_options),
+    "Checkbutton": _tk_factory("Checkbutton", _checkbutton_options),
+}
+"""dict of str: ((Widget, Tkinter.Widget, tuple, dict) -> Tkinter.Widget):
+
+Maps each React widget class name to the function that creates its Tkinter counterpart. The functions return the
+Tkinter widget to register in `_WIDGETS`, or None for objects that are not rendered e.g. menus and variables. The
+`Widget` meta class looks the factory up once per class, when the class is created.
+"""
+
+
+def init_wrapper(method):
+    """Wraps the constructor of a `Widget`.
 
     Some preparation is needed to set up the compatibility of the widgets with `React`. This wrapper
     takes care of that.
 
     Args:
-        method (() -> Any): The method currently being wrapped
+        method (() -> None): The constructor being wrapped.
 
     Returns:
-        Whatever the original wrapped method would have returned
+        (() -> None): The wrapped constructor.
 
     """
     @wraps(method)
     def wrapped(*args, **kwargs):
         """The actual wrapper function.
 
-        After evaluating certain conditions, this method takes care of any preparation or
-        operation needed by a general purpose React Widget before creation. When the constructor of a class that's an
-        instance of `Widget` is called, certain operations happen in the following order, where steps 1-2 are
-        pre-rendering operations and steps 4- involve post-rendering operations:
+        When the constructor of a class that's an instance of `Widget` is called, certain operations happen in the
+        following order:
 
             1) Determine what `Frame` will contain the widget. If `frame` is not in the constructors `kwargs` keys,
                 use the default frame.
-            2) Given the name of the class that's an instance of `Widget` i.e. `self.__class__.__name__`, run the
-                the specific preparation for that class.
-            3) The widgets `StringVar`, `IntVar`, and `Menu` are special type of widgets that do not get added
-                to `_WIDGETS` and do not get an `id`; nevertheless, all other widgets go through this final step
-                where they also get added to their parent component.
+            2) Run the class's factory, as precomputed in `_FACTORIES` by the `Widget` meta class, to create the
+                Tkinter widget.
+            3) The widgets `StringVar`, `IntVar`, and `Menu` are special type of widgets that do not get registered
+                in `_WIDGETS` and do not get an `id`; nevertheless, all other widgets go through this final step
+                where they also get added to their parent component, and the options they were created with are
+                remembered by `config`.
 
-        On the other hand, if the method called is `__getattr__`, override normal execution and determine whether
-        this widget should be rendered (by adding it to the DoublyLinkedList `self.container.widget_renders`) if
-        any of the rendering Tkinter methods `pack`, `place`, or `grid` gets called, or hidden otherwise.
+        If `config['profile']` is truthy, widget creation times are also recorded by `react.profiler`, and if
+        `config['trace']` is set, widget creation is traced.
 
         Args:
-            *args: Variable length argument list for the method being wrapped, where `args[0]` is always
-                `self` and if the method is `__init__`, `args[1]` is usually the React Component that contains this
-                widget.
+            *args: Variable length argument list for the constructor, where `args[0]` is always `self` and `args[1]`
+                is usually the React Component that contains this widget.
             **kwargs: Arbitrary keyword arguments
 
-        Returns:
-            FunctionType: The wrapped method or the original method depending on the specific behavior
-            desired.
-
         """
-        global _PARENT_FRAME
-        global _WIDGETS
         self = args[0]
-        class_name = self.__class__.__name__
-        func_name = method.__name__
-
-        if config['log'] == 2:
-            print func_name, args, kwargs
-
-        if func_name == '__init__':
-            if 'frame' in kwargs.keys():  #: Step 1
-                frame = kwargs['frame']
-
-                if hasattr(frame, 'frame'):
-                    frame = frame.frame
-
-                del kwargs['frame']
-            else:
-                frame = _PARENT_FRAME
-
-            widget = {}
-
-            if class_name == 'Menu':  # Step 2
-                self.menu = tk.Menu(frame, **kwargs)
-            elif class_name == "StringVar" or class_name == "IntVar":
-                self.__setattr__(class_name.lower(), getattr(tk, class_name)())
-            elif class_name == "FigureCanvas":
-                self._figure_canvas = FigureCanvasTkAgg(args[2], master=frame)
-                self.figurecanvas = self._figure_canvas.get_tk_widget()
-
-                widget['widget'] = self.figurecanvas
-                widget['type'] = WIDGET_KEY_MAP['figurecanvas']
-            else:
-                final_kwargs = dict(**kwargs)
-
-                if class_name == "Mainframe":
-                    tk_widget = "Frame"
-                    tk_args = (args[2],)
-                else:
-                    tk_widget = class_name
-                    tk_args = (frame,)
-
-                    if class_name == "Button" or class_name == "Label" or class_name == "Radiobutton"\
-                            or (class_name == "Checkbutton" and args[2] is not None):
-                        if class_name == "Label" and not isinstance(args[2], str):
-                            final_kwargs['textvariable'] = args[2].stringvar
-                        else:
-                            final_kwargs['text'] = args[2]
-                    elif class_name == "Listbox":
-                        final_kwargs['yscrollcommand'] = args[2]
-                    elif class_name == "Radiobutton":
-                        final_kwargs['variable'] = args[3].intvar
-                        final_kwargs['value'] = args[4]
-                    elif class_name == "Entry":
-                        final_kwargs['textvariable'] = args[2]
-                    elif class_name == "Checkbutton":
-                        final_kwargs['variable'] = args[3].intvar
-                    elif class_name == "Scale" and 'showvalue' not in final_kwargs.keys():
-                        final_kwargs['showvalue'] = 0
-
-                self.__setattr__(class_name.lower(), getattr(tk, tk_widget)(*tk_args, **final_kwargs))
-
-                widget['widget'] = getattr(self, class_name.lower())
-                widget['type'] = WIDGET_KEY_MAP[class_name.lower()]
-
-            if len(widget) > 0:  #: Step 3
-                widget['widget'] = self
-                self.container = args[1]
-
-                if hasattr(self.container, 'widgets'):
-                    self.container.widgets.insert(self)
-
-                self.id = get_widget_id()
-                _WIDGETS.append(widget)
-
-        elif func_name == '__getattr__':
-            item = args[1]
-
-            if item == 'pack' or item == 'place' or item == 'grid':
-                self.container.widget_renders.insert(self)
-
-        return method(*args, **kwargs)
+        profile = config['profile']
+
+        trace = config['trace']
+
+        if trace is not None:
+            trace("__init__ %r %r", args, kwargs)
+
+        if profile:
+            start = profiler.clock()
+
+        frame = kwargs.pop('frame', _PARENT_FRAME)  #: Step 1
+
+        if hasattr(frame, 'frame'):
+            frame = frame.frame
+
+        options = dict(kwargs)
+        tk_widget = self._factory(frame, args, options)  #: Step 2
+
+        if tk_widget is not None:  #: Step 3
+            self._geometry = None
+            self._options = options
+            self.container = args[1]
+
+            if hasattr(self.container, 'widgets'):
+                self.container.widgets.insert(self)
+
+            self.id = get_widget_id()
+            _WIDGETS[str(tk_widget)] = self
+
+        res = method(*args, **kwargs)
+
+        if profile:
+            profiler.record_widget(self.__class__.__name__, profiler.clock() - start)
+
+        return res
 
     return wrapped
 
 
+def geometry_method(manager):
+    """Build the method that displays a widget with one of the Tkinter geometry managers.
+
+    The method renders the widget by adding it to the DoublyLinkedList `self.container.widget_renders` (see
+    `react.component`), but it only calls Tkinter if the widget isn't already displayed by the same geometry manager
+    with the same options. Tkinter keeps the position of a widget in its manager's order when it is reconfigured
+    with the same options, so skipping the call doesn't change the layout.
+
+    Args:
+        manager (str): Either 'pack', 'place', or 'grid'.
+
+    Returns:
+        (Widget, *Any, **Any) -> None: The method.
+
+    """
+    def method(self, *args, **kwargs):
+        self.container.widget_renders.insert(self)
+
+        if config['profile']:
+            profiler.record_geometry_call(self.container)
+
+        geometry = (manager, args, kwargs)
+
+        if self._geometry != geometry:
+            getattr(getattr(self, self.__class__.__name__.lower()), manager)(*args, **kwargs)
+            self._geometry = geometry
+
+    method.__name__ = manager
+
+    return method
+
+
+def forget_method(manager):
+    """Build the method that stops displaying a widget with one of the Tkinter geometry managers.
+
+    Args:
+        manager (str): Either 'pack', 'place', or 'grid'.
+
+    Returns:
+        (Widget) -> None: The method, which also forgets the geometry remembered by `geometry_method`.
+
+    """
+    def method(self):
+        getattr(getattr(self, self.__class__.__name__.lower()), manager + '_forget')()
+        self._geometry = None
+
+    method.__name__ = manager + '_forget'
+
+    return method
+
+
+_LIFECYCLE_WRAPPERS = {
+    "__init__": init_wrapper,
+}
+"""dict of str: ((FunctionType) -> FunctionType): The only methods of a `Widget` class that get wrapped.
+"""
+
+_VARIABLES = ("StringVar", "IntVar")
+"""tuple of str: The widgets that wrap Tkinter variables, which get a diffing `set` method.
+"""
+
+_NOT_DISPLAYED = _VARIABLES + ("Menu",)
+"""tuple of str: The widgets that are never displayed, and thus don't get the diffing geometry and config methods.
+"""
+
+
 class Widget(type):
     """The meta class that wraps the Tkinter widgets.
 
     """
     def __new__(mcs, class_name, bases, class_dict):
-        """ Connects a new Tkinter widget with the `wrapper` method.
+        """ Connects a new Tkinter widget with its factory and its wrappers.
+
+        Only the methods listed in `_LIFECYCLE_WRAPPERS` get wrapped; all other methods are left untouched. The
+        factory in `_FACTORIES` and the widget type in `react.constants.WIDGET_KEY_MAP` are looked up here once, so
+        that creating a widget doesn't need to inspect its class name. Displayed widgets also get the diffing
+        geometry methods, `forget`, and `config`, while variables get a diffing `set`.
 
         Args:
             class_name (str): The name of the class to be wrapped e.g. 'Frame', 'Mainframe'.
@@ -240,8 +427,8 @@ class Widget(type):
         """
         new_class_dict = {}
         for attributeName, attribute in class_dict.items():
-            if isinstance(attribute, FunctionType):
-                attribute = wrapper(attribute)
+            if isinstance(attribute, FunctionType) and attributeName in _LIFECYCLE_WRAPPERS:
+                attribute = _LIFECYCLE_WRAPPERS[attributeName](attribute)
             new_class_dict[attributeName] = attribute
 
         new_class_dict['__eq__'] = mcs.eq
@@ -249,6 +436,24 @@ class Widget(type):
         if '__getattr__' not in new_class_dict.keys():
             new_class_dict['__getattr__'] = mcs.getattr
 
+        if 'destroy' not in new_class_dict.keys():
+            new_class_dict['destroy'] = mcs.destroy
+
+        if class_name in _FACTORIES:
+            new_class_dict['_factory'] = _FACTORIES[class_name]
+            new_class_dict['type'] = WIDGET_KEY_MAP.get(class_name.lower())
+
+            if class_name in _VARIABLES:
+                new_class_dict.setdefault('set', mcs.set)
+            elif class_name not in _NOT_DISPLAYED:
+                for manager in ('pack', 'place', 'grid'):
+                    new_class_dict.setdefault(manager, geometry_method(manager))
+                    new_class_dict.setdefault(manager + '_forget', forget_method(manager))
+
+                new_class_dict.setdefault('forget', mcs.forget)
+                new_class_dict.setdefault('config', mcs.config)
+                new_class_dict.setdefault('configure', mcs.config)
+
         return type.__new__(mcs, class_name, bases, new_class_dict)
 
     @staticmethod
@@ -256,9 +461,8 @@ class Widget(type):
         """Custom attribute retrieval
 
         Relieves all attribute retrieval to the actual Tkinter widget, except for 'self.__class__.__name__.lower()',
-        which provides direct access to the actual Tkinter widget. Furthermore, this method is responsible
-        for rendering component widgets by adding them to the `Component.widget_renders` Doubly Linked List
-        (see `react.component`) for more info.
+        which provides direct access to the actual Tkinter widget. Rendering component widgets is taken care of by
+        the methods built by `geometry_method` instead.
 
         Args:
             self (Widget): The instance of the class that's an instance of this MetaClass e.g. `Frame`,
@@ -270,14 +474,92 @@ class Widget(type):
                 otherwise.
 
         """
-        if item == 'pack' or item == 'place' or item == 'grid':
-            self.container.widget_renders.insert(self)
-
         if item == self.__class__.__name__.lower():
             return getattr(self, item)
 
         return getattr(getattr(self, self.__class__.__name__.lower()), item)
 
+    @staticmethod
+    def forget(self):
+        """Hide the widget.
+
+        Only the `forget` method of the geometry manager that currently displays the widget gets called, if any.
+
+        Args:
+            self (Widget): The instance of the class that's an instance of this MetaClass e.g. `Frame`,
+                `Entry`.
+
+        """
+        if self._geometry is not None:
+            getattr(self, self._geometry[0] + '_forget')()
+
+    @staticmethod
+    def config(self, *args, **kwargs):
+        """Configure the widget, sending Tkinter only the options that changed.
+
+        Queries i.e. calls with positional arguments or without arguments go straight to Tkinter.
+
+        Args:
+            self (Widget): The instance of the class that's an instance of this MetaClass e.g. `Frame`,
+                `Entry`.
+            *args: Positional arguments for Tkinter's `config`.
+            **kwargs: The options to set.
+
+        Returns:
+            Whatever Tkinter's `config` returns for queries, None otherwise.
+
+        """
+        tk_widget = getattr(self, self.__class__.__name__.lower())
+
+        if len(args) or not len(kwargs):
+            return tk_widget.config(*args, **kwargs)
+
+        changes = dict((key, value) for key, value in kwargs.items()
+                       if key not in self._options or self._options[key] != value)
+
+        if len(changes):
+            tk_widget.config(**changes)
+            self._options.update(changes)
+
+    @staticmethod
+    def set(self, value):
+        """Set the value of a variable, unless it already holds that value.
+
+        Args:
+            self (Widget): The instance of either `StringVar` or `IntVar`.
+            value (str, int): The new value.
+
+        """
+        if self._value is _UNSET or self._value != value:
+            getattr(self, self.__class__.__name__.lower()).set(value)
+            self._value = value
+
+    @staticmethod
+    def destroy(self):
+        """Destroy the widget for good.
+
+        The widget is detached from the component that contains it and from `_WIDGETS`, and the underlying Tkinter
+        widget is destroyed, which also releases any callbacks Tkinter registered for it.
+
+        Args:
+            self (Widget): The instance of the class that's an instance of this MetaClass e.g. `Frame`,
+                `Entry`.
+
+        """
+        container = self.__dict__.get('container')
+
+        if hasattr(container, 'widgets'):
+            container.widgets.remove(self)
+            container.widget_renders.remove(self)
+
+        tk_widget = self.__dict__.get(self.__class__.__name__.lower())
+
+        if tk_widget is not None and hasattr(tk_widget, 'destroy'):
+            if _WIDGETS.get(str(tk_widget)) is self:
+                del _WIDGETS[str(tk_widget)]
+
+            tk_widget.destroy()
+
     @staticmethod
     def eq(self, other):
         """Check for Widget equality.
@@ -305,7 +587,7 @@ class StringVar((Widget("StringVar", (object,), {}))):
         stringvar (Tkinter.StringVar): The actual Tkinter `StringVar` object.
 
     Note:
-        * This widget is not added to `_WIDGETS`
+        * This widget is not registered in `_WIDGETS`
         * All attributes of this class are set through the wrapper function.
 
     """
@@ -313,7 +595,7 @@ class StringVar((Widget("StringVar", (object,), {}))):
         """StringVar constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         """
         pass
@@ -326,7 +608,7 @@ class IntVar((Widget("IntVar", (object,), {}))):
         intvar (Tkinter.IntVar): The actual Tkinter `IntVar` object.
 
     Note:
-        * This widget is not added to `_WIDGETS`
+        * This widget is not registered in `_WIDGETS`
         * All attributes of this class are set through the wrapper function.
 
     """
@@ -334,7 +616,7 @@ class IntVar((Widget("IntVar", (object,), {}))):
         """IntVar constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         """
         pass
@@ -354,7 +636,7 @@ class Mainframe((Widget("Mainframe", (object,), {}))):
         """Mainframe constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -379,7 +661,7 @@ class Frame(Widget("Frame", (object,), {})):
         """Frame constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -403,7 +685,7 @@ class Label(Widget("Label", (object,), {})):
         """Label constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -429,7 +711,7 @@ class Entry(Widget("Entry", (object,), {})):
         """Label constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -466,7 +748,7 @@ class Scale(Widget("Scale", (object,), {})):
         """Scale constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -490,7 +772,7 @@ class Button(Widget("Button", (object,), {})):
         """Button constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -515,7 +797,7 @@ class Scrollbar(Widget("Scrollbar", (object,), {})):
         """Scrollbar constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -539,7 +821,7 @@ class Listbox(Widget("Listbox", (object,), {})):
         """Listbox constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -564,7 +846,7 @@ class Radiobutton(Widget("Radiobutton", (object,), {})):
         """Radiobutton constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -592,7 +874,7 @@ class Checkbutton(Widget("Checkbutton", (object,), {})):
         """Checkbutton constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -626,7 +908,7 @@ class FigureCanvas(Widget("FigureCanvas", (object,), {})):
         """FigureCanvas constructor
 
         Note:
-            The first part of the initialization happens during `Step 2` of `wrapper.wrapped`.
+            The first part of the initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
@@ -680,7 +962,7 @@ class Menu(Widget("Menu", (object,), {})):
         """Menu constructor
 
         Note:
-            The actual initialization happens during `Step 2` of `wrapper.wrapped`.
+            The actual initialization happens during `Step 2` of `init_wrapper.wrapped`.
 
         Args:
             component (Component): The React component that contains this widget.
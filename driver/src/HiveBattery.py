@@ -5,6 +5,11 @@ Creates and runs the GUI. This module should be called to start the GUI.
 
 """
 from __future__ import absolute_import
+from multiprocessing import freeze_support
+
 from src.components.gui import GUI
 
-gui = GUI()
\ No newline at end of file
+if __name__ == '__main__':
+    freeze_support()  #: Lets frozen builds start the analysis worker processes, see `ANALYSIS_PROCESSES`
+
+    gui = GUI()
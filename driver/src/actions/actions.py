@@ -22,9 +22,14 @@ import numpy as np
 from sys import platform
 
 from react.index import NamedTuple
+from react.redux.dispatcher import priority, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
 
 from src.common.log.console_message import *
 from src.common.bytes import bytes as byte_utils
+from src.common.clock import monotonic
+from src.common.data_structures.link_stats import LinkStats
+from src.common.log import trace
+from src.common.log.stage_timer import stage_timer
 from src.config.config import *
 
 
@@ -89,6 +94,10 @@ ACTION_TYPES = NamedTuple(dict(CONNECT='CONNECT', START_EIS='START_EIS', STOP_EI
 """react.data_structures.named_tuple.NamedTuple of str: Used by the reducer to identify actions.
 """
 
+link_stats = LinkStats()
+"""src.common.data_structures.link_stats.LinkStats: The traffic of the USB link during the current EIS sweep.
+"""
+
 
 class USBHandle(object):
     """USB Handle.
@@ -148,7 +157,47 @@ def read(usb_handle, length):
         bytearray: An `length`-sized array with the bytes read at the register.
 
     """
-    return usb_handle.ep_read.read(length, 0)
+    ep_read = usb_handle.ep_read
+    t = monotonic()
+
+    try:
+        read_bytes = ep_read.read(length, 0)
+    except usb.USBError:
+        link_stats.record_bulk_read(0, monotonic() - t)
+        link_stats.record_error()
+        raise
+
+    link_stats.record_bulk_read(len(read_bytes), monotonic() - t)
+
+    return read_bytes
+
+
+def ctrl_transfer(usb_handle, bmRequest, bRequest, wValue, wIndex, data, timeout):
+    """Send a control transfer to the device.
+
+    Args:
+        usb_handle (USBHandle): The usb handle for the device.
+        bmRequest (int): `bmVENDOR_REQUEST` or `bmCONTROL_IN`.
+        bRequest (int): The request e.g. `bUPDATE_EIS`.
+        wValue (int): The value parameter of the request.
+        wIndex (int): The index parameter of the request.
+        data (str, int): The data to send, or the number of bytes to read if `bmRequest` is `bmCONTROL_IN`.
+        timeout (int): The max number of milliseconds to wait for the request.
+
+    Returns:
+        int, bytearray: The number of bytes written, or the bytes read if `bmRequest` is `bmCONTROL_IN`.
+
+    """
+    dev = usb_handle.dev
+    t = monotonic()
+
+    try:
+        return dev.ctrl_transfer(bmRequest, bRequest, wValue, wIndex, data, timeout)
+    except usb.USBError:
+        link_stats.record_error()
+        raise
+    finally:
+        link_stats.record_control_transfer(bRequest, monotonic() - t)
 
 
 def build_response(usb_handle, status_queue, pos, data, final_pos, timeout, action_type, bmRequest, bRequest, freq_id):
@@ -209,11 +258,12 @@ def build_response(usb_handle, status_queue, pos, data, final_pos, timeout, acti
         real_val = bytes(b[::-1])
 
         if pos > 255:
-            n_bytes = usb_handle.dev.ctrl_transfer(bmRequest, bRequest, 255, pos - 255, real_val, timeout)
+            n_bytes = ctrl_transfer(usb_handle, bmRequest, bRequest, 255, pos - 255, real_val, timeout)
         else:
-            n_bytes = usb_handle.dev.ctrl_transfer(bmRequest, bRequest, pos, 0, real_val, timeout)
+            n_bytes = ctrl_transfer(usb_handle, bmRequest, bRequest, pos, 0, real_val, timeout)
 
         if n_bytes != len(real_val):
+            link_stats.record_error()
             res['error'] = ERR_USB_WRITE
             return res
 
@@ -229,7 +279,8 @@ def build_response(usb_handle, status_queue, pos, data, final_pos, timeout, acti
             return res
 
         read_bytes = read(usb_handle, 64)  #: Step 5
-        res = byte_utils.bytes_to_double(read_bytes)
+        with stage_timer.span('decode'):
+            res = byte_utils.bytes_to_double(read_bytes)
 
         if has_content:
             status_queue.push((has_content, freq_id if has_content == sTRANS else status))
@@ -254,9 +305,12 @@ def get_status(usb_handle):
 
     """
     try:
-        status_arr = usb_handle.dev.ctrl_transfer(bmCONTROL_IN, bUPDATE_EIS, 0, 0, 6, 0)
+        status_arr = ctrl_transfer(usb_handle, bmCONTROL_IN, bUPDATE_EIS, 0, 0, 6, 0)
         main_code = status_arr[0]
 
+        if main_code == sERROR:
+            link_stats.record_error()
+
         if main_code == sERROR or main_code == sSIGN or main_code == sTRANS:
             has_content = main_code
 
@@ -278,6 +332,7 @@ def get_status(usb_handle):
         return None, ERR_USB_OTHER
 
 
+@priority(PRIORITY_LOW)
 def check_connection():
     """Make sure device is still connected.
 
@@ -306,6 +361,7 @@ def check_connection():
     return res
 
 
+@priority(PRIORITY_LOW)
 def connect():
     """Attempt connection.
 
@@ -335,7 +391,7 @@ def connect():
                 try:
                     prepare_kernel(usb_handle)
                 except NotImplementedError:
-                    print "%s: Not using OS X, but %s" % (datetime.datetime.now(), platform)
+                    trace.info('usb', "Not using OS X, but %s", platform)
                 dev.set_configuration()
                 cfg = dev.get_active_configuration()
                 interface_number = cfg[(0, 0)].bInterfaceNumber
@@ -378,7 +434,8 @@ def connect():
     return res
 
 
-def start_eis(usb_handle, freq_bytes, amp, amplitude_type, smps, n_pers):
+@priority(PRIORITY_NORMAL)
+def start_eis(usb_handle, plan, amp, amplitude_type, smps, n_pers):
     """Send an EIS request to the device.
 
     Builds a request with all the specified parameters e.g. start frequency, end frequency, amplitude, and starts
@@ -386,14 +443,15 @@ def start_eis(usb_handle, freq_bytes, amp, amplitude_type, smps, n_pers):
 
     Args:
         usb_handle (USBHandle): The usb handle for the device.
-        freq_bytes (str): The 24 bits that represent the target frequencies.
+        plan (src.common.frequency.frequency_plan.FrequencyPlan): The target frequencies.
         amp (int): Amplitude
         amplitude_type (int): 0 for voltage, 1 for current
         smps (int): Number of samples
         n_pers (int): Number of periods
 
     Returns:
-        dict: Contains a success message if the start EIS request was successful, the error and error args otherwise.
+        dict: Contains a success message plus the sweep parameters `(plan, smps, n_pers)` as args if the start
+            EIS request was successful, the error and error args otherwise.
 
     """
     res = dict(type=ACTION_TYPES.START_EIS, error=None, args=None)
@@ -407,15 +465,15 @@ def start_eis(usb_handle, freq_bytes, amp, amplitude_type, smps, n_pers):
         samples = bin(int(np.floor(np.log2(smps))))[2:].zfill(4)
         n_periods = bin(n_pers)[2:].zfill(4)
 
+        freq_bytes = plan.mask
         wVal = freq_bytes + amplitude + samples + n_periods
 
-        print "%s: Frequencies: %s %s" % (datetime.datetime.now(), freq_bytes, hex(int(freq_bytes, 2)).capitalize())
-        print "%s: Amplitude: %s %s" % (datetime.datetime.now(), amplitude, hex(int(amplitude, 2)).capitalize())
-        print "%s: Samples per period: %s %s" % (datetime.datetime.now(), samples, hex(int(samples, 2)).capitalize())
-        print "%s: Number of periods: %s %s" % (datetime.datetime.now(), n_periods, hex(int(n_periods, 2)).capitalize())
-        print "%s: Current ranging: %s %s" % (datetime.datetime.now(), current_ranging,
-                                              hex(int(current_ranging, 2)).capitalize())
-        print "%s: Request: %s (%i bits)" % (datetime.datetime.now(), wVal, len(wVal))
+        if trace.enabled('usb'):
+            for name, field in [("Frequencies", freq_bytes), ("Amplitude", amplitude), ("Samples per period", samples),
+                                ("Number of periods", n_periods), ("Current ranging", current_ranging)]:
+                trace.debug('usb', "%s: %s %s", name, field, hex(int(field, 2)).capitalize())
+
+        trace.info('usb', "Request: %s (%i bits)", wVal, len(wVal))
 
         b = bytearray()  #: Convert request body into a bytearray to be sent to the device.
 
@@ -436,18 +494,24 @@ def start_eis(usb_handle, freq_bytes, amp, amplitude_type, smps, n_pers):
 
             if has_content or status == sERROR:
                 error = status if has_content else ERR_USB_OTHER
-                print "req error: %02X" % error
+                trace.error('usb', "req error: %02X", error)
                 res['error'] = error
 
                 if not has_content:
                     res['args'] = ("check the device's status prior to starting EIS",)
             else:
-                n_bytes = usb_handle.dev.ctrl_transfer(bmVENDOR_REQUEST, bINITIATE_EIS, 0, 0, real_val, 0)
+                link_stats.start_sweep()
+                link_stats.start_frequency(0)
+                stage_timer.start_sweep()
+
+                n_bytes = ctrl_transfer(usb_handle, bmVENDOR_REQUEST, bINITIATE_EIS, 0, 0, real_val, 0)
 
                 if n_bytes != len(real_val):
+                    link_stats.record_error()
                     res['error'] = ERR_USB_WRITE
                 else:
                     res['data'] = [("Successfully sent start request to device.", 0)]
+                    res['args'] = (plan, smps, n_pers)
 
     except usb.USBError:
         res['args'] = ("start EIS",)
@@ -456,6 +520,7 @@ def start_eis(usb_handle, freq_bytes, amp, amplitude_type, smps, n_pers):
     return res
 
 
+@priority(PRIORITY_NORMAL)
 def poll_eis(usb_handle):
     """Status code check action.
 
@@ -473,6 +538,7 @@ def poll_eis(usb_handle):
 
     try:
         has_content, status_code = get_status(usb_handle)
+        link_stats.record_poll(has_content == sSIGN or status_code == sDAV)
 
         if has_content is not None:
             if has_content == sERROR:
@@ -497,6 +563,7 @@ def poll_eis(usb_handle):
     return res
 
 
+@priority(PRIORITY_NORMAL)
 def clear_errors(usb_handle):
     """Clear USB errors action.
 
@@ -514,9 +581,10 @@ def clear_errors(usb_handle):
         if usb.core.find(idVendor=VENDOR_ID, idProduct=PRODUCT_ID) is None:
             res['error'] = ERR_USB_DEVICE_NOT_FOUND
         else:
-            n_bytes = usb_handle.dev.ctrl_transfer(bmVENDOR_REQUEST, bCLEAR_EIS_ERR, 0, 0, 'hello', 0)
+            n_bytes = ctrl_transfer(usb_handle, bmVENDOR_REQUEST, bCLEAR_EIS_ERR, 0, 0, 'hello', 0)
 
             if n_bytes != 5:
+                link_stats.record_error()
                 res['error'] = ERR_USB_WRITE
             else:
                 res['data'] = 'Cleared USB errors!'
@@ -528,10 +596,12 @@ def clear_errors(usb_handle):
     return res
 
 
+@priority(PRIORITY_HIGH)
 def start_eis_data_transfer(usb_handle, status_queue, freq_id):
     """Begin a data transfer.
 
-    Begins the recursion of `build_response`, which handles the actual transfer.
+    Begins the recursion of `build_response`, which handles the actual transfer. Its traffic is counted towards
+    `freq_id` in `link_stats`, and its duration is timed by `stage_timer`.
 
     Args:
         usb_handle (USBHandle): The usb handle for the device.
@@ -543,10 +613,20 @@ def start_eis_data_transfer(usb_handle, status_queue, freq_id):
         dict: Contains the full array of data if the transfer was successful, the error and error args otherwise.
 
     """
-    return build_response(usb_handle, status_queue, 0, [], -1, 0, ACTION_TYPES.START_EIS_DATA_TRANSFER,
-                          bmVENDOR_REQUEST, bINITIATE_EIS_DATA_TRANSFER, freq_id)
+    link_stats.start_frequency(freq_id)
+    stage_timer.mark('transfer')
+
+    res = build_response(usb_handle, status_queue, 0, [], -1, 0, ACTION_TYPES.START_EIS_DATA_TRANSFER,
+                         bmVENDOR_REQUEST, bINITIATE_EIS_DATA_TRANSFER, freq_id)
+
+    if res['error'] is None:
+        link_stats.start_frequency(freq_id + 1)  #: Following polls wait for the next frequency
+        stage_timer.mark('transferred')
+
+    return res
 
 
+@priority(PRIORITY_HIGH)
 def update_usb_status(status):
     """Simulate status code from device.
 
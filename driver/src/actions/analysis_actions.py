@@ -0,0 +1,58 @@
+"""Analysis actions.
+
+Actions reduced by `AnalysisReducer`, which submit the data sets of a sweep to a
+`src.common.analysis_pool.AnalysisPool` and collect their analyses. Just like the USB actions, they return a dict with
+the keys `type`, `data`, `error` and `args`.
+
+.. _src-actions-analysis_actions:
+    https://github.com/hivebattery/gui/blob/master/driver/src/actions/analysis_actions.py
+
+"""
+from __future__ import absolute_import
+
+from react.index import NamedTuple
+from react.redux.dispatcher import priority, PRIORITY_HIGH, PRIORITY_NORMAL
+
+ACTION_TYPES = NamedTuple(dict(ANALYZE_FREQUENCY='ANALYZE_FREQUENCY', COLLECT_ANALYSES='COLLECT_ANALYSES'),
+                          'AnalysisActionTypes')
+"""react.data_structures.named_tuple.NamedTuple of str: Used by the reducer to identify actions.
+"""
+
+
+@priority(PRIORITY_HIGH)
+def analyze_frequency(pool, sweep, freq_id):
+    """Submit the data set of a frequency to be analyzed.
+
+    It runs with a high priority, so that the data set is submitted before the next poll for finished analyses.
+
+    Args:
+        pool (src.common.analysis_pool.AnalysisPool): The pool that analyzes it.
+        sweep (src.common.data_structures.sweep.Sweep): The sweep the data set belongs to.
+        freq_id (int): The id of the frequency.
+
+    Returns:
+        dict: Contains the id of the sweep, and its number of frequencies as args.
+
+    """
+    pool.submit((sweep.id, freq_id), sweep[freq_id][1], sweep.samples_per_period[freq_id])
+
+    return dict(type=ACTION_TYPES.ANALYZE_FREQUENCY, data=sweep.id, error=None, args=len(sweep.plan))
+
+
+@priority(PRIORITY_NORMAL)
+def collect_analyses(pool):
+    """Collect the analyses finished so far.
+
+    Args:
+        pool (src.common.analysis_pool.AnalysisPool): The pool that analyzed them.
+
+    Returns:
+        dict: Contains what `AnalysisPool.drain` returned, or None if no analysis finished.
+
+    """
+    finished = pool.drain()
+
+    if len(finished) == 0:
+        return None
+
+    return dict(type=ACTION_TYPES.COLLECT_ANALYSES, data=finished, error=None, args=None)
@@ -0,0 +1,198 @@
+"""AnalysisPool class definition.
+
+Analyzes the data sets of EIS sweeps off the Tk thread, so that heavier analyses don't add to the GUI's latency. By
+default, the workers are threads: the data sets are passed by reference, and NumPy releases the GIL while it transforms
+them. Worker processes can be used instead to scale with cores when the GIL gets in the way; the data sets are then
+copied into shared memory rather than pickled.
+
+Workers never touch Tkinter nor the store: finished analyses wait in a thread-safe queue until the Tk thread drains it,
+e.g. from the `src.actions.analysis_actions.collect_analyses` action.
+
+.. _src-common-analysis_pool:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/analysis_pool.py
+
+"""
+from __future__ import absolute_import
+
+import ctypes
+import multiprocessing
+from collections import deque
+from functools import partial
+from multiprocessing.pool import ThreadPool
+from Queue import Queue, Empty
+
+import numpy as np
+
+from src.common.clock import monotonic
+from src.config.config import ANALYSIS_WORKERS, ANALYSIS_PROCESSES, N_SAMPLES, N_PERIODS
+from src.methods.analysis import analyze
+
+N_SLOTS = 64
+"""int: The number of data sets the shared memory of worker processes holds at once. Data sets submitted while every
+slot is taken are pickled instead.
+"""
+SLOT_SIZE = 2 * N_SAMPLES * N_PERIODS
+"""int: The number of values of a slot, i.e. of a data set.
+"""
+
+_shared = None
+"""numpy.ndarray of numpy.float32: In a worker process, the shared memory, with one row per slot.
+"""
+
+
+def init_worker(shared):
+    """Initialize a worker process.
+
+    Args:
+        shared (multiprocessing.sharedctypes.RawArray): The shared memory.
+
+    """
+    global _shared
+    _shared = np.frombuffer(shared, dtype=np.float32).reshape(N_SLOTS, SLOT_SIZE)
+
+
+def analyze_rows(data_sets, samples_per_period):
+    """Analyze data sets, timing the analysis.
+
+    Args:
+        data_sets (numpy.ndarray): See `src.methods.analysis.analyze`.
+        samples_per_period (list of int): See `src.methods.analysis.analyze`.
+
+    Returns:
+        (list of src.methods.analysis.Analysis, float, str): The analyses, or None if they failed, the seconds they
+            took, and the error, or None if they succeeded.
+
+    """
+    start = monotonic()
+
+    try:
+        return analyze(data_sets, samples_per_period), monotonic() - start, None
+    except Exception as e:  #: A malformed data set must not bring the worker down
+        return None, monotonic() - start, "%s: %s" % (type(e).__name__, e)
+
+
+def analyze_slot(slot, samples_per_period):
+    """Analyze the data set in a slot of the shared memory. See `analyze_rows`.
+
+    Args:
+        slot (int): The slot.
+        samples_per_period (int): The number of samples per period of the data set.
+
+    """
+    return analyze_rows(_shared[slot:slot + 1], [samples_per_period])
+
+
+class AnalysisPool(object):
+    """Analysis Pool.
+
+    Attributes:
+        __pool (multiprocessing.pool.Pool): The workers, or None to analyze inline.
+        __shared (multiprocessing.sharedctypes.RawArray): The memory shared with worker processes, or None.
+        __slots (numpy.ndarray of numpy.float32): `__shared` as an array with one row per slot, or None.
+        __free_slots (collections.deque of int): The slots not in use.
+        __results (Queue.Queue of (tuple, int, tuple)): The key, the slot (or None) and the result of `analyze_rows` of
+            every finished analysis not drained yet.
+        __pending (int): The number of analyses submitted and not drained yet.
+
+    """
+    def __init__(self, n_workers=ANALYSIS_WORKERS, processes=ANALYSIS_PROCESSES):
+        """AnalysisPool constructor.
+
+        Note:
+            Worker processes are forked right away, so the pool should be created before Tkinter's root.
+
+        Args:
+            n_workers (int, optional): The number of workers, where 0 means analyzing inline. Default is
+                `ANALYSIS_WORKERS`.
+            processes (bool, optional): True for worker processes, False for worker threads. Default is
+                `ANALYSIS_PROCESSES`.
+
+        """
+        self.__pool = None
+        self.__shared = None
+        self.__slots = None
+        self.__free_slots = deque()
+        self.__results = Queue()
+        self.__pending = 0
+
+        if n_workers > 0 and processes:
+            self.__shared = multiprocessing.RawArray(ctypes.c_float, N_SLOTS * SLOT_SIZE)
+            self.__slots = np.frombuffer(self.__shared, dtype=np.float32).reshape(N_SLOTS, SLOT_SIZE)
+            self.__free_slots.extend(xrange(N_SLOTS))
+            self.__pool = multiprocessing.Pool(n_workers, init_worker, (self.__shared,))
+        elif n_workers > 0:
+            self.__pool = ThreadPool(n_workers)
+
+    @property
+    def pending(self):
+        """int: The number of analyses submitted and not drained yet."""
+        return self.__pending
+
+    def submit(self, key, data_set, samples_per_period):
+        """Analyze a data set.
+
+        Args:
+            key (tuple): Identifies the analysis once drained.
+            data_set (numpy.ndarray of numpy.float32): The voltage samples followed by the current samples. Since
+                worker threads read it later, it must not be modified e.g. a row of a `Sweep`.
+            samples_per_period (int): The number of samples per period of the data set.
+
+        """
+        self.__pending += 1
+
+        if self.__pool is None:
+            self.__results.put((key, None, analyze_rows(np.asarray(data_set)[np.newaxis], [samples_per_period])))
+
+            return
+
+        if len(self.__free_slots) and len(data_set) == SLOT_SIZE:
+            slot = self.__free_slots.popleft()
+            self.__slots[slot] = data_set
+            func, args = analyze_slot, (slot, samples_per_period)
+        else:
+            slot = None
+            func, args = analyze_rows, (np.asarray(data_set)[np.newaxis], [samples_per_period])
+
+        self.__pool.apply_async(func, args, callback=partial(self.__finish, key, slot))
+
+    def drain(self):
+        """Collect the analyses finished so far.
+
+        Returns:
+            list of (tuple, src.methods.analysis.Analysis, float, str): The key of each analysis, the analysis (or
+                None if it failed), the seconds it took, and the error (or None if it succeeded).
+
+        """
+        finished = []
+
+        while True:
+            try:
+                key, slot, (analyses, seconds, error) = self.__results.get_nowait()
+            except Empty:
+                break
+
+            if slot is not None:
+                self.__free_slots.append(slot)
+
+            self.__pending -= 1
+            finished.append((key, None if analyses is None else analyses[0], seconds, error))
+
+        return finished
+
+    def close(self):
+        """Stop the workers, dropping the analyses still pending. Data sets submitted afterwards are analyzed inline."""
+        if self.__pool is not None:
+            self.__pool.terminate()
+            self.__pool.join()
+            self.__pool = None
+
+    def __finish(self, key, slot, result):
+        """Queue a finished analysis. Called by the pool's result handler thread.
+
+        Args:
+            key (tuple): The key of the analysis.
+            slot (int): The slot of the data set, or None.
+            result (tuple): What `analyze_rows` returned.
+
+        """
+        self.__results.put((key, slot, result))
@@ -2,20 +2,14 @@
 
 Provides certain helper functions to perform operations on bytearrays and other data types.
 
-Todo:
-    * Get rid of src.common.linear_algebra altogether.
-
 .. _src-common-bytes:
     https://github.com/hivebattery/gui/blob/master/driver/src/common/bytes/bytes.py
 
 """
 from __future__ import division
 from __future__ import absolute_import
-import re
 import numpy as np
 
-from src.common.linear_algebra import matrix
-
 TRAILING_ZERO_BITS_RIGHT = [32, 0, 1, 26, 2, 23, 27, 0, 3, 16, 24, 30, 28, 11, 0, 13, 4, 7, 17, 0, 25, 22, 31, 15, 29,
                             10, 12, 6, 0, 21, 14, 9, 5, 20, 8, 19, 18]
 """list of int: Provides a way to calculate the number of trailing zero bits to the right in constant time. Given a
@@ -132,42 +126,6 @@ def get_binary_limits(a, b, f=1.0):
     return int(x), int(y)
 
 
-def get_num_chained_zero_bits(left, right):
-    """Get the length of the largest chain of zeroes between two binary strings.
-
-    Given two binary strings, check how many zeroes can be chained when the two string are put together.
-
-    Example:
-        The binary strings '101000100' and '0000100' would return 6, because the concatenated string
-        '1010001000000100' contains a chain of 6 zeroes between the two strings.
-
-    Args:
-        left (str): The binary string to be concatenated from the left. In our example, `left = '101000100'`.
-        right (str): The binary string to be concatenated from the right. In our example, `right = '0000100'`
-
-    Returns:
-        int: The number of zeroes in the largest bewteen the two binary strings. In our example, 6.
-
-    """
-    if int(left[-1], 10) == 0:
-        if int(left, 2) == 0:
-            m = len(left)
-        else:
-            m = TRAILING_ZERO_BITS_RIGHT[(-int(left, 2) & int(left, 2)) % 37]
-    else:
-        m = 0
-
-    if int(right[0], 10) == 0:
-        if int(right, 2) == 0:
-            n = len(right)
-        else:
-            n = TRAILING_ZERO_BITS_RIGHT[(-int(right[::-1], 2) & int(right[::-1], 2)) % 37]
-    else:
-        n = 0
-
-    return m, n
-
-
 def balance_binary_string(a, b, n_bits, f=1.0):
     """Evenly distribute ones between two powers of two.
 
@@ -215,13 +173,14 @@ def map_ones_to_decimal(byte, factor=1.0):
         list of float: The frequencies encoded by the binary string.
 
     """
-    offset = TRAILING_ZERO_BITS_RIGHT[(-int(byte, 2) & int(byte, 2)) % 37]
+    value = int(byte, 2)
+    offset = TRAILING_ZERO_BITS_RIGHT[(-value & value) % 37]
 
     n = 1 << offset
     nums = []
 
     for i in range(len(byte) - offset):
-        if n & int(byte, 2):
+        if n & value:
             nums.append(str(n * factor))
 
         n <<= 1
@@ -235,6 +194,11 @@ def distribute_bits(bits, max_bits):
     Given two numbers that don't necessarily need to be integers, distribute the specified number of 1's amongst the
     powers of 2 between the two numbers. This method takes care of the middle bits, and excludes the bounds.
 
+    The 1's split the `max_bits - bits` 0's, plus the bounds, into `bits + 1` runs of 0's. Minimizing the sum of the
+    cubes of the lengths of these runs, a convex function, means making all runs equally long give or take one 0,
+    which this method does in O(max_bits) time by giving run `i` the 0's between `i * zeros // runs` and
+    `(i + 1) * zeros // runs`, so that the longer runs are spread evenly too.
+
     Args:
         bits (int): The number of 1's to distribute.
         max_bits (int): The length of the binary string where the 1's will be distributed.
@@ -243,92 +207,7 @@ def distribute_bits(bits, max_bits):
         str: The binary string with 1's distributed.
 
     """
-    n_bits = bits if max_bits > bits * 2 else max_bits - bits
-
-    if n_bits == 0:
-        curr_bit = "0" if max_bits > bits * 2 else "1"
-        return "".join([curr_bit for i in range(max_bits)])
-
-    N = matrix.Matrix(n_bits + 1, max_bits + 1)
-    E = matrix.Matrix(n_bits + 1, max_bits + 1)
-
-    for i in range(n_bits + 1):
-        for j in range(max_bits + 1):
-            e = ""
-            if i == 0:
-                n = j**3
-                e += bin(0)[2:].zfill(j)
-
-            elif j == 0:
-                n = 0
-                e += "1"
-            else:
-                n = -1
-
-            N.set_value(i, j, n)
-            E.set_value(i, j, e)
-
-    N.set_value(1, 1, 0)
-    E.set_value(1, 1, "1")
-
-    for i in range(1, n_bits + 1):
-        for k in range(i, max_bits + 1):
-            if i == 1 and k == 1:
-                continue
-
-            q = float("inf")
-            q_e = ""
-
-            for j in range(1, k):
-                for l in range(1, i + 1):
-                    first_half = N.get_value(l, j)
-                    second_half = N.get_value(i - l, k - j)
-
-                    val = first_half + second_half
-
-                    if val < q:
-                        left = E.get_value(l, j)
-                        right = E.get_value(i - l, k - j)
-
-                        reps = 0
-                        while reps < 4 and int(left[-1], 10) == 0 and int(right[0], 10) == 0:
-                            if reps % 2 == 1:
-                                right = right[::-1]
-
-                            left = left[::-1]
-                            reps += 1
-
-                        if int(left[-1], 10) == 0 and int(right[0], 10) == 0:
-                            le = left
-                            r = right
-
-                            init_val = val
-                            min_val = float("inf")
-
-                            for x in range(4):
-                                m, n = get_num_chained_zero_bits(le, r)
-                                v = init_val - m ** 3 - n ** 3 + (m + n) ** 3
-
-                                if v < min_val:
-                                    min_val = v
-                                    left = le
-                                    right = r
-
-                                if x % 2 == 1:
-                                    r = r[::-1]
-
-                                le = le[::-1]
-
-                            val = min_val
-
-                        if val < q:
-                            q = val
-                            q_e = left + right
-
-            N.set_value(i, k, q)
-            E.set_value(i, k, q_e)
-
-    distribution = E.get_value(n_bits, max_bits)
+    zeros = max_bits - bits
+    runs = bits + 1
 
-    return distribution if max_bits > 2 * bits \
-        else re.sub(u'#', u'0', re.sub(u'0', u'1', re.sub(u'1', u'#', distribution)))
\ No newline at end of file
+    return "1".join("0" * ((i + 1) * zeros // runs - i * zeros // runs) for i in xrange(runs))
@@ -0,0 +1,123 @@
+"""Monotonic Clock.
+
+Python 2 has no `time.monotonic`, and `datetime.now` and `time.time` follow the wall clock, which can jump e.g. when
+the system time is synchronized. This module reads the operating system's high-resolution monotonic clock through
+`ctypes` instead, falling back to `timeit.default_timer` where it isn't available.
+
+.. _src-common-clock:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/clock.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import ctypes
+import ctypes.util
+import timeit
+from sys import platform
+
+CLOCK_MONOTONIC = 1
+"""int: The id of the monotonic clock for `clock_gettime` on Linux.
+"""
+
+
+class Timespec(ctypes.Structure):
+    """`struct timespec`, as filled by `clock_gettime`."""
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+
+class MachTimebaseInfo(ctypes.Structure):
+    """`struct mach_timebase_info`, as filled by `mach_timebase_info`."""
+    _fields_ = [('numer', ctypes.c_uint32), ('denom', ctypes.c_uint32)]
+
+
+def get_linux_clock():
+    """Build a clock reading `CLOCK_MONOTONIC`.
+
+    Returns:
+        () -> float: The clock, in seconds.
+
+    """
+    librt = ctypes.CDLL(ctypes.util.find_library('rt') or ctypes.util.find_library('c'), use_errno=True)
+    clock_gettime = librt.clock_gettime
+    clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(Timespec)]
+    ts = Timespec()
+
+    def clock():
+        if clock_gettime(CLOCK_MONOTONIC, ctypes.byref(ts)) != 0:
+            raise OSError(ctypes.get_errno(), "clock_gettime failed")
+
+        return ts.tv_sec + ts.tv_nsec * 1e-9
+
+    return clock
+
+
+def get_darwin_clock():
+    """Build a clock reading `mach_absolute_time`.
+
+    Returns:
+        () -> float: The clock, in seconds.
+
+    """
+    libc = ctypes.CDLL(ctypes.util.find_library('c'))
+    mach_absolute_time = libc.mach_absolute_time
+    mach_absolute_time.restype = ctypes.c_uint64
+
+    timebase = MachTimebaseInfo()
+    libc.mach_timebase_info(ctypes.byref(timebase))
+    scale = timebase.numer / timebase.denom * 1e-9
+
+    return lambda: mach_absolute_time() * scale
+
+
+def get_windows_clock():
+    """Build a clock reading `QueryPerformanceCounter`.
+
+    Returns:
+        () -> float: The clock, in seconds.
+
+    """
+    kernel32 = ctypes.windll.kernel32
+    frequency = ctypes.c_int64()
+    counter = ctypes.c_int64()
+
+    kernel32.QueryPerformanceFrequency(ctypes.byref(frequency))
+    scale = 1 / frequency.value
+
+    def clock():
+        kernel32.QueryPerformanceCounter(ctypes.byref(counter))
+
+        return counter.value * scale
+
+    return clock
+
+
+def get_clock():
+    """Build the best monotonic clock available on this platform.
+
+    Returns:
+        () -> float: The clock, in seconds.
+
+    """
+    try:
+        if platform.startswith('linux'):
+            clock = get_linux_clock()
+        elif platform == 'darwin':
+            clock = get_darwin_clock()
+        elif platform == 'win32':
+            clock = get_windows_clock()
+        else:
+            return timeit.default_timer
+
+        clock()
+
+        return clock
+
+    except (AttributeError, OSError, TypeError):
+        return timeit.default_timer
+
+
+monotonic = get_clock()
+"""() -> float: Seconds elapsed since an arbitrary point, which never goes backwards. Only differences between
+readings are meaningful.
+"""
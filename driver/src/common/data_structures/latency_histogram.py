@@ -0,0 +1,135 @@
+"""LatencyHistogram class definition.
+
+.. _src-common-data_structures-latency_histogram:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/data_structures/latency_histogram.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import math
+
+N_BUCKETS = 32
+"""int: The number of buckets, enough for latencies from 1 microsecond to over an hour.
+"""
+BUCKET_UNIT = 1e-6
+"""float: The upper bound of the first bucket, in seconds.
+"""
+
+
+def get_bucket(seconds):
+    """Find the bucket of a latency.
+
+    Args:
+        seconds (float): The latency.
+
+    Returns:
+        int: The bucket `i` such that the latency is in :math:`[2^{i - 1}, 2^i)` microseconds, or 0 if it's under a
+            microsecond.
+
+    """
+    if seconds < BUCKET_UNIT:
+        return 0
+
+    return min(int(math.floor(math.log(seconds / BUCKET_UNIT, 2))) + 1, N_BUCKETS - 1)
+
+
+class LatencyHistogram(object):
+    """Latency Histogram.
+
+    Counts latencies in buckets whose bounds double, so that recording takes constant time and space no matter how
+    many latencies are recorded, while the relative error of a percentile stays under a factor of 2. The exact count,
+    total, minimum and maximum are kept too.
+
+    Attributes:
+        __buckets (list of int): The number of latencies in each bucket.
+        __count (int): The number of latencies recorded.
+        __total (float): The sum of the latencies recorded, in seconds.
+        __min (float): The smallest latency recorded, in seconds.
+        __max (float): The largest latency recorded, in seconds.
+
+    """
+    def __init__(self):
+        """LatencyHistogram constructor."""
+        self.__buckets = [0] * N_BUCKETS
+        self.__count = 0
+        self.__total = 0.
+        self.__min = float('inf')
+        self.__max = 0.
+
+    def __len__(self):
+        """Count the latencies recorded.
+
+        Returns:
+            int: `self.count`.
+
+        """
+        return self.__count
+
+    @property
+    def count(self):
+        """int: The number of latencies recorded."""
+        return self.__count
+
+    @property
+    def total(self):
+        """float: The sum of the latencies recorded, in seconds."""
+        return self.__total
+
+    @property
+    def mean(self):
+        """float: The mean latency, in seconds, or 0 if nothing was recorded."""
+        return self.__total / self.__count if self.__count > 0 else 0.
+
+    @property
+    def min(self):
+        """float: The smallest latency recorded, in seconds, or 0 if nothing was recorded."""
+        return self.__min if self.__count > 0 else 0.
+
+    @property
+    def max(self):
+        """float: The largest latency recorded, in seconds."""
+        return self.__max
+
+    @property
+    def buckets(self):
+        """list of int: The number of latencies in each bucket. See `get_bucket`."""
+        return list(self.__buckets)
+
+    def add(self, seconds):
+        """Record a latency.
+
+        Args:
+            seconds (float): The latency.
+
+        """
+        self.__buckets[get_bucket(seconds)] += 1
+        self.__count += 1
+        self.__total += seconds
+        self.__min = min(self.__min, seconds)
+        self.__max = max(self.__max, seconds)
+
+    def percentile(self, p):
+        """Estimate a percentile.
+
+        Args:
+            p (float): The percentile, from 0 to 100.
+
+        Returns:
+            float: The upper bound of the bucket holding the percentile, clamped to the exact minimum and maximum, in
+                seconds, or 0 if nothing was recorded.
+
+        """
+        if self.__count == 0:
+            return 0.
+
+        rank = max(1, int(math.ceil(p / 100 * self.__count)))
+        seen = 0
+
+        for i, count in enumerate(self.__buckets):
+            seen += count
+
+            if seen >= rank:
+                return min(max(BUCKET_UNIT * 2 ** i, self.__min), self.__max)
+
+        return self.__max
@@ -0,0 +1,172 @@
+"""LinkStats class definition.
+
+.. _src-common-data_structures-link_stats:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/data_structures/link_stats.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+
+class LinkCounters(object):
+    """Link Counters.
+
+    The traffic of the USB link during some span of time, e.g. the transfer of a single frequency or a whole EIS sweep.
+
+    Attributes:
+        control_transfers (dict of int: int): The number of control transfers sent, keyed by `bRequest`.
+        bulk_reads (int): The number of reads of the BULK IN endpoint.
+        bytes_received (int): The number of bytes read from the BULK IN endpoint.
+        blocked_time (float): The number of seconds spent waiting for pyUSB.
+        poll_hits (int): The number of status polls that found the device had something new, e.g. data available.
+        poll_misses (int): The number of status polls that found the device busy or idle.
+        errors (int): The number of USB errors, short writes, and error status codes sent by the device.
+
+    """
+    def __init__(self):
+        """LinkCounters constructor."""
+        self.control_transfers = dict()
+        self.bulk_reads = 0
+        self.bytes_received = 0
+        self.blocked_time = 0.
+        self.poll_hits = 0
+        self.poll_misses = 0
+        self.errors = 0
+
+    @property
+    def n_control_transfers(self):
+        """int: The number of control transfers sent, regardless of their `bRequest`."""
+        return sum(self.control_transfers.itervalues())
+
+    @property
+    def throughput(self):
+        """float: The number of bytes received per second spent waiting for pyUSB, or 0 if no time was spent."""
+        return self.bytes_received / self.blocked_time if self.blocked_time > 0 else 0.
+
+    def add(self, counters):
+        """Add the counts of other counters to these.
+
+        Args:
+            counters (LinkCounters): The counters to add.
+
+        """
+        for request, count in counters.control_transfers.iteritems():
+            self.control_transfers[request] = self.control_transfers.get(request, 0) + count
+
+        self.bulk_reads += counters.bulk_reads
+        self.bytes_received += counters.bytes_received
+        self.blocked_time += counters.blocked_time
+        self.poll_hits += counters.poll_hits
+        self.poll_misses += counters.poll_misses
+        self.errors += counters.errors
+
+    def __str__(self):
+        """Stringify the counters.
+
+        Returns:
+            str: A one-line summary of the counters.
+
+        """
+        return "%i control transfers, %i bulk reads, %i bytes in %.1f ms (%.1f kB/s), %i/%i poll hits, %i errors" % \
+               (self.n_control_transfers, self.bulk_reads, self.bytes_received, self.blocked_time * 1000,
+                self.throughput / 1000, self.poll_hits, self.poll_hits + self.poll_misses, self.errors)
+
+
+class LinkStats(object):
+    """Link Stats.
+
+    Keeps `LinkCounters` for the current EIS sweep, both per frequency and for the whole sweep. Every event is counted
+    towards the frequency currently being waited for or transferred, which is chosen by `start_frequency`. Events that
+    happen outside a sweep e.g. connection checks are only counted towards the sweep's counters.
+
+    Attributes:
+        __sweep (LinkCounters): The counters of the whole sweep.
+        __frequencies (dict of int: LinkCounters): The counters of each frequency, keyed by frequency id.
+        __current (LinkCounters): The counters of the current frequency, or None if there is no current frequency.
+
+    """
+    def __init__(self):
+        """LinkStats constructor."""
+        self.__sweep = LinkCounters()
+        self.__frequencies = dict()
+        self.__current = None
+
+    @property
+    def sweep(self):
+        """LinkCounters: The counters of the whole sweep."""
+        return self.__sweep
+
+    @property
+    def frequencies(self):
+        """dict of int: LinkCounters: The counters of each frequency, keyed by frequency id."""
+        return self.__frequencies
+
+    def start_sweep(self):
+        """Forget the counters of the previous sweep."""
+        self.__sweep = LinkCounters()
+        self.__frequencies = dict()
+        self.__current = None
+
+    def start_frequency(self, freq_id):
+        """Count the following events towards a frequency.
+
+        Args:
+            freq_id (int): The id of the frequency.
+
+        """
+        if freq_id not in self.__frequencies:
+            self.__frequencies[freq_id] = LinkCounters()
+
+        self.__current = self.__frequencies[freq_id]
+
+    def __counters(self):
+        """Get the counters every event is counted towards.
+
+        Returns:
+            list of LinkCounters: The counters of the sweep and of the current frequency, if any.
+
+        """
+        return [self.__sweep] if self.__current is None else [self.__sweep, self.__current]
+
+    def record_control_transfer(self, request, seconds):
+        """Count a control transfer.
+
+        Args:
+            request (int): Its `bRequest`.
+            seconds (float): The time spent waiting for it.
+
+        """
+        for counters in self.__counters():
+            counters.control_transfers[request] = counters.control_transfers.get(request, 0) + 1
+            counters.blocked_time += seconds
+
+    def record_bulk_read(self, n_bytes, seconds):
+        """Count a read of the BULK IN endpoint.
+
+        Args:
+            n_bytes (int): The number of bytes read.
+            seconds (float): The time spent waiting for it.
+
+        """
+        for counters in self.__counters():
+            counters.bulk_reads += 1
+            counters.bytes_received += n_bytes
+            counters.blocked_time += seconds
+
+    def record_poll(self, hit):
+        """Count a status poll.
+
+        Args:
+            hit (bool): True if the device had something new, False if it was busy or idle.
+
+        """
+        for counters in self.__counters():
+            if hit:
+                counters.poll_hits += 1
+            else:
+                counters.poll_misses += 1
+
+    def record_error(self):
+        """Count an error."""
+        for counters in self.__counters():
+            counters.errors += 1
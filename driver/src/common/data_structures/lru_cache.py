@@ -0,0 +1,106 @@
+"""LRUCache class definition.
+
+.. _src-common-lru_cache:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/data_structures/lru_cache.py
+
+"""
+from __future__ import absolute_import
+
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """LRUCache.
+
+    A mapping with a fixed capacity: once full, storing a new key evicts the least recently used one. Both reads and
+    writes count as a use.
+
+    Attributes:
+        capacity (int): The maximum number of keys.
+        hits (int): The number of successful lookups.
+        misses (int): The number of failed lookups.
+
+    """
+    def __init__(self, capacity):
+        """LRUCache constructor.
+
+        Args:
+            capacity (int): `self.capacity`.
+
+        Raises:
+            ValueError: If `capacity` is not positive.
+
+        """
+        if capacity < 1:
+            raise ValueError('LRUCache capacity must be positive, got %i' % capacity)
+
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+
+        self.__items = OrderedDict()
+
+    def __len__(self):
+        """Count the keys.
+
+        Returns:
+            int: The number of keys currently stored.
+
+        """
+        return len(self.__items)
+
+    def __contains__(self, key):
+        """Check whether a key is stored, without counting as a use.
+
+        Args:
+            key: Any hashable object.
+
+        Returns:
+            bool: True if `key` is stored, False otherwise.
+
+        """
+        return key in self.__items
+
+    def get(self, key, default=None):
+        """Look up a key, marking it as the most recently used.
+
+        Args:
+            key: Any hashable object.
+            default (optional): The value returned if `key` isn't stored. Default is None.
+
+        Returns:
+            The value stored under `key`, or `default`.
+
+        """
+        try:
+            value = self.__items.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.__items[key] = value
+        self.hits += 1
+
+        return value
+
+    def put(self, key, value):
+        """Store a value, marking its key as the most recently used.
+
+        Args:
+            key: Any hashable object.
+            value: The value to store.
+
+        """
+        self.__items.pop(key, None)
+        self.__items[key] = value
+
+        if len(self.__items) > self.capacity:
+            self.__items.popitem(last=False)
+
+    def clear(self):
+        """Remove all keys and reset the statistics.
+
+        """
+        self.__items.clear()
+        self.hits = 0
+        self.misses = 0
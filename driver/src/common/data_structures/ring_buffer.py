@@ -0,0 +1,123 @@
+"""RingBuffer class definition.
+
+.. _src-common-ring_buffer:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/data_structures/ring_buffer.py
+
+"""
+from __future__ import absolute_import
+
+
+class RingBuffer(object):
+    """RingBuffer.
+
+    A fixed-capacity FIFO backed by a preallocated list: once full, appending a new item evicts the oldest one. Items
+    are indexed from the oldest (index 0) to the newest (index `len(self) - 1`).
+
+    Attributes:
+        capacity (int): The maximum number of items.
+
+    """
+    def __init__(self, capacity):
+        """RingBuffer constructor.
+
+        Args:
+            capacity (int): `self.capacity`.
+
+        Raises:
+            ValueError: If `capacity` is not positive.
+
+        """
+        if capacity < 1:
+            raise ValueError('RingBuffer capacity must be positive, got %i' % capacity)
+
+        self.capacity = capacity
+
+        self.__items = [None] * capacity
+        self.__start = 0
+        self.__size = 0
+
+    def __len__(self):
+        """Count the items.
+
+        Returns:
+            int: The number of items currently stored.
+
+        """
+        return self.__size
+
+    def __iter__(self):
+        """RingBuffer iterator.
+
+        Yields:
+            The items, from the oldest to the newest.
+
+        """
+        for i in xrange(self.__size):
+            yield self.__items[(self.__start + i) % self.capacity]
+
+    def __getitem__(self, i):
+        """Retrieve an item by index.
+
+        Args:
+            i (int): The index, which can be negative.
+
+        Returns:
+            The item at index `i`.
+
+        Raises:
+            IndexError: If `i` is out of range.
+
+        """
+        if i < 0:
+            i += self.__size
+
+        if not 0 <= i < self.__size:
+            raise IndexError('RingBuffer index out of range')
+
+        return self.__items[(self.__start + i) % self.capacity]
+
+    def append(self, item):
+        """Append a new item.
+
+        Args:
+            item: The item to append.
+
+        Returns:
+            The item evicted to make room for `item`, or None if the buffer wasn't full.
+
+        """
+        evicted = None
+
+        if self.__size == self.capacity:
+            evicted = self.__items[self.__start]
+            self.__items[self.__start] = item
+            self.__start = (self.__start + 1) % self.capacity
+        else:
+            self.__items[(self.__start + self.__size) % self.capacity] = item
+            self.__size += 1
+
+        return evicted
+
+    def window(self, start, stop):
+        """Retrieve a range of items.
+
+        Args:
+            start (int): The index of the first item, which is clamped to the buffer's range.
+            stop (int): The index right after the last item, which is clamped to the buffer's range.
+
+        Returns:
+            list: The items in the range, from the oldest to the newest.
+
+        """
+        start = max(start, 0)
+        stop = min(stop, self.__size)
+
+        return [self.__items[(self.__start + i) % self.capacity] for i in xrange(start, stop)]
+
+    def clear(self):
+        """Remove all items.
+
+        """
+        self.__items = [None] * self.capacity
+        self.__start = 0
+        self.__size = 0
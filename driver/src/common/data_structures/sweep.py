@@ -0,0 +1,302 @@
+"""Sweep class definition.
+
+.. _src-common-sweep:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/data_structures/sweep.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import itertools
+import numpy as np
+
+from src.methods import fourier
+
+_versions = itertools.count(1)
+"""itertools.count: Gives each new `Sweep` snapshot a unique version number.
+"""
+_ids = itertools.count(1)
+"""itertools.count: Gives each new sweep a unique id, shared by all its snapshots.
+"""
+
+
+class _SweepBuffer(object):
+    """The storage shared by consecutive `Sweep` snapshots.
+
+    Attributes:
+        id (int): The id of the sweep, kept by copies.
+        values (numpy.ndarray of numpy.float32): One row per frequency with its voltage samples followed by its current
+            samples. Allocated when the first data set arrives, with one row per frequency requested.
+        timestamps (list of datetime): When each data set arrived.
+        impedances (dict of int: complex): The impedance of each row computed so far.
+        length (int): The number of rows filled.
+
+    """
+    def __init__(self, n_freqs):
+        """_SweepBuffer constructor.
+
+        Args:
+            n_freqs (int): The number of frequencies requested, i.e. the initial number of rows.
+
+        """
+        self.id = next(_ids)
+        self.n_freqs = n_freqs
+        self.values = None
+        self.timestamps = []
+        self.impedances = {}
+        self.length = 0
+
+    def copy(self, length):
+        """Copy the first rows of the buffer.
+
+        Args:
+            length (int): The number of rows to copy.
+
+        Returns:
+            _SweepBuffer: A new buffer with the same capacity.
+
+        """
+        buf = _SweepBuffer(self.n_freqs)
+        buf.id = self.id
+
+        if self.values is not None:
+            buf.values = self.values.copy()
+
+        buf.timestamps = self.timestamps[:length]
+        buf.impedances = dict((i, z) for i, z in self.impedances.items() if i < length)
+        buf.length = length
+
+        return buf
+
+    def append(self, timestamp, data_set):
+        """Fill the next row.
+
+        Args:
+            timestamp (datetime): When the data set arrived.
+            data_set (list of float): The voltage samples followed by the current samples.
+
+        Raises:
+            ValueError: If the data set's size differs from the previous ones.
+
+        """
+        if self.values is None:
+            self.values = np.empty((max(self.n_freqs, 1), len(data_set)), dtype=np.float32)
+        elif len(data_set) != self.values.shape[1]:
+            raise ValueError('Expected %i values per frequency, got %i' % (self.values.shape[1], len(data_set)))
+
+        if self.length == self.values.shape[0]:  #: more data sets than frequencies requested
+            self.values = np.concatenate((self.values, np.empty_like(self.values)))
+
+        self.values[self.length] = data_set
+        self.timestamps.append(timestamp)
+        self.length += 1
+
+
+class Sweep(object):
+    """Sweep.
+
+    The data of an EIS sweep, stored as contiguous float32 arrays together with the metadata of each frequency, and
+    shared by the reducer, the plot, and the csv writer without copies. Just like
+    `src.common.data_structures.sweep_log.SweepLog`, a `Sweep` is an immutable snapshot: appending a data set returns a
+    new snapshot that shares the same storage in constant time, and each snapshot has a unique version.
+
+    Derived data i.e. the voltage and current of each frequency and its impedance are computed on demand; the former
+    are views of the storage and the latter is computed only once per frequency.
+
+    Attributes:
+        plan (src.common.frequency.frequency_plan.FrequencyPlan): The frequencies requested.
+        frequencies (numpy.ndarray of float): The frequencies requested, in mHz.
+        samples_per_period (numpy.ndarray of int): The number of samples per period of each frequency.
+        n_samples (int): The number of samples requested.
+        n_periods (int): The number of periods requested.
+        version (int): Unique among all snapshots, so that comparing versions tells whether two snapshots differ.
+
+    """
+    def __init__(self, plan, n_samples, n_periods, buf=None, length=0):
+        """Sweep constructor.
+
+        Note:
+            Create an empty sweep with `Sweep(plan, n_samples, n_periods)`; the other arguments are meant for `append`
+            only.
+
+        Args:
+            plan (src.common.frequency.frequency_plan.FrequencyPlan): `self.plan`.
+            n_samples (int): `self.n_samples`.
+            n_periods (int): `self.n_periods`.
+            buf (_SweepBuffer, optional): The storage shared with other snapshots. Default is None, which means new
+                storage.
+            length (int, optional): The number of frequencies in `buf` that this snapshot can see. Default is 0.
+
+        """
+        self.plan = plan
+        self.frequencies = plan.frequencies
+        self.samples_per_period = plan.samples_per_period
+        self.n_samples = n_samples
+        self.n_periods = n_periods
+        self.version = next(_versions)
+
+        self.__buf = _SweepBuffer(len(plan)) if buf is None else buf
+        self.__length = length
+
+    def __len__(self):
+        """Count the frequencies received.
+
+        Returns:
+            int: The number of data sets in this snapshot.
+
+        """
+        return self.__length
+
+    def __iter__(self):
+        """Sweep iterator.
+
+        Yields:
+            (datetime, numpy.ndarray of numpy.float32): The timestamp and the samples of each frequency received.
+
+        """
+        for i in xrange(self.__length):
+            yield self[i]
+
+    def __getitem__(self, i):
+        """Retrieve a frequency's data set.
+
+        Args:
+            i (int): The frequency's index, which can be negative.
+
+        Returns:
+            (datetime, numpy.ndarray of numpy.float32): The timestamp and a read-only view of the samples.
+
+        """
+        i = self.__index(i)
+
+        return self.__buf.timestamps[i], self.__row(i)
+
+    def __index(self, i):
+        """Validate an index.
+
+        Args:
+            i (int): The index, which can be negative.
+
+        Returns:
+            int: The equivalent non-negative index.
+
+        Raises:
+            IndexError: If `i` is out of this snapshot's range.
+
+        """
+        if i < 0:
+            i += self.__length
+
+        if not 0 <= i < self.__length:
+            raise IndexError('Sweep index out of range')
+
+        return i
+
+    def __row(self, i):
+        """A read-only view of a row in the storage.
+
+        Args:
+            i (int): A valid, non-negative index.
+
+        Returns:
+            numpy.ndarray of numpy.float32: The voltage samples followed by the current samples.
+
+        """
+        row = self.__buf.values[i]
+        row.flags.writeable = False
+
+        return row
+
+    @property
+    def id(self):
+        """int: The id of the sweep, shared by all its snapshots."""
+        return self.__buf.id
+
+    @property
+    def timestamps(self):
+        """list of datetime: When each data set in this snapshot arrived."""
+        return self.__buf.timestamps[:self.__length]
+
+    def voltage(self, i):
+        """The voltage samples of a frequency.
+
+        Args:
+            i (int): The frequency's index, which can be negative.
+
+        Returns:
+            numpy.ndarray of numpy.float32: A read-only view.
+
+        """
+        row = self.__row(self.__index(i))
+
+        return row[:len(row) // 2]
+
+    def current(self, i):
+        """The current samples of a frequency.
+
+        Args:
+            i (int): The frequency's index, which can be negative.
+
+        Returns:
+            numpy.ndarray of numpy.float32: A read-only view.
+
+        """
+        row = self.__row(self.__index(i))
+
+        return row[len(row) // 2:]
+
+    def impedance(self, i):
+        """The impedance of a frequency, computed the first time it's requested.
+
+        Args:
+            i (int): The frequency's index, which can be negative.
+
+        Returns:
+            complex: The impedance.
+
+        """
+        i = self.__index(i)
+        impedances = self.__buf.impedances
+
+        if i not in impedances:
+            impedances[i] = fourier.get_impedance(self.__row(i), self.samples_per_period[i])
+
+        return impedances[i]
+
+    def impedances(self):
+        """The impedance of every frequency in this snapshot.
+
+        The impedances not computed yet are computed in a single batch.
+
+        Returns:
+            list of complex: The impedances, in the order the frequencies were received.
+
+        """
+        impedances = self.__buf.impedances
+        missing = [i for i in xrange(self.__length) if i not in impedances]
+
+        if len(missing):
+            batch = fourier.get_impedances(self.__buf.values[missing], self.samples_per_period[missing])
+            impedances.update(zip(missing, batch))
+
+        return [impedances[i] for i in xrange(self.__length)]
+
+    def append(self, timestamp, data_set):
+        """Append the data set of the next frequency.
+
+        Args:
+            timestamp (datetime): When the data set arrived.
+            data_set (list of float): The voltage samples followed by the current samples.
+
+        Returns:
+            Sweep: A new snapshot that includes the data set. This snapshot is left untouched.
+
+        """
+        buf = self.__buf
+
+        if buf.length != self.__length:  #: a newer snapshot already appended to the shared storage
+            buf = buf.copy(self.__length)
+
+        buf.append(timestamp, data_set)
+
+        return Sweep(self.plan, self.n_samples, self.n_periods, buf, self.__length + 1)
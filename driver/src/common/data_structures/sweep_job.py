@@ -0,0 +1,306 @@
+"""SweepJob and JobQueue class definitions.
+
+A sweep job holds the same parameters the form does, plus how many times to run the sweep, how long to wait between
+runs, and the device it's meant for, so that many sweeps can be queued and run unattended.
+
+.. _src-common-data_structures-sweep_job:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/data_structures/sweep_job.py
+
+"""
+from __future__ import absolute_import
+
+from collections import deque
+
+from src.common.bytes import bytes
+from src.common.frequency.frequency_plan import get_frequency_plan
+from src.config.config import F_MIN, N_PERIODS
+
+MAX_VALS_FREQS = [F_MIN, F_MIN * 2 ** 23]
+"""list of float: The lowest and highest frequencies that can be requested, in mHz.
+"""
+AMPLITUDE_TYPES = dict(voltage=0, current=1)
+"""dict of str: int: The value of each amplitude type, as set by the form's radio buttons.
+"""
+DEFAULT_DEVICE = '0123456789'
+"""str: The serial number written to the csv files of jobs that don't name a device.
+"""
+
+
+class SweepJob(object):
+    """Sweep Job.
+
+    Attributes:
+        __start_frequency (int): The start frequency, in mHz, as typed into the form.
+        __end_frequency (int): The end frequency, in mHz, or None for a single frequency.
+        __n_freqs (int): The number of frequencies.
+        __amplitude (int): The amplitude, in mV or mA.
+        __amplitude_type (int): 0 for voltage, 1 for current.
+        __repeat (int): The number of times to run the sweep.
+        __delay (int): The number of milliseconds to wait after each run, before the next one.
+        __device (str): The serial number of the device the job is meant for.
+        __plan (src.common.frequency.frequency_plan.FrequencyPlan): The frequencies requested.
+
+    """
+    def __init__(self, start_frequency, end_frequency=None, n_freqs=None, amplitude=0, amplitude_type=0, repeat=1,
+                 delay=0, device=None):
+        """SweepJob constructor.
+
+        The parameters are checked against the same bounds the form checks them against.
+
+        Args:
+            start_frequency (int): `self.start_frequency`.
+            end_frequency (int, optional): `self.end_frequency`. Default is None, which means a single frequency.
+            n_freqs (int, optional): `self.n_freqs`. Default is None, which means 1 for a single frequency, or every
+                frequency between the start and end frequencies. At least 2 with an end frequency.
+            amplitude (int, optional): `self.amplitude`. Default is 0.
+            amplitude_type (int, str, optional): `self.amplitude_type`, or a key of `AMPLITUDE_TYPES`. Default is 0.
+            repeat (int, optional): `self.repeat`. Default is 1.
+            delay (int, optional): `self.delay`. Default is 0, which means no idle time between runs.
+            device (str, optional): `self.device`. Default is None, which means `DEFAULT_DEVICE`.
+
+        Raises:
+            ValueError: If any parameter is out of bounds.
+
+        """
+        if isinstance(amplitude_type, basestring):
+            if amplitude_type not in AMPLITUDE_TYPES:
+                raise ValueError("Amplitude type '%s' is not one of %s." %
+                                 (amplitude_type, ", ".join(sorted(AMPLITUDE_TYPES))))
+
+            amplitude_type = AMPLITUDE_TYPES[amplitude_type]
+
+        for name, frequency in (('Start frequency', start_frequency), ('End frequency', end_frequency)):
+            if frequency is not None and not MAX_VALS_FREQS[0] <= frequency <= MAX_VALS_FREQS[1]:
+                raise ValueError("%s %i out of bounds [%f, %f]." % ((name, frequency) + tuple(MAX_VALS_FREQS)))
+
+        if end_frequency is None:
+            start = bytes.get_binary_limits(start_frequency, start_frequency, F_MIN)[0]
+            end = None
+            min_n_freqs = max_n_freqs = 1
+        else:
+            if end_frequency < start_frequency:
+                raise ValueError("Start frequency %i is greater than end frequency %i." %
+                                 (start_frequency, end_frequency))
+
+            start, end = bytes.get_binary_limits(start_frequency, end_frequency, F_MIN)
+            min_n_freqs = 2  #: Both ends of the range, just like the form's scale
+            max_n_freqs = bytes.get_num_middle_bits(start_frequency, end_frequency, F_MIN) + 2
+
+        n_freqs = max_n_freqs if n_freqs is None else n_freqs
+        upper_bound = 30 - 10 * amplitude_type
+
+        if not min_n_freqs <= n_freqs <= max_n_freqs:
+            raise ValueError("Number of frequencies %i out of bounds [%i, %i]." % (n_freqs, min_n_freqs, max_n_freqs))
+
+        if not 0 <= amplitude <= upper_bound:
+            raise ValueError("Amplitude %i out of bounds [0, %i]." % (amplitude, upper_bound))
+
+        if repeat < 1 or delay < 0:
+            raise ValueError("A job must repeat at least once (got %i) and wait a non-negative time (got %i)." %
+                             (repeat, delay))
+
+        self.__start_frequency = start_frequency
+        self.__end_frequency = end_frequency
+        self.__n_freqs = n_freqs
+        self.__amplitude = amplitude
+        self.__amplitude_type = amplitude_type
+        self.__repeat = repeat
+        self.__delay = delay
+        self.__device = DEFAULT_DEVICE if device is None else str(device)
+        self.__plan = get_frequency_plan(start, end, n_freqs, N_PERIODS)
+
+    @property
+    def start_frequency(self):
+        """int: The start frequency, in mHz."""
+        return self.__start_frequency
+
+    @property
+    def end_frequency(self):
+        """int: The end frequency, in mHz, or None for a single frequency."""
+        return self.__end_frequency
+
+    @property
+    def n_freqs(self):
+        """int: The number of frequencies."""
+        return self.__n_freqs
+
+    @property
+    def amplitude(self):
+        """int: The amplitude, in mV or mA."""
+        return self.__amplitude
+
+    @property
+    def amplitude_type(self):
+        """int: 0 for voltage, 1 for current."""
+        return self.__amplitude_type
+
+    @property
+    def repeat(self):
+        """int: The number of times to run the sweep."""
+        return self.__repeat
+
+    @property
+    def delay(self):
+        """int: The number of milliseconds to wait after each run, before the next one."""
+        return self.__delay
+
+    @property
+    def device(self):
+        """str: The serial number of the device the job is meant for."""
+        return self.__device
+
+    @property
+    def plan(self):
+        """src.common.frequency.frequency_plan.FrequencyPlan: The frequencies requested."""
+        return self.__plan
+
+    @classmethod
+    def from_dict(cls, d):
+        """Create a job out of a dict e.g. parsed from JSON.
+
+        Args:
+            d (dict): The arguments of the constructor, by name.
+
+        Returns:
+            SweepJob: The job.
+
+        Raises:
+            ValueError: If a key isn't an argument of the constructor, or a parameter is missing or out of bounds.
+
+        """
+        try:
+            return cls(**d)
+        except TypeError as e:
+            raise ValueError(str(e))
+
+
+class JobQueue(object):
+    """Job Queue.
+
+    A FIFO of sweep jobs, where each job is run `SweepJob.repeat` times before the next one.
+
+    Attributes:
+        __jobs (collections.deque of (int, SweepJob)): The jobs not started yet, with their numbers.
+        __current ((int, SweepJob)): The job being run, with its number, or None.
+        __run (int): The number of runs of the current job started so far.
+        __n_jobs (int): The number of jobs ever queued.
+        __n_runs (int): The number of runs ever queued.
+        __n_done (int): The number of runs finished.
+        __n_failed (int): The number of runs that failed.
+        __running (bool): True from the start of a run until it's finished, False otherwise.
+
+    """
+    def __init__(self):
+        """JobQueue constructor."""
+        self.__jobs = deque()
+        self.__current = None
+        self.__run = 0
+        self.__n_jobs = 0
+        self.__n_runs = 0
+        self.__n_done = 0
+        self.__n_failed = 0
+        self.__running = False
+
+    def __len__(self):
+        """Count the runs left.
+
+        Returns:
+            int: The number of runs queued that haven't finished.
+
+        """
+        return self.__n_runs - self.__n_done
+
+    @property
+    def current(self):
+        """SweepJob: The job being run, or None."""
+        return None if self.__current is None else self.__current[1]
+
+    @property
+    def running(self):
+        """bool: True from the start of a run until it's finished, False otherwise."""
+        return self.__running
+
+    @property
+    def n_failed(self):
+        """int: The number of runs that failed."""
+        return self.__n_failed
+
+    @property
+    def csv_name(self):
+        """str: The name of the csv file of the current run, or None."""
+        return None if self.__current is None else "job%i_run%i" % (self.__current[0], self.__run)
+
+    def extend(self, jobs):
+        """Queue jobs.
+
+        Args:
+            jobs (iterable of SweepJob): The jobs, in the order they should run.
+
+        """
+        for job in jobs:
+            self.__n_jobs += 1
+            self.__n_runs += job.repeat
+            self.__jobs.append((self.__n_jobs, job))
+
+    def start_run(self):
+        """Start the next run: another run of the current job, or the first run of the next job.
+
+        Returns:
+            SweepJob: The job to run, or None if there is none left.
+
+        """
+        if self.__current is None or self.__run >= self.__current[1].repeat:
+            if len(self.__jobs) == 0:
+                self.__current = None
+
+                return None
+
+            self.__current = self.__jobs.popleft()
+            self.__run = 0
+
+        self.__run += 1
+        self.__running = True
+
+        return self.__current[1]
+
+    def finish_run(self, ok=True):
+        """Finish the current run.
+
+        Args:
+            ok (bool, optional): False if the run failed. Default is True.
+
+        """
+        self.__running = False
+        self.__n_done += 1
+
+        if not ok:
+            self.__n_failed += 1
+
+    def clear(self):
+        """Drop every run not started yet. The current run, if any, still has to be finished."""
+        dropped = sum(job.repeat for _, job in self.__jobs)
+
+        if self.__current is not None:
+            dropped += self.__current[1].repeat - self.__run
+
+        self.__jobs.clear()
+        self.__n_runs -= dropped
+
+        if self.__running:
+            self.__run = self.__current[1].repeat  #: No more runs of the current job
+        else:
+            self.__current = None
+            self.__run = 0
+
+    def progress(self):
+        """Describe the progress of the queue.
+
+        Returns:
+            str: The current job and run, and the number of runs finished out of all the runs queued.
+
+        """
+        if self.__current is None:
+            return "%i of %i runs done" % (self.__n_done, self.__n_runs)
+
+        return "job %i of %i, run %i of %i (%i of %i runs done)" % \
+               (self.__current[0], self.__n_jobs, self.__run, self.__current[1].repeat, self.__n_done, self.__n_runs)
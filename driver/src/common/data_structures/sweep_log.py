@@ -0,0 +1,101 @@
+"""SweepLog class definition.
+
+.. _src-common-sweep_log:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/data_structures/sweep_log.py
+
+"""
+from __future__ import absolute_import
+
+import itertools
+
+_versions = itertools.count(1)
+"""itertools.count: Gives each new `SweepLog` snapshot a unique version number.
+"""
+
+
+class SweepLog(object):
+    """SweepLog.
+
+    An append-only, immutable log of the data sets transferred during an EIS sweep, one per frequency. Appending
+    returns a new snapshot in constant time because consecutive snapshots share the same underlying list: each snapshot
+    only remembers how many of its items it can see. Appending to a snapshot that is not the latest one copies the items
+    it sees first, so that older snapshots are never modified.
+
+    Attributes:
+        version (int): Unique among all snapshots, so that comparing versions tells whether two snapshots differ.
+
+    """
+    def __init__(self, items=None, length=0):
+        """SweepLog constructor.
+
+        Note:
+            Use `SweepLog()` to create an empty log; the arguments are meant for `append` only.
+
+        Args:
+            items (list, optional): The underlying list shared with other snapshots. Default is None, which means a
+                new list.
+            length (int, optional): The number of items in `items` that this snapshot can see. Default is 0.
+
+        """
+        self.__items = [] if items is None else items
+        self.__length = length
+        self.version = next(_versions)
+
+    def __len__(self):
+        """Count the items in this snapshot.
+
+        Returns:
+            int: The number of frequencies logged.
+
+        """
+        return self.__length
+
+    def __iter__(self):
+        """SweepLog iterator.
+
+        Yields:
+            The items in this snapshot, in the order they were appended.
+
+        """
+        for i in xrange(self.__length):
+            yield self.__items[i]
+
+    def __getitem__(self, i):
+        """Retrieve an item by index.
+
+        Args:
+            i (int): The index, which can be negative.
+
+        Returns:
+            The item at index `i`.
+
+        Raises:
+            IndexError: If `i` is out of this snapshot's range.
+
+        """
+        if i < 0:
+            i += self.__length
+
+        if not 0 <= i < self.__length:
+            raise IndexError('SweepLog index out of range')
+
+        return self.__items[i]
+
+    def append(self, item):
+        """Append a new item.
+
+        Args:
+            item: The data set of the next frequency.
+
+        Returns:
+            SweepLog: A new snapshot with `item` at the end. This snapshot is left untouched.
+
+        """
+        items = self.__items
+
+        if len(items) != self.__length:  #: a newer snapshot already appended to the shared list
+            items = items[:self.__length]
+
+        items.append(item)
+
+        return SweepLog(items, self.__length + 1)
@@ -0,0 +1,141 @@
+"""AnalysisCache class definition.
+
+Remembers the analyses of csv files by the SHA-1 of their contents, so that re-analyzing a directory only parses the
+files that are new or changed since the last run. The cache is a JSON file written atomically, which also holds the
+`src.methods.analysis.ANALYSIS_VERSION` its analyses were computed with: a cache written by another version is
+discarded as a whole.
+
+.. _src-common-file-analysis_cache:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/file/analysis_cache.py
+
+"""
+from __future__ import absolute_import
+
+import json
+import os.path as path
+
+from src.common.file.atomic import write_file
+from src.methods.analysis import ANALYSIS_VERSION
+
+CACHE_FILE_NAME = '.analysis_cache.json'
+"""str: The name of the cache file kept by default in the directory analyzed.
+"""
+
+
+class AnalysisCache(object):
+    """Analysis Cache.
+
+    Attributes:
+        __path (str): The path of the cache file.
+        __entries (dict of str: dict): The cached results, keyed by the SHA-1 of the file they were computed from.
+        __used (set of str): The keys looked up or stored since the cache was loaded.
+
+    """
+    def __init__(self, cache_path):
+        """AnalysisCache constructor.
+
+        A missing or unreadable cache file, or one written by another analysis version, gives an empty cache.
+
+        Args:
+            cache_path (str): `self.path`.
+
+        """
+        self.__path = cache_path
+        self.__entries = {}
+        self.__used = set()
+
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = json.load(f)
+
+            if cache.get('version') == ANALYSIS_VERSION:
+                self.__entries = cache['entries']
+        except (IOError, ValueError, KeyError, AttributeError):
+            pass
+
+    def __len__(self):
+        """Count the cached results.
+
+        Returns:
+            int: The number of files whose results are cached.
+
+        """
+        return len(self.__entries)
+
+    def __contains__(self, digest):
+        """Check whether the results of a file are cached.
+
+        Args:
+            digest (str): The SHA-1 of the file, as a hex string.
+
+        Returns:
+            bool: True if they are, False otherwise.
+
+        """
+        return digest in self.__entries
+
+    @property
+    def path(self):
+        """str: The path of the cache file."""
+        return self.__path
+
+    @property
+    def digests(self):
+        """frozenset of str: The SHA-1 of every file whose results are cached."""
+        return frozenset(self.__entries)
+
+    def get(self, digest):
+        """Look up the results of a file.
+
+        Args:
+            digest (str): The SHA-1 of the file, as a hex string.
+
+        Returns:
+            dict: The results, or None if they aren't cached.
+
+        """
+        self.__used.add(digest)
+
+        return self.__entries.get(digest)
+
+    def put(self, digest, results):
+        """Cache the results of a file.
+
+        Args:
+            digest (str): The SHA-1 of the file, as a hex string.
+            results (dict): The results, which must be serializable to JSON.
+
+        """
+        self.__used.add(digest)
+        self.__entries[digest] = results
+
+    def save(self, prune=True):
+        """Write the cache file.
+
+        Args:
+            prune (bool, optional): True to drop the results not looked up nor stored since the cache was loaded e.g.
+                of files since deleted, False to keep them. Default is True.
+
+        Raises:
+            IOError: If the cache file couldn't be written.
+            OSError: If the cache file couldn't be replaced.
+
+        """
+        if prune:
+            self.__entries = dict((digest, self.__entries[digest]) for digest in self.__used
+                                  if digest in self.__entries)
+
+        write_file(self.__path, json.dumps(dict(version=ANALYSIS_VERSION, entries=self.__entries)))
+
+    @staticmethod
+    def default_path(directory):
+        """Build the default path of the cache of a directory.
+
+        Args:
+            directory (str): The directory analyzed.
+
+        Returns:
+            str: The path of `CACHE_FILE_NAME` in `directory`.
+
+        """
+        return path.join(directory, CACHE_FILE_NAME)
@@ -0,0 +1,58 @@
+"""Atomic file replacement.
+
+A file replaced through this module is either the old file or the new one, never a partially written one, even if the
+program crashes halfway through.
+
+.. _src-common-file-atomic:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/file/atomic.py
+
+"""
+from __future__ import absolute_import
+
+import ctypes
+import os
+from sys import platform
+
+
+def replace_file(src, dst):
+    """Atomically replace a file with another one.
+
+    Args:
+        src (str): The path of the new file.
+        dst (str): The path of the file to replace, which may not exist yet.
+
+    Raises:
+        OSError: If the file couldn't be replaced.
+
+    """
+    if platform == 'win32':  #: `os.rename` refuses to overwrite files on Windows
+        movefile_replace_existing, movefile_write_through = 0x1, 0x8
+
+        if not ctypes.windll.kernel32.MoveFileExW(unicode(src), unicode(dst),
+                                                  movefile_replace_existing | movefile_write_through):
+            raise ctypes.WinError()
+    else:
+        os.rename(src, dst)
+
+
+def write_file(path, contents):
+    """Atomically write a file, by writing a temporary file first and then renaming it over `path`.
+
+    Args:
+        path (str): The path of the file, which may not exist yet.
+        contents (str): The contents of the file.
+
+    Raises:
+        IOError: If the temporary file couldn't be written.
+        OSError: If the file couldn't be replaced.
+
+    """
+    tmp_path = path + '.tmp'
+
+    f = open(tmp_path, 'wb')
+    f.write(contents)
+    f.flush()
+    os.fsync(f.fileno())
+    f.close()
+
+    replace_file(tmp_path, path)
@@ -1,6 +1,7 @@
 """CSV File Operations.
 
-This module provides useful functions to write csv files.
+This module provides useful functions to write csv files. The files written by `write_current_voltage_csv` are read
+back by `src.common.file.sweep_csv.SweepCSV`.
 
 .. _src-common-file-csv_files:
     https://github.com/hivebattery/gui/blob/master/driver/src/common/file/csv_files.py
@@ -10,16 +11,22 @@ from __future__ import with_statement
 from __future__ import absolute_import
 
 from os.path import join, exists
-from decimal import Decimal
 from io import open
-import numpy as np
 import re
 
-from src.components.form import F_MIN
+from src.common.clock import monotonic
+from src.common.log.stage_timer import stage_timer
 
 CURRENT_RANGE_VALS = ['0.00002', '0.0001', '.0006']
 """list of str: All possible current ranging values.
 """
+PER_SWEEP_DATA_NAMES = ['File Name', 'Device Serial Number', 'Start Date and Time', 'Number of Frequencies',
+                        'Current Resolution (Amps)', 'Battery OCV (Volts)']
+"""list of str: The names of the per sweep data, at the top of the csv file.
+"""
+DATA_ROW_NAMES = ['Data Type', 'Frequency (Hz)', 'Time from start (s)', 'Samples per period']
+"""list of str: The names of the rows that describe each column of the current and voltage data.
+"""
 
 
 def build_line(arr, sep, delete=True):
@@ -44,12 +51,11 @@ def build_line(arr, sep, delete=True):
     return line
 
 
-def write_current_voltage_csv(dir_name, file_name, all_data_raw, freqs_explicit, samples, periods, curr_range,
-                              batt_volt, serial_n, start_time, log):
+def write_current_voltage_csv(dir_name, file_name, sweep, curr_range, batt_volt, serial_n, start_time, log):
     """Write the entirety of the csv file from the EIS output.
 
     Before writing the actual file, some preparative steps are needed:
-        1) Extract the exact time of retrieval for each frequency.
+        1) Format the voltage and current of each frequency.
         2) Determine the actual name of the file to account for existing files.
         3) Open the file to start writing.
         4) Determine the max number of characters for each column.
@@ -66,11 +72,8 @@ def write_current_voltage_csv(dir_name, file_name, all_data_raw, freqs_explicit,
     Args:
         dir_name (str): The name of the directory where the csv file will be stored.
         file_name (str): The name of the csv file.
-        all_data_raw (list of (datetime, list of float)): The current and voltage data generated by EIS, one for each
-            frequency requested.
-        freqs_explicit (list of str): A list with the explicit, stringified values of the frequencies requested.
-        samples (int): The number of samples.
-        periods (int): The number of periods.
+        sweep (src.common.data_structures.sweep.Sweep): The current and voltage data generated by EIS, one for each
+            frequency requested, together with the frequencies and the time of retrieval of each one of them.
         curr_range (float): The current ranging returned by the device.
         batt_volt (float): The battery voltage returned by the device.
         serial_n (str): The serial number.
@@ -78,19 +81,17 @@ def write_current_voltage_csv(dir_name, file_name, all_data_raw, freqs_explicit,
         log ((list of (str, int)) -> None): Logs messages according to their codes. See `src.main.log_messages`.
 
     """
-    k = samples * periods
+    t = monotonic()
+    k = sweep.n_samples * sweep.n_periods
+    freqs_explicit = sweep.frequencies
+    times = sweep.timestamps
     all_data = []
-    times = []
     delimiter = ','
+    current_format = "%" + ".%if" % (6 - curr_range)
 
-    for end_time, data_set in all_data_raw:  #: Step 1
-        voltage = data_set[:k]
-        current = data_set[k:]
-
-        times.append(end_time)
-
-        all_data.append(["%.7f" % x for x in voltage])
-        all_data[-1] += [("%" + ".%if" % (6 - curr_range)) % x for x in current]
+    for freq_id in range(len(sweep)):  #: Step 1
+        all_data.append(["%.7f" % x for x in sweep.voltage(freq_id)])
+        all_data[-1] += [current_format % x for x in sweep.current(freq_id)]
 
     final_name = file_name
     suffix = 0
@@ -106,8 +107,7 @@ def write_current_voltage_csv(dir_name, file_name, all_data_raw, freqs_explicit,
     f = open(full_path, 'wb')
 
     n_freqs = len(freqs_explicit)
-    per_sweep_data_names = ['File Name', 'Device Serial Number', 'Start Date and Time', 'Number of Frequencies',
-                            'Current Resolution (Amps)', 'Battery OCV (Volts)']
+    per_sweep_data_names = PER_SWEEP_DATA_NAMES
     current_voltage_data_str = []
 
     first_column_l = -float('inf')
@@ -121,22 +121,22 @@ def write_current_voltage_csv(dir_name, file_name, all_data_raw, freqs_explicit,
         column_widths.append(10 if freq_id != 0 else 17)
         column_widths.append(10)
 
-    data_type_line = [(first_column_l, 'Data Type')]  #: Step 5.a
+    data_type_line = [(first_column_l, DATA_ROW_NAMES[0])]  #: Step 5.a
 
     for freq_id in range(len(all_data)):
         column_l = column_widths[(freq_id + 1) * 2]
         data_type_line.append((max(column_l, 10 if freq_id != 0 else 17), 'V'))
         data_type_line.append((max(column_l, 10), 'I'))
 
-    frequencies = [(first_column_l, 'Frequency (Hz)')]  #: Step 5.b
+    frequencies = [(first_column_l, DATA_ROW_NAMES[1])]  #: Step 5.b
 
     for freq_id in range(len(all_data)):
         column_l = column_widths[(freq_id + 1) * 2]
-        freq_explicit = "%.2E" % (Decimal(freqs_explicit[freq_id]) / 1000)
+        freq_explicit = "%.2E" % (freqs_explicit[freq_id] / 1000)
         frequencies.append((max(column_l, 10 if freq_id != 0 else 17), freq_explicit))
         frequencies.append((max(column_l, 10), freq_explicit))
 
-    times_line = [(first_column_l, 'Time from start (s)')]  #: Step 5.c
+    times_line = [(first_column_l, DATA_ROW_NAMES[2])]  #: Step 5.c
 
     for freq_id in range(len(all_data)):
         if freq_id == 0:
@@ -149,15 +149,14 @@ def write_current_voltage_csv(dir_name, file_name, all_data_raw, freqs_explicit,
         times_line.append((max(column_l, 10 if freq_id != 0 else 17), str(time_diff)))
         times_line.append((max(column_l, 10), str(time_diff)))
 
-    samples_line = [(first_column_l, 'Samples per period')]  #: Step 5.d
+    samples_line = [(first_column_l, DATA_ROW_NAMES[3])]  #: Step 5.d
 
     for freq_id in range(len(all_data)):
         column_l = column_widths[(freq_id + 1) * 2]
-        freq_bit = int(np.round(np.log2(float(freqs_explicit[freq_id]) / F_MIN))) & 23
-        freq_explicit = 2 ** (27 - freq_bit) if freq_bit >= 21 else 128
+        samples_per_period = str(sweep.samples_per_period[freq_id])
 
-        samples_line.append((max(column_l, 10 if freq_id != 0 else 17), str(freq_explicit)))
-        samples_line.append((max(column_l, 10), str(freq_explicit)))
+        samples_line.append((max(column_l, 10 if freq_id != 0 else 17), samples_per_period))
+        samples_line.append((max(column_l, 10), samples_per_period))
 
     second_column_l = column_widths[1]
 
@@ -194,4 +193,5 @@ def write_current_voltage_csv(dir_name, file_name, all_data_raw, freqs_explicit,
     f.write("\n".join(current_voltage_data_str))
     f.close()
 
+    stage_timer.record('csv', monotonic() - t)
     log([("Successfully wrote file '%s.csv' to path %s." % (final_name, dir_name), 0)])  #: Step 7
@@ -1,17 +1,31 @@
 """Hive Record class definition.
 
+The .hive file is a JSON snapshot of the user's data, and every change made since the snapshot was written is appended
+to a journal next to it, one JSON operation per line. Appending a line is cheap and a crash can at most lose the line
+being appended, whereas the snapshot is only ever replaced atomically i.e. written to a temporary file first and then
+renamed over the old one. Loading the record replays the journal on top of the snapshot, and once the journal grows
+long enough, it's compacted into a new snapshot.
+
+The journal is written by a background thread, so that the UI thread never waits for the disk except when it explicitly
+asks to e.g. to report whether a new default path was saved.
+
 .. _src-common-file-hive_record:
     https://github.com/hivebattery/gui/blob/master/driver/src/common/file/hive_record.py
 
 """
+import copy
 import json
 import os.path as path
 import os
 import errno
+import threading
+import Queue
 from sys import platform
 
 from react.index import AskDirectory
 
+from src.common.file.atomic import write_file
+from src.common.log import trace
 from src.config.config import MAX_HISTORY_RECORDS
 
 HOME = os.environ['HOME' if platform == 'darwin' else 'HOMEPATH']
@@ -23,6 +37,99 @@ LIBRARY = path.join(HOME, 'Library/Hive Battery' if platform == 'darwin' else 'A
 HIVE_RECORD_PATH = path.join(LIBRARY, '.hive')
 """str: The .hive file's full path.
 """
+HIVE_JOURNAL_PATH = HIVE_RECORD_PATH + '.journal'
+"""str: The full path of the journal of changes made since the .hive file was written.
+"""
+COMPACT_THRESHOLD = 64
+"""int: The number of operations in the journal that triggers its compaction into a new .hive file.
+"""
+
+
+def apply_operation(record, operation):
+    """Apply a journaled operation to the user's data.
+
+    Args:
+        record (dict): The user's data, which is modified in place.
+        operation (dict): Made up of the operation's sequence number 'seq', its type 'op', the 'key' it affects, and
+            its 'value'. The types are:
+
+                - 'set': Sets the `record`'s key to the value.
+                - 'history': Appends the value to the key's input history.
+
+    """
+    key, value = operation['key'], operation['value']
+
+    if operation['op'] == 'set':
+        record[key] = value
+    elif operation['op'] == 'history':
+        history = record['history'][key] + [value]
+        record['history'][key] = history[-MAX_HISTORY_RECORDS:]
+
+    record['seq'] = operation['seq']
+
+
+def write_snapshot(record):
+    """Atomically replace the .hive file and empty the journal.
+
+    Operations already in the snapshot are skipped by `read_record` thanks to their sequence numbers, so crashing
+    before the journal is emptied is harmless.
+
+    Args:
+        record (dict): The user's data.
+
+    Raises:
+        IOError: Input/output errors when trying to write to the .hive file.
+        OSError: Errors related to the computer's operating system.
+
+    """
+    write_file(HIVE_RECORD_PATH, json.dumps(record))
+
+    open(HIVE_JOURNAL_PATH, 'wb').close()
+
+
+def read_record():
+    """Load the user's data.
+
+    Reads the .hive file and replays the journal on top of it. A truncated last line in the journal, which is what a
+    crash mid-append leaves behind, is ignored.
+
+    Returns:
+        (dict, int): The user's data and the number of operations in the journal.
+
+    Raises:
+        IOError: Input/output errors when trying to read from the .hive file.
+        Exception: If the .hive file is empty.
+
+    """
+    f = open(HIVE_RECORD_PATH, 'rb')
+    record = json.loads(f.read())
+    f.close()
+
+    if not len(record):
+        raise Exception('Empty file read.')
+
+    record.setdefault('seq', 0)
+    journal_size = 0
+
+    try:
+        f = open(HIVE_JOURNAL_PATH, 'rb')
+        lines = f.read().splitlines()
+        f.close()
+    except IOError:
+        lines = []
+
+    for line in lines:
+        try:
+            operation = json.loads(line)
+        except ValueError:
+            continue
+
+        journal_size += 1
+
+        if operation['seq'] > record['seq']:
+            apply_operation(record, operation)
+
+    return record, journal_size
 
 
 class HiveRecord:
@@ -33,10 +140,11 @@ class HiveRecord:
     '$HOMEPATH\\AppData\\Local\\Hive Battery' if running on Windows. This .hive file starts as
 
         '{"default_csv_path": "SELECTED_PATH", "history": {"start_frequency": [], "end_frequency": [],
-          "amplitude": []}}',
+          "amplitude": []}, "seq": 0}',
 
     but changes when the user updates the default csv file or runs a successful EIS session which saves the parameters
-    to the corresponding entry arrays i.e. "start_frequency", "end_frequency", and "amplitude".
+    to the corresponding entry arrays i.e. "start_frequency", "end_frequency", and "amplitude". These changes go to the
+    journal first, see `src.common.file.hive_record`.
 
     Attributes:
         __indices (dict of str: int): The current index into each specific key input history.
@@ -46,6 +154,9 @@ class HiveRecord:
         __record (dict): The user's custom data containing the default csv file and the entry input history arrays.
         __default_csv_path (str): The directory where all csv files will be saved.
         __history (dict of str: (list of int)): Contains the input history for each entry of the form.
+        __operations (Queue.Queue of dict): The operations waiting to be journaled, followed by None once closed.
+        __writer (threading.Thread): Journals the operations in `self.__operations`.
+        __error (Exception): The error raised by the latest write attempt, if any.
 
     """
     def __init__(self, log):
@@ -70,23 +181,27 @@ class HiveRecord:
         self.__record = None
         self.__default_csv_path = None
         self.__history = None
+        self.__operations = Queue.Queue()
+        self.__writer = None
+        self.__error = None
 
         self.__wrote_file = False
 
         try:
-            f = open(HIVE_RECORD_PATH, 'rb')
-            self.__record = json.loads(f.read())
-            f.close()
+            self.__record, journal_size = read_record()
 
-            if not len(self.__record):
-                raise Exception('Empty file read.')
+            if journal_size >= COMPACT_THRESHOLD:
+                write_snapshot(self.__record)
+                journal_size = 0
 
             self.__wrote_file = True
             self.__default_csv_path = self.__record['default_csv_path']
             self.__history = self.__record['history']
 
+            self.__start_writer(journal_size)
+
         except (IOError, OSError, Exception) as e:
-            print e
+            trace.warning('file', "Couldn't read the .hive record: %s", e)
 
             try:
                 try:
@@ -104,14 +219,18 @@ class HiveRecord:
                 history = dict(start_frequency=[], end_frequency=[],
                                amplitude=[])
 
-                self.__record = dict(default_csv_path=default_csv_path, history=history)
-                self.update(("Successfully selected %s", default_csv_path))
+                self.__record = dict(default_csv_path=default_csv_path, history=history, seq=0)
+                write_snapshot(self.__record)
 
+                self.__wrote_file = True
                 self.__default_csv_path = self.__record['default_csv_path']
                 self.__history = self.__record['history']
 
+                self.__start_writer(0)
+                log([("Successfully selected %s" % default_csv_path, 0)])
+
             except (IOError, OSError, Exception) as e2:
-                print e2
+                trace.error('file', "Couldn't create the .hive record: %s", e2)
                 self.__wrote_file = False
                 log([("EMPTY PATH", 12)])
 
@@ -121,47 +240,115 @@ class HiveRecord:
         """
         return self.__wrote_file
 
-    def update(self, msgs=None):
-        """Open and update .hive file.
+    @property
+    def default_csv_path(self):
+        """str: The directory where all csv files will be saved.
+        """
+        return self.__default_csv_path
 
-        Assumes `self.__record` contains the user's custom data so that it can overwrite the .hive file.
+    def __start_writer(self, journal_size):
+        """Start the thread that journals the operations.
 
         Args:
-            msgs ((str, str), optional): The messages to log in case of success or failure.
+            journal_size (int): The number of operations already in the journal.
 
-        Raises:
-            IOError: Input/output errors when trying to read from or write to the .hive file.
-            OSError: Errors related to the computer's operating system.
-            Exception: If the .hive file is empty.
+        """
+        self.__writer = threading.Thread(target=self.__write_behind,
+                                         args=(copy.deepcopy(self.__record), journal_size), name='HiveRecordWriter')
+        self.__writer.daemon = True
+        self.__writer.start()
+
+    def __write_behind(self, record, journal_size):
+        """Journal the operations queued, until `close` is called.
+
+        Runs on `self.__writer`. All the operations queued by the time the thread wakes up are appended at once, and the
+        journal is compacted whenever it reaches `COMPACT_THRESHOLD` operations. The thread keeps its own copy of the
+        user's data to write the snapshots, so it never reads `self.__record`.
+
+        Args:
+            record (dict): A copy of the user's data as of the latest operation journaled.
+            journal_size (int): The number of operations in the journal.
 
         """
-        msg = None
-        code = None
+        closed = False
 
-        try:
-            if self.__record is None:
-                raise Exception('NULL record.')
+        while not closed:
+            batch = [self.__operations.get()]
 
-            f = open(HIVE_RECORD_PATH, 'wb')
+            try:
+                while True:
+                    batch.append(self.__operations.get_nowait())
+            except Queue.Empty:
+                pass
 
-            f.write(json.dumps(self.__record))
-            f.close()
+            closed = None in batch
+            operations = [operation for operation in batch if operation is not None]
 
-            if msgs is not None:
-                msg = msgs[0] % msgs[1]
-                code = 0
-                self.__wrote_file = True
+            try:
+                for operation in operations:
+                    apply_operation(record, operation)
 
-        except (IOError, OSError, Exception) as e:
-            print e
-            self.__wrote_file = False
+                if len(operations):
+                    journal_size += len(operations)
+
+                    if journal_size >= COMPACT_THRESHOLD:
+                        write_snapshot(record)
+                        journal_size = 0
+                    else:
+                        f = open(HIVE_JOURNAL_PATH, 'ab')
+                        f.write("".join(json.dumps(operation) + "\n" for operation in operations))
+                        f.flush()
+                        os.fsync(f.fileno())
+                        f.close()
+
+                self.__error = None
+
+            except (IOError, OSError) as e:
+                trace.error('file', "Couldn't write the .hive record: %s", e)
+                self.__error = e
+                journal_size = COMPACT_THRESHOLD  #: the next batch writes a whole new snapshot instead
+
+            for _ in batch:
+                self.__operations.task_done()
 
-            if msgs is not None:
-                msg = msgs[1]
-                code = 12
+    def __commit(self, op, key, value):
+        """Apply an operation to the user's data and queue it to be journaled.
 
-        if msgs is not None:
-            self.__log([(msg, code)])
+        Args:
+            op (str): The type of operation. See `apply_operation`.
+            key (str): The key it affects.
+            value: Its value.
+
+        """
+        operation = dict(seq=self.__record['seq'] + 1, op=op, key=key, value=value)
+
+        apply_operation(self.__record, operation)
+
+        if self.__writer is not None:
+            self.__operations.put(operation)
+
+    def flush(self):
+        """Wait until every operation is journaled.
+
+        Returns:
+            bool: True if the latest write succeeded, False otherwise.
+
+        """
+        if self.__writer is None:
+            return False
+
+        self.__operations.join()
+
+        return self.__error is None
+
+    def close(self):
+        """Journal any pending operations and stop the background thread.
+
+        """
+        if self.__writer is not None:
+            self.__operations.put(None)
+            self.__writer.join()
+            self.__writer = None
 
     def change_default_path(self):
         """Update directory to save all csv files.
@@ -184,9 +371,14 @@ class HiveRecord:
             if not len(default_csv_path):
                 raise Exception('No folder selected.')
 
-            self.__record['default_csv_path'] = default_csv_path
+            self.__commit('set', 'default_csv_path', default_csv_path)
             self.__default_csv_path = default_csv_path
-            self.update(("Successfully updated %s", default_csv_path))
+            self.__wrote_file = self.flush()
+
+            if self.__wrote_file:
+                self.__log([("Successfully updated %s" % default_csv_path, 0)])
+            else:
+                self.__log([(default_csv_path, 12)])
 
         except (IOError, OSError, Exception) as e:
             if isinstance(e, Exception):
@@ -195,23 +387,16 @@ class HiveRecord:
     def add_field_history(self, hist_dict):
         """Inserts a new value to some entry's input history.
 
-        Writes the new history dictionary to the .hive file.
+        The new values are journaled in the background.
 
         Args:
             hist_dict (dict of str: int): Contains the new input for each entry of the form.
 
         """
         for (key, val) in hist_dict.items():
-            history = self.__record['history'][key]
-            history.append(val)
-
+            self.__commit('history', key, val)
             self.__indices[key] = -1
 
-            if len(history) > MAX_HISTORY_RECORDS:
-                self.__record['history'][key] = self.__record['history'][key][1:]
-
-        self.update()
-
     def poll_history(self, key, direction):
         """Navigate through the entries' input history.
 
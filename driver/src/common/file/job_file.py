@@ -0,0 +1,56 @@
+"""Sweep job files.
+
+A job file lists the sweeps to run unattended as a JSON array of objects, whose keys are the arguments of
+`src.common.data_structures.sweep_job.SweepJob`, e.g.:
+::
+    [
+        {"start_frequency": 100, "end_frequency": 100000, "n_freqs": 12, "amplitude": 10, "repeat": 20},
+        {"start_frequency": 1000, "amplitude": 5, "amplitude_type": "current", "repeat": 5, "delay": 60000,
+         "device": "0123456789"}
+    ]
+
+.. _src-common-file-job_file:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/file/job_file.py
+
+"""
+from __future__ import absolute_import
+
+import json
+
+from src.common.data_structures.sweep_job import SweepJob
+
+
+def read_jobs(path):
+    """Read the sweep jobs of a job file.
+
+    Every job is validated before any is returned, so that a file is either queued whole or not at all.
+
+    Args:
+        path (str): The path of the job file.
+
+    Returns:
+        list of src.common.data_structures.sweep_job.SweepJob: The jobs, in the order they should run.
+
+    Raises:
+        IOError: If the file can't be read.
+        ValueError: If the file isn't a JSON array of objects, or a job is invalid.
+
+    """
+    with open(path, 'rb') as f:
+        entries = json.load(f)
+
+    if not isinstance(entries, list):
+        raise ValueError("Expected a JSON array of jobs.")
+
+    jobs = []
+
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError("Job %i is not a JSON object." % (i + 1))
+
+        try:
+            jobs.append(SweepJob.from_dict(dict((str(key), value) for key, value in entry.items())))
+        except ValueError as e:
+            raise ValueError("Job %i: %s" % (i + 1, e))
+
+    return jobs
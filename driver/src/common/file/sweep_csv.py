@@ -0,0 +1,314 @@
+"""SweepCSV class definition.
+
+Reads back the csv files written by `src.common.file.csv_files.write_current_voltage_csv`. Opening a file only parses
+its header, i.e. the per sweep data and the rows that describe each column; the voltage and current samples are loaded
+on demand, and only for the frequencies asked for.
+
+Every line of the data block is written with the same column widths, so the block is read as a matrix of characters
+with one row per line, and each column of samples is decoded at once from its slice of that matrix: its digits make up
+an integer, which is scaled by the column's number of decimals. Files whose lines don't line up e.g. because a value
+overflowed its column are parsed line by line instead.
+
+.. _src-common-file-sweep_csv:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/file/sweep_csv.py
+
+"""
+from __future__ import absolute_import
+
+import numpy as np
+
+from src.common.file.csv_files import PER_SWEEP_DATA_NAMES, DATA_ROW_NAMES
+
+DELIMITER = ','
+"""str: The delimiter of the columns.
+"""
+
+
+def decode_fixed_point(chars):
+    """Decode columns of right-aligned, fixed-point decimal numbers.
+
+    Args:
+        chars (numpy.ndarray of numpy.uint8): The characters of the columns, with one row per line, one column per
+            column of numbers, and one plane per character, all columns being padded with spaces to the same width.
+
+    Returns:
+        numpy.ndarray of numpy.float64: One row per column of numbers, or None if a column isn't made up of numbers
+            with the same number of decimals, made up of digits with an optional leading '-'.
+
+    """
+    chars = chars[:, :, np.argmax((chars != ord(' ')).any(axis=(0, 1))):]  #: Trim the padding every line shares
+    width = chars.shape[2]
+    digits = chars - np.uint8(ord('0'))  #: Wraps around for every character but digits
+    is_digit = digits <= 9
+    is_point = chars == ord('.')
+    is_minus = chars == ord('-')
+    has_point = is_point.any(axis=0)
+    n_points = has_point.sum(axis=1)
+
+    if (n_points > 1).any() or not (is_point == has_point).all() or not is_digit.any(axis=2).all() or \
+            not (is_digit | is_point | is_minus | (chars == ord(' '))).all():
+        return None
+
+    point = np.where(n_points, has_point.argmax(axis=1), width)[:, np.newaxis]
+    decimals = np.maximum(width - 1 - point, 0)
+    positions = np.arange(width)
+    weights = np.where(positions < point, 10.0 ** (decimals + point - 1 - positions), 10.0 ** (width - 1 - positions))
+    weights[positions == point] = 0
+
+    #: The digits make up an integer, which is exact as long as it fits in 53 bits, so dividing it rounds just like
+    #: `float` would
+    digits[~is_digit] = 0
+    values = np.einsum('nmw,mw->mn', digits, weights) / 10.0 ** decimals
+    values[is_minus.any(axis=2).T] *= -1
+
+    return values
+
+
+class SweepCSV(object):
+    """Sweep CSV.
+
+    A csv file written by `src.common.file.csv_files.write_current_voltage_csv`, whose samples are loaded lazily.
+
+    Attributes:
+        __header (dict of str: str): The per sweep data, keyed by `PER_SWEEP_DATA_NAMES`.
+        __frequencies (list of float): The frequency of each column, in Hz.
+        __times (list of int): The time from start of each column, in seconds.
+        __samples_per_period (list of int): The samples per period of each column.
+        __fields (list of (int, int)): The first and last character, plus one, of each field of a line.
+        __read_block (() -> numpy.ndarray of numpy.uint8): Reads the data block.
+        __block (numpy.ndarray of numpy.uint8): The data block, once read.
+        __lines (numpy.ndarray of numpy.uint8): The data block as a matrix with one row per line, or None if its lines
+            don't line up.
+
+    """
+    def __init__(self, header_lines, read_block):
+        """SweepCSV constructor.
+
+        Note:
+            Use `SweepCSV.open` or `SweepCSV.parse` instead.
+
+        Args:
+            header_lines (list of str): The lines before the data block, without line breaks.
+            read_block (() -> numpy.ndarray of numpy.uint8): Reads the data block.
+
+        Raises:
+            ValueError: If the header doesn't follow the layout of `write_current_voltage_csv`.
+
+        """
+        n_header = len(PER_SWEEP_DATA_NAMES)
+
+        self.__header = dict([cell.strip() for cell in line.split(DELIMITER, 1)] for line in header_lines[:n_header]
+                             if DELIMITER in line)
+
+        if sorted(self.__header) != sorted(PER_SWEEP_DATA_NAMES):
+            raise ValueError("Missing the per sweep data.")
+
+        description = header_lines[n_header + 1:]
+        rows = [line.split(DELIMITER) for line in description]
+
+        if [row[0].strip() for row in rows] != DATA_ROW_NAMES or len(set(len(row) for row in rows)) != 1 or \
+                len(rows[0]) % 2 != 1:
+            raise ValueError("Missing the rows that describe the data.")
+
+        self.__frequencies = [float(cell) for cell in rows[1][1::2]]
+        self.__times = [int(cell) for cell in rows[2][1::2]]
+        self.__samples_per_period = [int(cell) for cell in rows[3][1::2]]
+
+        commas = [i for i, c in enumerate(description[0]) if c == DELIMITER]
+        self.__fields = zip([0] + [i + 1 for i in commas], commas + [len(description[0])])
+
+        self.__read_block = read_block
+        self.__block = None
+        self.__lines = None
+
+    def __len__(self):
+        """Count the frequencies.
+
+        Returns:
+            int: The number of frequencies in the file.
+
+        """
+        return len(self.__frequencies)
+
+    @property
+    def header(self):
+        """dict of str: str: The per sweep data, keyed by `PER_SWEEP_DATA_NAMES`."""
+        return self.__header
+
+    @property
+    def frequencies(self):
+        """list of float: The frequency of each column, in Hz."""
+        return self.__frequencies
+
+    @property
+    def times(self):
+        """list of int: The time from start of each column, in seconds."""
+        return self.__times
+
+    @property
+    def samples_per_period(self):
+        """list of int: The samples per period of each column."""
+        return self.__samples_per_period
+
+    @classmethod
+    def open(cls, path):
+        """Open a csv file, reading its header only.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            SweepCSV: The file, whose data block is read on the first call to `load`.
+
+        Raises:
+            IOError: If the file can't be read.
+            ValueError: If the header doesn't follow the layout of `write_current_voltage_csv`.
+
+        """
+        with open(path, 'rb') as f:
+            header_lines = [f.readline().rstrip('\r\n') for _ in xrange(len(PER_SWEEP_DATA_NAMES) + 1 +
+                                                                        len(DATA_ROW_NAMES))]
+            offset = f.tell()
+
+        def read_block():
+            with open(path, 'rb') as block_file:
+                block_file.seek(offset)
+
+                return np.fromfile(block_file, dtype=np.uint8)
+
+        return cls(header_lines, read_block)
+
+    @classmethod
+    def parse(cls, text):
+        """Parse the contents of a csv file, e.g. already read to be hashed.
+
+        Args:
+            text (str): The contents of the file.
+
+        Returns:
+            SweepCSV: The file.
+
+        Raises:
+            ValueError: If the header doesn't follow the layout of `write_current_voltage_csv`.
+
+        """
+        header_lines = []
+        offset = 0
+
+        for _ in xrange(len(PER_SWEEP_DATA_NAMES) + 1 + len(DATA_ROW_NAMES)):
+            end = text.find('\n', offset)
+            end = len(text) if end < 0 else end
+            header_lines.append(text[offset:end].rstrip('\r'))
+            offset = min(end + 1, len(text))
+
+        return cls(header_lines, lambda: np.frombuffer(text, dtype=np.uint8, offset=offset))
+
+    def load(self, freq_ids=None):
+        """Load the samples of some frequencies.
+
+        Args:
+            freq_ids (list of int, optional): The index of each frequency to load. Default is None, which means every
+                frequency.
+
+        Returns:
+            numpy.ndarray of numpy.float32: One row per frequency, in the order asked for, made up of its voltage
+                samples followed by its current samples, i.e. as taken by `src.methods.analysis.analyze`.
+
+        Raises:
+            IndexError: If a frequency is out of range.
+            ValueError: If the data block doesn't follow the layout of `write_current_voltage_csv`.
+
+        """
+        freq_ids = range(len(self)) if freq_ids is None else list(freq_ids)
+
+        for freq_id in freq_ids:
+            if not 0 <= freq_id < len(self):
+                raise IndexError('SweepCSV frequency out of range')
+
+        if len(freq_ids) == 0:
+            return np.empty((0, 0), dtype=np.float32)
+
+        if self.__block is None:
+            self.__block = self.__read_block()
+            self.__lines = self.__split_lines(self.__block)
+
+        columns = [2 * freq_id + 1 for freq_id in freq_ids] + [2 * freq_id + 2 for freq_id in freq_ids]
+        values = None
+
+        if self.__lines is not None:
+            values = decode_fixed_point(self.__gather(columns))
+
+        if values is None:
+            values = self.__parse_columns(columns)
+
+        return np.concatenate((values[:len(freq_ids)], values[len(freq_ids):]), axis=1).astype(np.float32)
+
+    def __gather(self, columns):
+        """Gather the characters of columns of the data block.
+
+        Args:
+            columns (list of int): The index of each field to gather.
+
+        Returns:
+            numpy.ndarray of numpy.uint8: The characters, as taken by `decode_fixed_point`.
+
+        """
+        width = max(self.__fields[column][1] - self.__fields[column][0] for column in columns)
+        offsets = np.arange(-width, 0)
+        ends = np.array([self.__fields[column][1] for column in columns])[:, np.newaxis]
+        starts = np.array([self.__fields[column][0] for column in columns])[:, np.newaxis]
+        padding = offsets + ends < starts  #: The characters left of narrower fields
+
+        chars = self.__lines[:, np.where(padding, 0, offsets + ends)]
+        chars[:, padding] = ord(' ')
+
+        return chars
+
+    def __split_lines(self, block):
+        """View the data block as a matrix with one row per line.
+
+        Args:
+            block (numpy.ndarray of numpy.uint8): The data block.
+
+        Returns:
+            numpy.ndarray of numpy.uint8: The matrix, or None if the lines aren't all as long as the description rows,
+                with their delimiters in the same places.
+
+        """
+        width = self.__fields[-1][1]
+        breaks = np.flatnonzero(block == ord('\n'))
+        stride = breaks[0] + 1 if len(breaks) else len(block) + 1
+
+        if stride not in (width + 1, width + 2):  #: Either '\n' or '\r\n' line breaks
+            return None
+
+        if len(block) % stride:  #: The last line has no line break
+            block = np.concatenate((block, np.full(stride - len(block) % stride, ord('\n'), dtype=np.uint8)))
+
+        lines = block.reshape(-1, stride)
+        delimiters = [end for _, end in self.__fields[:-1]]
+
+        if not (lines[:, -1] == ord('\n')).all() or not (lines[:, delimiters] == ord(DELIMITER)).all():
+            return None
+
+        return lines
+
+    def __parse_columns(self, columns):
+        """Parse columns of the data block line by line.
+
+        Args:
+            columns (list of int): The index of each field to parse.
+
+        Returns:
+            numpy.ndarray of numpy.float32: One row per column.
+
+        Raises:
+            ValueError: If a line doesn't have a value in every column.
+
+        """
+        lines = [line.split(DELIMITER) for line in self.__block.tostring().splitlines() if line.strip()]
+
+        try:
+            return np.array([[line[column] for line in lines] for column in columns], dtype=np.float32)
+        except IndexError:
+            raise ValueError("Expected a voltage and a current column for each of the %i frequencies." % len(self))
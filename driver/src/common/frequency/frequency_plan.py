@@ -0,0 +1,198 @@
+"""FrequencyPlan class definition.
+
+.. _src-common-frequency-frequency_plan:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/frequency/frequency_plan.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import numpy as np
+
+from src.common.bytes import bytes
+from src.common.data_structures.lru_cache import LRUCache
+from src.config.config import F_MIN, N_PERIODS
+
+N_FREQUENCY_BITS = 24
+"""int: The number of bits in the frequency mask, i.e. the number of frequencies the device can measure.
+"""
+PLAN_CACHE_SIZE = 32
+"""int: The number of frequency plans remembered by `get_frequency_plan`.
+"""
+
+_cache = LRUCache(PLAN_CACHE_SIZE)
+"""src.common.data_structures.lru_cache.LRUCache: The plans built so far, keyed by the arguments of
+`get_frequency_plan`.
+"""
+
+
+def get_samples_per_period(bit):
+    """Compute the number of samples per period the device uses for a frequency.
+
+    Args:
+        bit (int): The frequency's bit in the frequency mask, i.e. the frequency is `F_MIN * 2 ** bit` mHz.
+
+    Returns:
+        int: The number of samples per period.
+
+    """
+    return 2 ** (27 - bit) if bit & 23 >= 21 else 128
+
+
+def get_frequency_mask(start, end, n_freqs):
+    """Build the binary string that tells the device which frequencies to measure.
+
+    Args:
+        start (int): The bit of the lowest frequency.
+        end (int): The bit of the highest frequency, or None to measure the lowest frequency only.
+        n_freqs (int): The number of frequencies.
+
+    Returns:
+        str: The frequency mask, where the rightmost character is the bit of `F_MIN`.
+
+    """
+    if end is None:
+        return bin(1 << start)[2:].zfill(N_FREQUENCY_BITS)
+
+    middle = "1" + bytes.distribute_bits(n_freqs - 2, end - start - 1) + "1"
+
+    return "0" * (N_FREQUENCY_BITS - 1 - end) + middle + "0" * start
+
+
+def get_frequency_plan(start, end, n_freqs, n_periods=N_PERIODS):
+    """Get the plan of an EIS sweep.
+
+    Plans are immutable, so the same instance is returned for the same arguments as long as it's in the cache.
+
+    Args:
+        start (int): `FrequencyPlan.start`.
+        end (int): `FrequencyPlan.end`.
+        n_freqs (int): The number of frequencies requested.
+        n_periods (int, optional): `FrequencyPlan.n_periods`. Default is `N_PERIODS`.
+
+    Returns:
+        FrequencyPlan: The plan.
+
+    """
+    key = (start, end, n_freqs, n_periods)
+    plan = _cache.get(key)
+
+    if plan is None:
+        plan = FrequencyPlan(get_frequency_mask(start, end, n_freqs), start, end, n_periods)
+        _cache.put(key, plan)
+
+    return plan
+
+
+def read_only(arr):
+    """Make an array read-only.
+
+    Args:
+        arr (numpy.ndarray): The array.
+
+    Returns:
+        numpy.ndarray: The same array, which can no longer be written to.
+
+    """
+    arr.flags.writeable = False
+
+    return arr
+
+
+class FrequencyPlan(object):
+    """Frequency Plan.
+
+    Everything derived from the frequencies of an EIS sweep, computed once from the frequency mask sent to the device.
+    Every array is read-only and has one item per frequency, from the lowest frequency to the highest, which is also the
+    order in which the device measures them.
+
+    Attributes:
+        __mask (str): The frequency mask.
+        __start (int): The bit of the lowest frequency.
+        __end (int): The bit of the highest frequency, or None for a single frequency.
+        __n_periods (int): The number of periods measured per frequency.
+        __bits (numpy.ndarray of int): The bit of each frequency in the mask.
+        __frequencies (numpy.ndarray of float): Each frequency, in mHz.
+        __samples_per_period (numpy.ndarray of int): The number of samples per period of each frequency.
+        __acquisition_times (numpy.ndarray of float): How long the device takes to measure each frequency, in seconds.
+
+    """
+    def __init__(self, mask, start, end, n_periods):
+        """FrequencyPlan constructor.
+
+        Note:
+            Use `get_frequency_plan` rather than creating plans directly.
+
+        Args:
+            mask (str): `self.mask`.
+            start (int): `self.start`.
+            end (int): `self.end`.
+            n_periods (int): `self.n_periods`.
+
+        """
+        value = int(mask, 2)
+
+        self.__mask = mask
+        self.__start = start
+        self.__end = end
+        self.__n_periods = n_periods
+
+        self.__bits = read_only(np.array([bit for bit in xrange(len(mask)) if value >> bit & 1], dtype=int))
+        self.__frequencies = read_only(F_MIN * np.left_shift(1, self.__bits).astype(float))
+        self.__samples_per_period = read_only(np.array([get_samples_per_period(bit) for bit in self.__bits],
+                                                       dtype=int))
+        self.__acquisition_times = read_only(n_periods * 1000 / self.__frequencies)
+
+    def __len__(self):
+        """Count the frequencies.
+
+        Returns:
+            int: The number of frequencies in the plan.
+
+        """
+        return len(self.__bits)
+
+    @property
+    def mask(self):
+        """str: The frequency mask sent to the device, where the rightmost character is the bit of `F_MIN`."""
+        return self.__mask
+
+    @property
+    def start(self):
+        """int: The bit of the lowest frequency."""
+        return self.__start
+
+    @property
+    def end(self):
+        """int: The bit of the highest frequency, or None for a single frequency."""
+        return self.__end
+
+    @property
+    def n_periods(self):
+        """int: The number of periods measured per frequency."""
+        return self.__n_periods
+
+    @property
+    def bits(self):
+        """numpy.ndarray of int: The bit of each frequency in the mask."""
+        return self.__bits
+
+    @property
+    def frequencies(self):
+        """numpy.ndarray of float: Each frequency, in mHz."""
+        return self.__frequencies
+
+    @property
+    def samples_per_period(self):
+        """numpy.ndarray of int: The number of samples per period of each frequency."""
+        return self.__samples_per_period
+
+    @property
+    def acquisition_times(self):
+        """numpy.ndarray of float: How long the device takes to measure each frequency, in seconds."""
+        return self.__acquisition_times
+
+    @property
+    def acquisition_time(self):
+        """float: How long the device takes to measure every frequency, in seconds."""
+        return float(self.__acquisition_times.sum())
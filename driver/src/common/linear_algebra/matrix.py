@@ -1,89 +1,174 @@
+"""Matrix class definition.
+
+.. _src-common-linear_algebra-matrix:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/linear_algebra/matrix.py
+
+"""
 from __future__ import division
 from __future__ import absolute_import
+
 import numpy as np
-from .vector import Vector, vector_map
+
+from .vector import Vector
 
 
 class Matrix(object):
-    def __init__(self, m, n, data=None):
+    """Matrix.
+
+    A thin wrapper around a two-dimensional `numpy.ndarray`. Rows and columns are returned as `Vector` views, so
+    writing to them writes to the matrix, and every operation on the whole matrix is vectorized. Analysis code that
+    works on whole sweeps at once, e.g. `src.methods.fourier.get_impedances`, can use `self.matrix` directly.
+
+    Attributes:
+        m (int): The number of rows.
+        n (int): The number of columns.
+        matrix (numpy.ndarray): The items.
+
+    """
+    def __init__(self, m, n, data=None, dtype=float):
+        """Matrix constructor.
+
+        Args:
+            m (int): `self.m`.
+            n (int): `self.n`.
+            data (array_like, optional): The items, row by row. Default is None, which means an `m` by `n` matrix of
+                zeros. Arrays of the right dtype are wrapped rather than copied.
+            dtype (numpy.dtype, optional): The type of the items, e.g. `complex`, or `object` to hold arbitrary
+                Python objects. Default is `float`, unless `data` is an array, whose dtype is kept.
+
+        """
         self.m = m
         self.n = n
-        self.matrix = [Vector(n) for i in range(m)]
 
-        if data is not None:
-            for i in range(self.m):
-                for j in range(self.n):
-                    self.set_value(i, j, data[i][j])
+        if data is None:
+            self.matrix = np.zeros((m, n), dtype=dtype)
+        elif isinstance(data, np.ndarray):
+            self.matrix = data
+        else:
+            self.matrix = np.asarray(data, dtype=dtype)
 
     def set_value(self, m, n, v):
-        self.matrix[m].set_value(n, v)
+        """Set an item.
+
+        Args:
+            m (int): The row.
+            n (int): The column.
+            v: The new value.
+
+        """
+        self.matrix[m, n] = v
 
     def set_column(self, n, column):
-        for i in range(column.__len__()):
-            self.set_value(i, n, column[i])
+        """Set the first items of a column.
+
+        Args:
+            n (int): The column.
+            column (array_like): The new values.
+
+        """
+        self.matrix[:len(column), n] = column
 
     def set_row(self, m, row):
-        for j in range(row.__len__()):
-            self.set_value(m, j, row[j])
+        """Set the first items of a row.
+
+        Args:
+            m (int): The row.
+            row (array_like): The new values.
+
+        """
+        self.matrix[m, :len(row)] = row
 
     def get_value(self, m, n):
-        return self.matrix[m].get_value(n)
+        """Retrieve an item.
+
+        Args:
+            m (int): The row.
+            n (int): The column.
+
+        Returns:
+            The item.
+
+        """
+        return self.matrix[m, n]
 
     def get_row(self, m):
-        return self.matrix[m]
+        """Retrieve a row.
+
+        Args:
+            m (int): The row.
+
+        Returns:
+            Vector: A view of the row.
+
+        """
+        return Vector(self.n, self.matrix[m])
 
     def get_column(self, n):
-        column = Vector(self.m)
+        """Retrieve a column.
+
+        Args:
+            n (int): The column.
 
-        for i in range(self.m):
-            column.set_value(i, self.matrix[i].get_value(n))
+        Returns:
+            Vector: A view of the column.
 
-        return column
+        """
+        return Vector(self.m, self.matrix[:, n])
 
     def get_column_space(self):
+        """Retrieve every column.
+
+        Returns:
+            list of Vector: A view of each column.
+
+        """
         return [self.get_column(j) for j in range(self.n)]
 
     def get_row_space(self):
-        return self.matrix
+        """Retrieve every row.
+
+        Returns:
+            list of Vector: A view of each row.
+
+        """
+        return [self.get_row(i) for i in range(self.m)]
 
     def get_real(self):
-        C = Matrix(self.m, self.n)
+        """Compute the real part of every item.
 
-        j = 0
-        for row in map(vector_map, self.get_row_space()):
-            C.set_row(j, list(map(lambda x: x.real, row)))
+        Returns:
+            Matrix: A new matrix with the real parts.
 
-        return C
+        """
+        return Matrix(self.m, self.n, np.real(self.matrix).copy())
 
     def get_imag(self):
-        C = Matrix(self.m, self.n)
+        """Compute the imaginary part of every item.
 
-        j = 0
-        for row in map(vector_map, self.get_row_space()):
-            C.set_row(j, list(map(lambda x: x.imag, row)))
+        Returns:
+            Matrix: A new matrix with the imaginary parts.
 
-        return C
+        """
+        return Matrix(self.m, self.n, np.imag(self.matrix).copy())
 
     def get_mse(self, B):
-        C = Matrix(self.m, self.n)
-
-        j = 0
-        for a in map(lambda x: np.array(x.vector), self.get_column_space()):
-            b = np.array(B.get_column(j).vector)
+        """Compute the contribution of each item to the mean squared error of each column.
 
-            C.set_column(j, np.square(b - a) / self.m)
+        Args:
+            B (Matrix): The matrix to compare against, of the same size.
 
-            j += 1
+        Returns:
+            Matrix: A new matrix where each item is the squared difference of the corresponding items divided by
+                `self.m`, so that summing a column gives its mean squared error.
 
-        return C
+        """
+        return Matrix(self.m, self.n, np.square(B.matrix - self.matrix) / self.m)
 
     def __str__(self):
-        res = []
+        """Stringify the matrix.
 
-        for i in range(self.m):
-            arr = []
-            res.append(arr)
-            for j in range(self.n):
-                arr.append(str(self.get_value(i, j)))
+        Returns:
+            str: One line per row, with tab-separated items.
 
-        return "\n".join((list(map(lambda x: "\t".join(x), res))))
\ No newline at end of file
+        """
+        return "\n".join("\t".join(str(x) for x in row) for row in self.matrix.tolist())
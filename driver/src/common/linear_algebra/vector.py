@@ -1,17 +1,116 @@
+"""Vector class definition.
+
+.. _src-common-linear_algebra-vector:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/linear_algebra/vector.py
+
+"""
+from __future__ import absolute_import
+
+import numpy as np
+
+
 def vector_map(v):
+    """Get the array behind a vector.
+
+    Args:
+        v (Vector): The vector.
+
+    Returns:
+        numpy.ndarray: `v.vector`.
+
+    """
     return v.vector
 
 
 class Vector(object):
-    def __init__(self, n):
+    """Vector.
+
+    A thin wrapper around a one-dimensional `numpy.ndarray`. Wrapping an existing array, e.g. a row or a column of a
+    `src.common.linear_algebra.matrix.Matrix`, doesn't copy it, so writes through the vector are seen by the array and
+    vice versa.
+
+    Attributes:
+        n (int): The number of items.
+        vector (numpy.ndarray): The items.
+
+    """
+    def __init__(self, n, data=None, dtype=float):
+        """Vector constructor.
+
+        Args:
+            n (int): `self.n`.
+            data (array_like, optional): The items. Default is None, which means `n` zeros. Arrays of the right dtype
+                are wrapped rather than copied.
+            dtype (numpy.dtype, optional): The type of the items, e.g. `complex`, or `object` to hold arbitrary
+                Python objects. Default is `float`, unless `data` is an array, whose dtype is kept.
+
+        """
         self.n = n
-        self.vector = [0 for y in range(n)]
+
+        if data is None:
+            self.vector = np.zeros(n, dtype=dtype)
+        elif isinstance(data, np.ndarray):
+            self.vector = data
+        else:
+            self.vector = np.asarray(data, dtype=dtype)
+
+    def __len__(self):
+        """Count the items.
+
+        Returns:
+            int: `self.n`.
+
+        """
+        return self.n
+
+    def __getitem__(self, n):
+        """Retrieve items by index or slice.
+
+        Args:
+            n (int, slice): The index or slice.
+
+        Returns:
+            The item, or a view of the items.
+
+        """
+        return self.vector[n]
+
+    def __iter__(self):
+        """Vector iterator.
+
+        Yields:
+            The items, in order.
+
+        """
+        return iter(self.vector)
 
     def __str__(self):
-        return self.vector.__str__()
+        """Stringify the vector.
+
+        Returns:
+            str: The items, as a list.
+
+        """
+        return self.vector.tolist().__str__()
 
     def set_value(self, n, v):
+        """Set an item.
+
+        Args:
+            n (int): The index.
+            v: The new value.
+
+        """
         self.vector[n] = v
 
     def get_value(self, n):
-        return self.vector[n]
\ No newline at end of file
+        """Retrieve an item.
+
+        Args:
+            n (int): The index.
+
+        Returns:
+            The item at index `n`.
+
+        """
+        return self.vector[n]
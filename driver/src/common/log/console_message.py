@@ -8,10 +8,9 @@ These operations works with the `Console` component.
 """
 from __future__ import absolute_import
 
-import datetime
-
 from src.config.config import *
 from src.common.file import format as format_file
+from src.common.log import trace
 
 CHAR_LENGTH = 2
 """int: The length of each character printed to the console.
@@ -23,7 +22,7 @@ MESSAGE_FORMATS = ["%s", "%s value %i out of bounds. Acceptable values fall betw
                    "Error determining which frequency to run next.",
                    "Couldn't write battery voltage as a float (didn't get 4 bytes back)",
                    "Error saving %s as default path. Go to 'File' > 'Change default csv path...' to set a default "
-                   "path.", "Unknown usb error occurred when trying to %s."]
+                   "path.", "Unknown usb error occurred when trying to %s.", "Couldn't queue sweep jobs from %s: %s"]
 """list of str: Defines what each message code should log, where the index into this list corresponds to the code.
 """
 BACKEND_MESSAGES = ["Battery voltage range (2V-5V) violated, check battery connections", "Timeout Error -- Precharge",
@@ -35,6 +34,9 @@ BACKEND_MESSAGES = ["Battery voltage range (2V-5V) violated, check battery conne
 list corresponds to the second byte of the code.
 """
 
+SUPPRESSED_MSG = -4
+"""int: Code for a notice about messages suppressed by the rate limit of `src.common.log.message_pipeline`.
+"""
 ACTION_CANCELED = -3
 """int: Code for a cancelled action.
 """
@@ -87,6 +89,9 @@ ERR_WRITE_DEFAULT_PATH = 12
 ERR_USB_OTHER = 13
 """int: Error when some other USB related error happened.
 """
+ERR_JOB_FILE = 14
+"""int: Error when a sweep job file can't be read or holds an invalid job.
+"""
 
 LATEST_ERRORS_START_FREQ = 0
 """int: The index of the latest error related to the start frequency.
@@ -100,15 +105,6 @@ LATEST_ERRORS_RANGE = 2
 LATEST_ERRORS_AMPLITUDE = 3
 """int: The index of the latest error related to the amplitude.
 """
-LATEST_ERRORS_DEVICE_NOT_FOUND = ERR_USB_DEVICE_NOT_FOUND
-"""int: The index of the latest error related to device disconnection.
-"""
-LATEST_ERRORS_USB_ENDPOINTS = ERR_USB_ENDPOINTS
-"""int: The index of the latest error related to USE endpoints.
-"""
-LATEST_ERRORS_USB_WRITE = ERR_USB_WRITE
-"""int: The index of the latest error related to writing to a register via USB.
-"""
 
 #: Errors related to the EIS controller
 ERR_SERVO = 0xF0
@@ -123,10 +119,6 @@ ERR_TIMEOUT_EISSETUP = 0xF8
 ERR_TIMEOUT_RUN = 0xF9
 ERR_TIMEOUT_SEND = 0xFA
 
-CLEAR_USB_LATEST_ERRORS = {str(LATEST_ERRORS_DEVICE_NOT_FOUND): '', str(LATEST_ERRORS_USB_ENDPOINTS): '',
-                           str(LATEST_ERRORS_USB_WRITE): ''}
-"""dict of str: str: Resets all USB related latest errors.
-"""
 TYPES_OF_LATEST_ERRORS = len(MESSAGE_FORMATS)
 """int: The number of different errors.
 """
@@ -145,17 +137,6 @@ def new_latest_errors(errors):
     return [None if str(i) not in errors.keys() else errors[str(i)] for i in range(TYPES_OF_LATEST_ERRORS)]
 
 
-def print_status(msg):
-    """Logs time-coded info for debugging purposes.
-
-    Args:
-        msg (str): The message to log.
-
-    """
-    if LOG > 0:
-        print "%s: %s" % (str(datetime.datetime.now()), msg)
-
-
 def log_message(args, code, max_chars):
     """Logs a message to the console based on the message code.
 
@@ -207,6 +188,8 @@ class ConsoleMessage(object):
         color (str): The color of the box where the message will be logged.
 
     """
+    __slots__ = ('message', 'code', 'color')
+
     def __init__(self, msg, c, complement=False):
         """ConsoleMessage constructor.
 
@@ -233,10 +216,13 @@ class ConsoleMessage(object):
         elif c == ACTION_CANCELED:
             self.color = ACTION_CANCELED_COLOR
             status = "CANCEL: "
+        elif c == SUPPRESSED_MSG:
+            self.color = SUPPRESSED_COLOR
+            status = "NOTICE: "
         else:
             self.color = ERROR_COLOR
             status = "ERROR: "
-            print_status('ERROR: 0x%02X' % c)
+            trace.error('console', "ERROR: 0x%02X", c)
 
         if not complement:
             self.message += status
@@ -0,0 +1,179 @@
+"""Console message pipeline.
+
+Sits between the components that log messages and the `Console` component, so that bursts of messages e.g. the USB
+errors logged every half a second while the device is disconnected don't flood the console nor trigger a render each.
+The pipeline:
+
+    1) Folds identical consecutive messages into a single entry with a repeat counter, which the console displays as a
+        single line.
+    2) Rate-limits error messages per code, replacing the excess with a single notice of how many messages were
+        suppressed.
+    3) Flushes the entries in batches, at most once every `FLUSH_INTERVAL` milliseconds.
+
+.. _src-common-log-message_pipeline:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/log/message_pipeline.py
+
+"""
+from __future__ import absolute_import
+
+import time
+from collections import deque
+
+from src.common.log.console_message import SUPPRESSED_MSG
+
+FLUSH_INTERVAL = 100
+"""int: The number of milliseconds messages are batched for before being flushed.
+"""
+RATE_LIMIT = 5
+"""int: The max number of new error lines per code logged every `RATE_PERIOD` seconds.
+"""
+RATE_PERIOD = 10.0
+"""float: The period in seconds over which `RATE_LIMIT` applies.
+"""
+
+
+def get_message_key(args, code):
+    """Identify a message.
+
+    Args:
+        args (tuple): The args to be passed to the console message format specifiers.
+        code (int): The message code.
+
+    Returns:
+        (int, str): Equal for identical messages.
+
+    """
+    return code, repr(args)
+
+
+class MessagePipeline(object):
+    """Message Pipeline.
+
+    Attributes:
+        __sink ((list of (tuple, int, int)) -> None): Receives each batch of entries, made up of the message's args,
+            code, and how many times in a row it was logged.
+        __schedule ((int, () -> None) -> Any): Calls a function after some milliseconds e.g. `react.index.set_timeout`.
+        __pending (list of list): The entries of the next batch.
+        __last (list): The last entry flushed.
+        __history (dict of int: collections.deque of float): When the latest lines of each error code were logged.
+        __suppressed (dict of int: int): How many messages of each error code were suppressed since the last notice.
+        __scheduled (bool): Whether a flush is already scheduled.
+
+    """
+    def __init__(self, sink, schedule):
+        """MessagePipeline constructor.
+
+        Args:
+            sink ((list of (tuple, int, int)) -> None): `self.__sink`.
+            schedule ((int, () -> None) -> Any): `self.__schedule`.
+
+        """
+        self.__sink = sink
+        self.__schedule = schedule
+        self.__pending = []
+        self.__last = None
+        self.__history = {}
+        self.__suppressed = {}
+        self.__scheduled = False
+
+    def push(self, messages):
+        """Queue new messages.
+
+        Args:
+            messages (list of (tuple, int)): The messages to be logged plus their respective codes.
+
+        """
+        now = time.time()
+
+        for args, code in messages:
+            key = get_message_key(args, code)
+            last = self.__pending[-1] if len(self.__pending) else self.__last
+
+            if last is not None and last[3] == key:  #: fold
+                if len(self.__pending):
+                    last[2] += 1
+                else:  #: keep counting the last entry flushed
+                    self.__pending.append([args, code, last[2] + 1, key])
+            elif self.__allow(code, now):
+                self.__pending.append([args, code, 1, key])
+
+        self.__request_flush()
+
+    def __has_room(self, code, now):
+        """Check the rate limit of a message code.
+
+        Args:
+            code (int): The message code.
+            now (float): The current time in seconds.
+
+        Returns:
+            bool: True if a new line with this code may be logged now, False otherwise.
+
+        """
+        if code <= 0:
+            return True
+
+        history = self.__history.setdefault(code, deque())
+
+        while len(history) and now - history[0] >= RATE_PERIOD:
+            history.popleft()
+
+        return len(history) < RATE_LIMIT
+
+    def __allow(self, code, now):
+        """Apply the rate limit of error messages, counting the messages suppressed.
+
+        Args:
+            code (int): The message code.
+            now (float): The current time in seconds.
+
+        Returns:
+            bool: True if a new line with this code may be logged, False if it's suppressed.
+
+        """
+        if not self.__has_room(code, now):
+            self.__suppressed[code] = self.__suppressed.get(code, 0) + 1
+            return False
+
+        if code > 0:
+            self.__history[code].append(now)
+
+        return True
+
+    def __request_flush(self, delay=FLUSH_INTERVAL):
+        """Schedule a flush, unless one is already scheduled.
+
+        Args:
+            delay (int, optional): The number of milliseconds to wait. Default is `FLUSH_INTERVAL`.
+
+        """
+        if not self.__scheduled and (len(self.__pending) or len(self.__suppressed)):
+            self.__scheduled = True
+            self.__schedule(delay, self.flush)
+
+    def flush(self):
+        """Send the pending entries to the sink.
+
+        Notices of suppressed messages are added once the rate limit of their code allows new lines again, so while a
+        storm goes on, a notice is logged about once every `RATE_PERIOD` seconds.
+
+        """
+        self.__scheduled = False
+        now = time.time()
+
+        for code in self.__suppressed.keys():
+            if self.__has_room(code, now):
+                self.__history[code].append(now)
+                count = self.__suppressed.pop(code)
+                args = ("%i more message%s with code %i suppressed." % (count, "s" if count != 1 else "", code),)
+                self.__pending.append([args, SUPPRESSED_MSG, 1, get_message_key(args, SUPPRESSED_MSG)])
+
+        if len(self.__pending):
+            self.__last = self.__pending[-1]
+            batch = [(args, code, repeats) for args, code, repeats, _ in self.__pending]
+            self.__pending = []
+
+            self.__sink(batch)
+
+        if len(self.__suppressed):  #: make sure the notices eventually get logged
+            self.__request_flush(int(RATE_PERIOD * 1000))
@@ -0,0 +1,166 @@
+"""StageTimer class definition.
+
+Times every stage of an EIS sweep, from the start request to the csv file, and aggregates the latencies of each stage
+into histograms across sweeps. Stages are timed in two ways:
+    * Device stages and the transfer are the intervals between events marked with `StageTimer.mark` as they are
+      detected e.g. the device's status code changing to `sDAV`.
+    * Host stages are timed directly with `StageTimer.span` or `StageTimer.record`.
+
+.. _src-common-log-stage_timer:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/log/stage_timer.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+from contextlib import contextmanager
+
+from src.common.clock import monotonic
+from src.common.data_structures.latency_histogram import LatencyHistogram
+
+DEVICE_STAGES = ('request', 'acquisition')
+"""tuple of str: The stages spent waiting for the device: from the start request to `sBUSY`, and from `sBUSY` or the end
+of the previous transfer to `sDAV`.
+"""
+HOST_STAGES = ('dispatch', 'transfer', 'decode', 'reduce', 'impedance', 'analysis', 'plot', 'console', 'csv')
+"""tuple of str: The stages spent on the host: from `sDAV` to the transfer request, the transfer itself, which includes
+decoding the bytes read, reducing the data into the sweep, computing the impedance of a replayed sample, analyzing a
+data set in a `src.common.analysis_pool.AnalysisPool` worker, redrawing the plot, logging to the console, and writing
+the csv file.
+"""
+NESTED_STAGES = ('decode', 'analysis')
+"""tuple of str: The stages timed within other stages or off the Tk thread, which are left out of the host's total
+time.
+"""
+
+INTERVALS = dict(busy=('request', ('start',)), dav=('acquisition', ('start', 'busy', 'transferred')),
+                 transfer=('dispatch', ('dav',)), transferred=('transfer', ('transfer',)))
+"""dict of str: (str, tuple of str): For each event, the stage that ends with it and the events that can begin that
+stage.
+"""
+
+
+class StageTimer(object):
+    """Stage Timer.
+
+    Attributes:
+        __histograms (dict of str: src.common.data_structures.latency_histogram.LatencyHistogram): The latencies of
+            each stage across all sweeps.
+        __sweep_totals (dict of str: float): The time spent in each stage during the current sweep, in seconds.
+        __anchor ((str, float)): The event that may begin the next stage, and when it happened.
+
+    """
+    def __init__(self):
+        """StageTimer constructor."""
+        self.__histograms = dict((stage, LatencyHistogram()) for stage in DEVICE_STAGES + HOST_STAGES)
+        self.__sweep_totals = dict.fromkeys(DEVICE_STAGES + HOST_STAGES, 0.)
+        self.__anchor = None
+
+    @property
+    def histograms(self):
+        """dict of str: src.common.data_structures.latency_histogram.LatencyHistogram: The latencies of each stage
+        across all sweeps."""
+        return self.__histograms
+
+    @property
+    def sweep_totals(self):
+        """dict of str: float: The time spent in each stage during the current sweep, in seconds."""
+        return self.__sweep_totals
+
+    @property
+    def device_time(self):
+        """float: The time spent waiting for the device during the current sweep, in seconds."""
+        return sum(self.__sweep_totals[stage] for stage in DEVICE_STAGES)
+
+    @property
+    def host_time(self):
+        """float: The time spent on the host during the current sweep, in seconds."""
+        return sum(self.__sweep_totals[stage] for stage in HOST_STAGES if stage not in NESTED_STAGES)
+
+    def start_sweep(self):
+        """Forget the totals of the previous sweep and mark the start request."""
+        self.__sweep_totals = dict.fromkeys(DEVICE_STAGES + HOST_STAGES, 0.)
+        self.__anchor = None
+        self.mark('start')
+
+    def mark(self, event):
+        """Mark an event of the sweep, recording the stage it ends if the event that begins it was the last one marked.
+
+        An `sBUSY` detected after the end of a transfer is ignored, so that the acquisition of the next frequency is
+        timed from the end of the transfer rather than from `sBUSY`.
+
+        Args:
+            event (str): 'start', 'busy', 'dav', 'transfer' or 'transferred'.
+
+        """
+        now = monotonic()
+        stage, begins = INTERVALS.get(event, (None, ()))
+
+        if self.__anchor is not None and self.__anchor[0] in begins:
+            self.record(stage, now - self.__anchor[1])
+        elif event == 'busy' and self.__anchor is not None:
+            return
+
+        self.__anchor = (event, now)
+
+    def record(self, stage, seconds):
+        """Record the latency of a stage.
+
+        Args:
+            stage (str): The stage, in `DEVICE_STAGES` or `HOST_STAGES`.
+            seconds (float): The latency.
+
+        """
+        self.__histograms[stage].add(seconds)
+        self.__sweep_totals[stage] += seconds
+
+    @contextmanager
+    def span(self, stage):
+        """Time the body of a `with` statement as a stage.
+
+        Args:
+            stage (str): The stage, in `HOST_STAGES`.
+
+        """
+        start = monotonic()
+
+        try:
+            yield
+        finally:
+            self.record(stage, monotonic() - start)
+
+    def summary(self):
+        """Summarize the current sweep.
+
+        Returns:
+            str: Where the time of the current sweep went, in a single line.
+
+        """
+        stages = sorted(((seconds, stage) for stage, seconds in self.__sweep_totals.iteritems()
+                         if stage not in NESTED_STAGES and seconds > 0), reverse=True)
+
+        return "device %.1f ms, host %.1f ms (%s)" % \
+               (self.device_time * 1000, self.host_time * 1000,
+                ", ".join("%s %.1f ms" % (stage, seconds * 1000) for seconds, stage in stages))
+
+    def report(self):
+        """Report the latencies of every stage across all sweeps.
+
+        Returns:
+            str: A table with the count, mean, median, 90th percentile and maximum of each stage, in milliseconds.
+
+        """
+        lines = ["%-12s %-6s %8s %10s %10s %10s %10s" % ('stage', 'side', 'count', 'mean', 'p50', 'p90', 'max')]
+
+        for stage in DEVICE_STAGES + HOST_STAGES:
+            h = self.__histograms[stage]
+            lines.append("%-12s %-6s %8i %10.3f %10.3f %10.3f %10.3f" %
+                         (stage, 'device' if stage in DEVICE_STAGES else 'host', h.count, h.mean * 1000,
+                          h.percentile(50) * 1000, h.percentile(90) * 1000, h.max * 1000))
+
+        return "\n".join(lines)
+
+
+stage_timer = StageTimer()
+"""StageTimer: Times the stages of every EIS sweep.
+"""
@@ -0,0 +1,282 @@
+"""Event trace.
+
+A leveled trace of what the GUI is doing, meant to replace debugging `print` statements. Tracing an event only stores
+its format string and arguments in a ring buffer, so events that are filtered out cost a comparison, and events that
+are kept cost neither formatting nor I/O on the thread that traces them. A background thread formats the buffered
+events and writes them as JSON lines every `FLUSH_INTERVAL` seconds, or sooner if the buffer fills up.
+
+Events are filtered by level, which is set by `LOG`, and by subsystem, which is set by `TRACE_SUBSYSTEMS`.
+
+Example:
+::
+    from src.common.log import trace
+
+    trace.debug('usb', "Request: %s (%i bits)", w_val, len(w_val))
+
+    if trace.enabled('usb'):  #: Guard arguments that are expensive to compute
+        trace.debug('usb', "Frequencies: %s", describe(plan))
+
+.. _src-common-log-trace:
+    https://github.com/hivebattery/gui/blob/master/driver/src/common/log/trace.py
+
+"""
+from __future__ import absolute_import
+
+import atexit
+import json
+import sys
+import threading
+import time
+from functools import partial
+
+from src.common.clock import monotonic
+from src.common.data_structures.ring_buffer import RingBuffer
+from src.config.config import LOG, TRACE_SUBSYSTEMS, TRACE_FILE, TRACE_BUFFER_SIZE
+
+DEBUG = 10
+"""int: Level of detailed diagnostics e.g. every action reduced.
+"""
+INFO = 20
+"""int: Level of status updates e.g. the parameters of an EIS request.
+"""
+WARNING = 30
+"""int: Level of unexpected events the GUI recovers from.
+"""
+ERROR = 40
+"""int: Level of errors.
+"""
+OFF = 50
+"""int: Level above every other, which disables tracing.
+"""
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+"""dict of int: str: The name of each level, as written to the trace.
+"""
+
+SUBSYSTEMS = ('usb', 'reducer', 'react', 'gui', 'plot', 'console', 'file')
+"""tuple of str: The subsystems that trace events.
+"""
+
+FLUSH_INTERVAL = 0.5
+"""float: The max number of seconds an event waits in the buffer before being written.
+"""
+
+
+def get_level(log):
+    """Map the `LOG` setting to a level.
+
+    Args:
+        log (int): 0 for no logging, 1 for light logging, 2 for logging everything.
+
+    Returns:
+        int: `OFF`, `INFO` or `DEBUG`, respectively.
+
+    """
+    return (OFF, INFO, DEBUG)[min(max(log, 0), 2)]
+
+
+def format_event(event):
+    """Format a buffered event as a JSON line.
+
+    Args:
+        event ((float, float, int, str, str, tuple)): The wall-clock time, the monotonic time, the level, the subsystem,
+            the format string and its arguments.
+
+    Returns:
+        str: The JSON object of the event, with its message formatted, followed by a newline.
+
+    """
+    wall_time, mono_time, level, subsystem, fmt, args = event
+
+    try:
+        message = fmt % args if args else fmt
+    except (TypeError, ValueError):
+        message = "%s %r" % (fmt, args)
+
+    return json.dumps(dict(time=wall_time, monotonic=mono_time, level=LEVEL_NAMES.get(level, level),
+                           subsystem=subsystem, message=message)) + "\n"
+
+
+class Tracer(object):
+    """Tracer.
+
+    Attributes:
+        __level (int): The lowest level traced.
+        __subsystems (frozenset of str): The subsystems traced, or None for all of them.
+        __path (str): The path of the file the trace is appended to, or None for the standard output.
+        __buffer (src.common.data_structures.ring_buffer.RingBuffer): The events not yet written. Once full, the
+            oldest events are dropped.
+        __dropped (int): The number of events dropped since the last write.
+        __lock (threading.Lock): Guards `__buffer` and `__dropped`.
+        __write_lock (threading.Lock): Serializes writes to the trace.
+        __wake (threading.Event): Wakes the writer up before `FLUSH_INTERVAL` elapses.
+        __writer (threading.Thread): The background writer, started by the first event traced.
+        __closed (bool): True once `close` has been called.
+
+    """
+    def __init__(self, level, subsystems=None, path=None, capacity=TRACE_BUFFER_SIZE):
+        """Tracer constructor.
+
+        Args:
+            level (int): `self.level`.
+            subsystems (iterable of str, optional): `self.subsystems`. Default is None, which means all of them.
+            path (str, optional): The path of the file the trace is appended to. Default is None, which means the
+                standard output.
+            capacity (int, optional): The max number of events buffered. Default is `TRACE_BUFFER_SIZE`.
+
+        """
+        self.__level = level
+        self.__subsystems = None if subsystems is None else frozenset(subsystems)
+        self.__path = path
+        self.__buffer = RingBuffer(capacity)
+        self.__dropped = 0
+        self.__lock = threading.Lock()
+        self.__write_lock = threading.Lock()
+        self.__wake = threading.Event()
+        self.__writer = None
+        self.__closed = False
+
+    @property
+    def level(self):
+        """int: The lowest level traced."""
+        return self.__level
+
+    @property
+    def subsystems(self):
+        """frozenset of str: The subsystems traced, or None for all of them."""
+        return self.__subsystems
+
+    def enabled(self, subsystem, level=DEBUG):
+        """Check whether events would be traced.
+
+        Args:
+            subsystem (str): The subsystem of the events.
+            level (int, optional): The level of the events. Default is `DEBUG`.
+
+        Returns:
+            bool: True if events of `subsystem` at `level` are traced, False otherwise.
+
+        """
+        return level >= self.__level and (self.__subsystems is None or subsystem in self.__subsystems)
+
+    def hook(self, subsystem, level=DEBUG):
+        """Get a function that traces events of a subsystem at a level, if they are traced at all.
+
+        Args:
+            subsystem (str): The subsystem of the events.
+            level (int, optional): The level of the events. Default is `DEBUG`.
+
+        Returns:
+            (str, *args) -> None: Traces an event given its format string and arguments, or None if events of
+                `subsystem` at `level` aren't traced, so that callers can skip tracing with a single check.
+
+        """
+        return partial(self.trace, subsystem, level) if self.enabled(subsystem, level) else None
+
+    def trace(self, subsystem, level, fmt, *args):
+        """Trace an event.
+
+        The message is formatted later by the writer, so `args` should not be mutated after the call.
+
+        Args:
+            subsystem (str): The subsystem of the event.
+            level (int): The level of the event.
+            fmt (str): The format string of the message.
+            *args: The arguments of the format string.
+
+        """
+        if level < self.__level or (self.__subsystems is not None and subsystem not in self.__subsystems):
+            return
+
+        event = (time.time(), monotonic(), level, subsystem, fmt, args)
+
+        with self.__lock:
+            if self.__buffer.append(event) is not None:
+                self.__dropped += 1
+
+            full = len(self.__buffer) * 2 >= self.__buffer.capacity
+
+            if self.__writer is None and not self.__closed:
+                self.__writer = threading.Thread(target=self.__write_behind, name='trace-writer')
+                self.__writer.daemon = True
+                self.__writer.start()
+
+        if full:
+            self.__wake.set()
+
+    def debug(self, subsystem, fmt, *args):
+        """Trace an event at `DEBUG` level. See `trace`."""
+        self.trace(subsystem, DEBUG, fmt, *args)
+
+    def info(self, subsystem, fmt, *args):
+        """Trace an event at `INFO` level. See `trace`."""
+        self.trace(subsystem, INFO, fmt, *args)
+
+    def warning(self, subsystem, fmt, *args):
+        """Trace an event at `WARNING` level. See `trace`."""
+        self.trace(subsystem, WARNING, fmt, *args)
+
+    def error(self, subsystem, fmt, *args):
+        """Trace an event at `ERROR` level. See `trace`."""
+        self.trace(subsystem, ERROR, fmt, *args)
+
+    def flush(self):
+        """Write every buffered event."""
+        with self.__lock:
+            events = list(self.__buffer)
+            dropped = self.__dropped
+
+            self.__buffer.clear()
+            self.__dropped = 0
+
+        if dropped > 0:
+            events.insert(0, (time.time(), monotonic(), WARNING, 'trace', "Dropped %i events", (dropped,)))
+
+        if len(events) == 0:
+            return
+
+        lines = "".join(format_event(event) for event in events)
+
+        with self.__write_lock:
+            try:
+                if self.__path is None:
+                    sys.stdout.write(lines)
+                    sys.stdout.flush()
+                else:
+                    with open(self.__path, 'ab') as f:
+                        f.write(lines)
+            except (IOError, OSError):
+                pass  #: There is nowhere left to report this
+
+    def close(self):
+        """Stop the writer and write every buffered event."""
+        with self.__lock:
+            self.__closed = True
+            writer = self.__writer
+
+        self.__wake.set()
+
+        if writer is not None:
+            writer.join()
+
+        self.flush()
+
+    def __write_behind(self):
+        """Write the buffered events periodically until the tracer is closed."""
+        while not self.__closed:
+            self.__wake.wait(FLUSH_INTERVAL)
+            self.__wake.clear()
+            self.flush()
+
+
+tracer = Tracer(get_level(LOG), TRACE_SUBSYSTEMS, TRACE_FILE, TRACE_BUFFER_SIZE)
+"""Tracer: The GUI's trace, configured by `LOG`, `TRACE_SUBSYSTEMS`, `TRACE_FILE` and `TRACE_BUFFER_SIZE`.
+"""
+
+atexit.register(tracer.close)
+
+enabled = tracer.enabled
+hook = tracer.hook
+debug = tracer.debug
+info = tracer.info
+warning = tracer.warning
+error = tracer.error
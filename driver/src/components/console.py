@@ -1,7 +1,12 @@
 """Console Component class definition.
 
-Todo:
-    * Provide a better and smoother scrolling experience.
+The console keeps at most `MAX_CONSOLE_MESSAGES` lines in a ring buffer, and its `Listbox` only ever contains the lines
+that fit in the console, so that neither memory nor scrolling degrade when the GUI runs for days. Scrolling is handled
+by the console itself, which maps the scrollbar and the mouse wheel to the window of lines displayed.
+
+Messages reach the console through `src.common.log.message_pipeline`, in batches of entries that carry a repeat
+counter: a message repeated right after itself updates the counter shown at the end of its last line instead of adding
+new lines.
 
 .. _src-components-console:
     https://github.com/hivebattery/gui/blob/master/driver/src/components/console.py
@@ -12,8 +17,10 @@ from __future__ import absolute_import
 from react.index import Frame, Scrollbar, Listbox, END
 from react.component import Component
 
+from src.common.data_structures.ring_buffer import RingBuffer
 from src.common.log.console_message import log_message
-from src.config.config import FG_COLOR
+from src.common.log.message_pipeline import get_message_key
+from src.config.config import FG_COLOR, MAX_CONSOLE_MESSAGES, CONSOLE_LOG_FILE
 
 CONSOLE_PADDING = 3
 """int: Defines how much the console should pad each message logged.
@@ -21,6 +28,9 @@ CONSOLE_PADDING = 3
 MAX_CHARS_CONSOLE = 20
 """int: Defines the the maximum number of characters allowed per line.
 """
+CONSOLE_ROW_HEIGHT = 16
+"""int: The approximate height of a line in the console, in pixels.
+"""
 
 
 class Console(Component):
@@ -31,7 +41,10 @@ class Console(Component):
     Attributes:
         console_fr (react.widget_wrappers.Frame): The bounding box for the console that contains all messages.
         console_sc (react.widget_wrappers.Scrollbar): Allows for scrolling up and down the console messages.
-        console_li (react.widget_wrappers.Listbox): The actual container of the list of all messages.
+        console_li (react.widget_wrappers.Listbox): Displays the lines currently visible.
+        lines (src.common.data_structures.ring_buffer.RingBuffer of src.common.log.console_message.ConsoleMessage): All
+            the lines kept by the console.
+        rows (int): The number of lines displayed at once.
 
     """
     def __init__(self, parent, frame=None, **props):
@@ -48,47 +61,175 @@ class Console(Component):
 
         self.state = {}
 
+        self.lines = RingBuffer(MAX_CONSOLE_MESSAGES)
+        self.rows = max(1, (self.height or 0) // CONSOLE_ROW_HEIGHT + 1)
+
+        self.__first = 0
+        self.__follow = True
+        self.__log_file = None
+        self.__last_key = None
+        self.__last_text = None
+
         self.console_fr = Frame(self, frame=self.parent_frame, bg='gray', width=self.width, height=self.height,
                                 bd=0)
-        self.console_sc = Scrollbar(self, frame=self.console_fr)
-        self.console_li = Listbox(self, self.console_sc.set, frame=self.console_fr, bg=FG_COLOR, bd=0)
+        self.console_sc = Scrollbar(self, frame=self.console_fr, command=self.scroll)
+        self.console_li = Listbox(self, self.sync_scrollbar, frame=self.console_fr, bg=FG_COLOR, bd=0)
+
+        self.console_li.bind("<MouseWheel>", lambda e: self.scroll_wheel(-1 if e.delta > 0 else 1))
+        self.console_li.bind("<Button-4>", lambda e: self.scroll_wheel(-1))
+        self.console_li.bind("<Button-5>", lambda e: self.scroll_wheel(1))
 
     def display_messages(self):
-        """Displays new messages and appends them to the Listbox.
+        """Displays new messages.
 
-        Given a list of tuple made up of messages and message codes, these operations happen in the follwoing order:
+        Given a list of tuple made up of messages, message codes, and repeat counters, these operations happen in the
+        follwoing order:
 
             1) Check that there is at least one new message.
-            2) Generate `ConsoleMessage` instances from each new messages.
-            3) Append each new message to the listbox with its corresponding color.
-            4) Scroll down to the newest message.
-            5) Mark these new messages as processed.
+            2) Generate `ConsoleMessage` instances from each new messages and append them all to `self.lines`,
+                spilling any lines dropped to `CONSOLE_LOG_FILE`. Repeats of the newest message only update its
+                counter.
+            3) Redraw the visible lines once for the entire batch, scrolling down to the newest message unless the user
+                scrolled up.
+            4) Mark these new messages as processed.
 
         """
         new_console_msgs = self.props.new_msgs
 
-        save_msgs = []
-
         if len(new_console_msgs) > 0:  #: Step 1
-            for args, code in new_console_msgs:
-                msg_obj = log_message(args, code, MAX_CHARS_CONSOLE)  #: Step 2
+            dropped = []
+
+            for args, code, repeats in new_console_msgs:  #: Step 2
+                key = get_message_key(args, code)
 
-                for msg in msg_obj:
-                    save_msgs.append(msg)
-                    padding = "".join([" " for i in range(CONSOLE_PADDING)])
+                if repeats > 1 and key == self.__last_key and len(self.lines):
+                    self.lines[-1].message = "%s (x%i)" % (self.__last_text, repeats)
+                    continue
 
-                    self.console_li.insert(END, padding + msg.message + padding)  #: Step 3
-                    self.console_li.itemconfig(self.console_li.size() - 1, {"bg": msg.color})
+                msgs = log_message(args, code, MAX_CHARS_CONSOLE)
 
-            self.console_li.see("end")  #: Step 4
-            self.props.clear_new_msgs()
+                for msg in msgs:
+                    evicted = self.lines.append(msg)
 
-        self.console_sc.config(command=self.console_li.yview)
+                    if evicted is not None:
+                        dropped.append(evicted)
 
-        if len(save_msgs) > 0:  #: Step 5
-            self.props.update_console_messages(save_msgs)
+                if len(msgs):
+                    self.__last_key = key
+                    self.__last_text = msgs[-1].message
+
+                    if repeats > 1:
+                        msgs[-1].message = "%s (x%i)" % (self.__last_text, repeats)
+
+            self.__first = max(0, self.__first - len(dropped))
+            self.spill(dropped)
+
+            self.redraw()  #: Step 3
+            self.props.clear_new_msgs()  #: Step 4
             self.console_fr.update()
 
+    def spill(self, dropped):
+        """Append the lines dropped by `self.lines` to `CONSOLE_LOG_FILE`, if any.
+
+        Args:
+            dropped (list of src.common.log.console_message.ConsoleMessage): The lines dropped.
+
+        """
+        if CONSOLE_LOG_FILE is None or len(dropped) == 0:
+            return
+
+        if self.__log_file is None:
+            self.__log_file = open(CONSOLE_LOG_FILE, 'a')
+
+        self.__log_file.write("".join(msg.message + "\n" for msg in dropped))
+        self.__log_file.flush()
+
+    def redraw(self):
+        """Display the window of lines that starts at the first visible line.
+
+        If the console is following the newest messages, the window is moved to the bottom first.
+
+        """
+        last_first = max(0, len(self.lines) - self.rows)
+
+        if self.__follow or self.__first > last_first:
+            self.__first = last_first
+
+        padding = " " * CONSOLE_PADDING
+
+        self.console_li.delete(0, END)
+
+        for i, msg in enumerate(self.lines.window(self.__first, self.__first + self.rows)):
+            self.console_li.insert(END, padding + msg.message + padding)
+            self.console_li.itemconfig(i, {"bg": msg.color})
+
+        if self.__follow:
+            self.console_li.see(END)
+
+        self.sync_scrollbar()
+
+    def sync_scrollbar(self, *args):
+        """Set the scrollbar to reflect the window of lines displayed.
+
+        Also used as the `Listbox`'s `yscrollcommand`, whose arguments are ignored since the `Listbox` only ever
+        contains the visible lines.
+
+        Args:
+            *args: Ignored.
+
+        """
+        total = len(self.lines)
+
+        if total <= self.rows:
+            self.console_sc.set(0, 1)
+        else:
+            self.console_sc.set(float(self.__first) / total, float(min(self.__first + self.rows, total)) / total)
+
+    def scroll(self, operation, value, unit=None):
+        """Scroll the console, as requested by the scrollbar.
+
+        Args:
+            operation (str): Either 'moveto' or 'scroll'.
+            value (str): The fraction of the lines to move to, or the number of units or pages to scroll.
+            unit (str, optional): Either 'units' or 'pages' if `operation` is 'scroll'.
+
+        """
+        last_first = max(0, len(self.lines) - self.rows)
+
+        if operation == 'moveto':
+            first = int(round(float(value) * len(self.lines)))
+        else:
+            first = self.__first + int(value) * (self.rows if unit == 'pages' else 1)
+
+        self.__first = min(max(first, 0), last_first)
+        self.__follow = self.__first == last_first
+
+        self.redraw()
+
+    def scroll_wheel(self, units):
+        """Scroll the console with the mouse wheel.
+
+        Args:
+            units (int): The number of lines to scroll, where negative numbers scroll up.
+
+        Returns:
+            str: 'break', to prevent the `Listbox` from scrolling itself.
+
+        """
+        self.scroll('scroll', units, 'units')
+
+        return "break"
+
+    def component_will_unmount(self):
+        """Overrides Component's `component_will_unmount`.
+
+        Closes `CONSOLE_LOG_FILE`, if it was opened.
+
+        """
+        if self.__log_file is not None:
+            self.__log_file.close()
+            self.__log_file = None
+
     def render(self):
         """Console Component Render method.
 
@@ -18,12 +18,9 @@ from react.component import Component
 
 from src.common.log.console_message import *
 from src.common.bytes import bytes
+from src.common.data_structures.sweep_job import MAX_VALS_FREQS
 from src.config.config import *
 
-MAX_VALS_FREQS = [F_MIN, F_MIN * 2 ** 23]
-"""list of float: The lower and upper bounds for valid frequency values.
-"""
-
 
 class Form(Component):
     """Form Component.
@@ -33,6 +30,8 @@ class Form(Component):
 
     Attributes:
         __n_middle_bits (int): The number of bits between the lowest and the highest frequencies.
+        __latest_errors (list of str): The input behind the latest error logged about each entry, indexed by the
+            `LATEST_ERRORS_*` constants, so that the user is only notified once about each invalid input.
         __start_frequency_str_var (react.widget_wrappers.StringVar): Holds the input of the 'start frequency' entry.
         __end_frequency_str_var (react.widget_wrappers.StringVar): Holds the input of the 'end frequency' entry.
         __single_frequency_str_var (react.widget_wrappers.IntVar): Holds the 'single frequency' checkbox value.
@@ -69,6 +68,7 @@ class Form(Component):
         self.state = dict(single_frequency=False)
 
         self.__n_middle_bits = -1
+        self.__latest_errors = new_latest_errors({})
 
         # StringVars
         self.__start_frequency_str_var = StringVar()
@@ -259,8 +259,8 @@ class Form(Component):
 
                 hide_freqs = len(clean_messages) != 3
 
-                if len(clean_messages) > 0:
-                    self.props.update_latest_errors(clean_messages)
+                for key in clean_messages:
+                    self.__latest_errors[int(key)] = None
 
             if not is_amplitude_empty:  #: Step 2.b
                 form_validated = self.check_amplitude() and not hide_freqs
@@ -316,11 +316,12 @@ class Form(Component):
         if code != 0:
             color = ERROR_COLOR
 
-            if self.props.latest_errors[3] != amplitude_str:
-                self.props.log_messages([(args, code)], {str(LATEST_ERRORS_AMPLITUDE): amplitude_str})
+            if self.__latest_errors[LATEST_ERRORS_AMPLITUDE] != amplitude_str:
+                self.__latest_errors[LATEST_ERRORS_AMPLITUDE] = amplitude_str
+                self.props.log_messages([(args, code)])
         else:
             color = TEXT_COLOR
-            self.props.update_latest_errors({str(LATEST_ERRORS_AMPLITUDE): True})
+            self.__latest_errors[LATEST_ERRORS_AMPLITUDE] = None
 
         self.amplitude_en.configure(foreground=color)
 
@@ -354,7 +355,6 @@ class Form(Component):
 
         args = [None for i in range(3)]
         freqs_str = [re.sub(" ", "", x.get()) for x in freq_en]
-        latest_errors = {}
         messages = []
 
         for i in range(len(freq_en)):
@@ -387,9 +387,9 @@ class Form(Component):
             if code != 0:
                 color = ERROR_COLOR
 
-                if self.props.latest_errors[j] != freqs_str[j]:
+                if self.__latest_errors[j] != freqs_str[j]:
                     messages.append((args[j], code))
-                    latest_errors[str(j)] = freqs_str[j]
+                    self.__latest_errors[j] = freqs_str[j]
             else:
                 color = TEXT_COLOR
 
@@ -399,12 +399,12 @@ class Form(Component):
             freq_en[0].config(foreground=ERROR_COLOR)
             freq_en[1].config(foreground=ERROR_COLOR)
 
-            if self.props.latest_errors[2] != str(hash("#".join(freqs_str))):
+            if self.__latest_errors[LATEST_ERRORS_RANGE] != str(hash("#".join(freqs_str))):
                 messages.append((args[2], codes[2]))
-                latest_errors['2'] = str(hash("#".join(freqs_str)))
+                self.__latest_errors[LATEST_ERRORS_RANGE] = str(hash("#".join(freqs_str)))
 
-        if len(latest_errors):
-            self.props.log_messages(messages, latest_errors)
+        if len(messages):
+            self.props.log_messages(messages)
 
         return codes
 
@@ -438,7 +438,7 @@ class Form(Component):
 
         if form_validated:  #: Step 3
             amplitude_str = re.sub(" ", "", self.amplitude_en.get())
-            self.props.clear_latest_errors()
+            self.__latest_errors = new_latest_errors({})
             self.props.on_form_validated(lower_bound, upper_bound, n_freqs, int(amplitude_str))
         else:
             self.props.update_freqs(lower_bound, upper_bound, n_freqs)
@@ -5,29 +5,42 @@
 
 """
 from __future__ import absolute_import
-from decimal import Decimal
+
+import datetime
+from functools import partial
 
 import react.index as react_ctrl
 from react.component import Component
 
 from src.actions.actions import *
+from src.actions.analysis_actions import analyze_frequency, collect_analyses
+from src.common.analysis_pool import AnalysisPool
 from src.common.bytes import bytes
 from src.common.data_structures.queue import Queue
+from src.common.data_structures.sweep_job import JobQueue, DEFAULT_DEVICE
 from src.common.file import csv_files
 from src.common.file.hive_record import HiveRecord
-from src.common.log.console_message import print_status
+from src.common.file.job_file import read_jobs
+from src.common.frequency.frequency_plan import get_frequency_plan
+from src.common.log import trace
+from src.common.log.console_message import ERR_JOB_FILE
+from src.common.log.message_pipeline import MessagePipeline
+from src.common.log.stage_timer import stage_timer
 from src.components.console import Console
 from src.components.main_dashboard import MainDashboard
 from src.components.toggles_dashboard import TogglesDashboard
-from src.config.config import LOG
+from src.config.config import LOG_LINK_STATS, LOG_STAGE_LATENCIES, PROFILE, JOB_FILE, ANALYSIS_POLL_INTERVAL
 from src.reducers.index import root_reducer
-from src.config.config import F_MIN, WIDTH, N_PERIODS, N_SAMPLES
+from src.config.config import WIDTH, N_PERIODS, N_SAMPLES
 
 
 def map_state_to_props(state):
-    return dict(data=state.usb.data, is_device_connected=state.usb.is_connected, usb_handle=state.usb.usb_handle,
+    data = state.usb.data
+    analyses = state.analysis.analyses if data is not None and data.id == state.analysis.sweep_id else ()
+
+    return dict(data=data, is_device_connected=state.usb.is_connected, usb_handle=state.usb.usb_handle,
                 usb_error=state.usb.error, usb_message=state.usb.message, usb_status=state.usb.status,
-                current_range=state.usb.current_range)
+                current_range=state.usb.current_range, analyses=analyses)
 
 
 class GUI(Component):
@@ -46,9 +59,13 @@ class GUI(Component):
             main_dashboard (src.components.main_dashboard.MainDashboard): Contains either the Nyquist plot or the
                 waiting screen.
             console (src.components.console.Console): Contains the console that logs the program's progress.
+            message_pipeline (src.common.log.message_pipeline.MessagePipeline): Folds, rate-limits, and batches the
+                messages logged before they reach the console.
             toggles_db (src.components.toggles_dashboard.TogglesDashboard): Contains the form and the buttons.
-            filemenu (react.widget_wrappers.Menu): The 'File' menu with the option to change the default path to save
-                csv files.
+            filemenu (react.widget_wrappers.Menu): The 'File' menu with the options to change the default path to save
+                csv files, and to run or stop sweep jobs.
+            job_queue (src.common.data_structures.sweep_job.JobQueue): The sweep jobs queued to run unattended.
+            analysis_pool (src.common.analysis_pool.AnalysisPool): Analyzes the data sets received off the Tk thread.
             status_queue (src.common.data_structures.queue.Queue of (int, tuple)): The FIFO where ongoing EIS data
                 transfers sends any status updates or errors together with their code.
 
@@ -57,8 +74,8 @@ class GUI(Component):
         """GUI Constructor.
 
         The initialization process happen according to the following steps:
-            1) Configure React's logging feature and initialize Tkinter's root.
-            2) Connect the USB actions with the reducer and this component.
+            1) Start the analysis workers, configure React's logging feature and initialize Tkinter's root.
+            2) Connect the USB and analysis actions with their reducers and this component.
             3) Create the GUI's mainframe.
             4) Set up the state and the components.
             5) Set up 'File' menu.
@@ -66,7 +83,9 @@ class GUI(Component):
             7) Initialize timers, the .hive record, and start the Tkinter mainloop.
 
         """
-        react_ctrl.config(log=LOG)  #: Step 1
+        self.analysis_pool = AnalysisPool()  #: Step 1, before the root so that no worker process inherits Tkinter
+
+        react_ctrl.config(trace=trace.hook('react'), profile=PROFILE is not None)
 
         react_ctrl.new_root(WIDTH, WIDTH / react_ctrl.GOLDEN_RATIO, center=True, resizable=(False, False),
                             title='Hive Battery', bg="black")
@@ -74,7 +93,8 @@ class GUI(Component):
         #: Step 2
         actions = dict(usb=dict(connect=connect, start_eis=start_eis, check_connection=check_connection,
                                 poll_eis=poll_eis, start_eis_data_transfer=start_eis_data_transfer,
-                                update_usb_status=update_usb_status))
+                                update_usb_status=update_usb_status),
+                       analysis=dict(analyze_frequency=analyze_frequency, collect_analyses=collect_analyses))
 
         super(GUI, self).__init__(None, frame=react_ctrl.get_mainframe(), actions=actions,
                                   map_state_to_props=map_state_to_props, root_reducer=root_reducer)
@@ -82,11 +102,12 @@ class GUI(Component):
         react_ctrl.set_app(self)  #: Step 3
 
         #: Step 4
-        self.state = dict(form_validated=False, data=[], console_msgs=[], new_msgs=[],
-                          latest_errors=new_latest_errors({}), start_frequency=None, end_frequency=None, n_freqs=0,
-                          amplitude=0, hive_record_ready=False, attempted_write=False, error_default_path=False,
+        self.state = dict(form_validated=False, data=[], new_msgs=[], start_frequency=None, end_frequency=None,
+                          n_freqs=0, amplitude=0, hive_record_ready=False, attempted_write=False, error_default_path=False,
                           columnspan=4)
 
+        self.message_pipeline = MessagePipeline(self.flush_messages, react_ctrl.set_timeout)
+
         # StringVars
         self.n_freqs_str_var = react_ctrl.StringVar()
         self.amplitude_str_var = react_ctrl.StringVar()
@@ -99,15 +120,14 @@ class GUI(Component):
         self.main_dashboard = MainDashboard(self, frame=react_ctrl.get_mainframe(), width=curr_width, height=curr_width,
                                             x=curr_width / react_ctrl.GOLDEN_RATIO, y=0,
                                             is_device_connected=self.props.is_device_connected, data=self.props.data,
-                                            hive_record_ready=self.state.hive_record_ready,
-                                            freqs_explicit=lambda: self.freqs_explicit)
+                                            analyses=self.props.analyses,
+                                            hive_record_ready=self.state.hive_record_ready)
 
         curr_width /= react_ctrl.GOLDEN_RATIO
 
         self.console = Console(self, frame=react_ctrl.get_mainframe(), width=curr_width, height=curr_width, x=0, y=0,
-                               console_msgs=self.state.console_msgs, new_msgs=self.state.new_msgs,
-                               update_console_messages=self.update_console_messages,
-                               clear_new_msgs=self.clear_new_msgs, columnspan=self.state.columnspan)
+                               new_msgs=self.state.new_msgs, clear_new_msgs=self.clear_new_msgs,
+                               columnspan=self.state.columnspan)
 
         curr_width /= react_ctrl.GOLDEN_RATIO
 
@@ -120,13 +140,10 @@ class GUI(Component):
                                            form_validated=self.state.form_validated,
                                            # FORM PROPS
                                            toggle_form=self.toggle_form,
-                                           latest_errors=self.state.latest_errors,
                                            on_form_validated=self.on_form_validated, update_freqs=self.update_freqs,
                                            log_messages=self.log_messages, n_freqs_str_var=self.n_freqs_str_var,
                                            n_freqs=self.state.n_freqs, amplitude_str_var=self.amplitude_str_var,
                                            amplitude_int_var=self.amplitude_int_var,
-                                           clear_latest_errors=self.clear_latest_errors,
-                                           update_latest_errors=self.update_latest_errors,
                                            poll_history=lambda key, d: self.hive_record.poll_history(key, d),
                                            # BUTTON PROPS
                                            on_start_eis=self.on_start_eis, on_stop_eis=self.on_start_eis,
@@ -143,19 +160,26 @@ class GUI(Component):
         self.filemenu.add_command(label="Change default csv path...", command=lambda: self.change_default_path()
                                   if self.state.hive_record_ready else self.init_hive_record())
 
+        self.filemenu.add_separator()
+        self.filemenu.add_command(label="Run sweep jobs...", command=self.open_job_file)
+        self.filemenu.add_command(label="Stop sweep jobs", command=self.stop_jobs)
+
         react_ctrl.add_submenu(self.filemenu, 'File')
 
         self.status_queue = Queue(self.new_status_code)  #: Step 6
+        self.job_queue = JobQueue()
 
         self.__progress_timer = None
         self.__connection_timer = None
-        self.__freqs_explicit = None
+        self.__frequency_plan = None
         self.__current_range = None
         self.__battery_voltage = None
         self.__hive_record = None
         self.__start_time = None
         self.__block_actions = False
         self.__fetching_data = False
+        self.__job_timer = None
+        self.__analysis_timer = None
 
         #: Step 7
         self.init_gui()
@@ -187,14 +211,20 @@ class GUI(Component):
         self.__progress_timer = value
 
     @property
-    def freqs_explicit(self):
-        """list of str: The explicit number of mHz for each frequency.
+    def frequency_plan(self):
+        """src.common.frequency.frequency_plan.FrequencyPlan: The frequencies of the latest EIS request.
         """
-        return self.__freqs_explicit
+        return self.__frequency_plan
+
+    @frequency_plan.setter
+    def frequency_plan(self, value):
+        self.__frequency_plan = value
 
-    @freqs_explicit.setter
-    def freqs_explicit(self, value):
-        self.__freqs_explicit = value
+    @property
+    def n_freqs_requested(self):
+        """int: The number of frequencies of the latest EIS request, be it from the form or a sweep job.
+        """
+        return 0 if self.frequency_plan is None else len(self.frequency_plan)
 
     @property
     def current_range(self):
@@ -259,7 +289,9 @@ class GUI(Component):
     def init_gui(self):
         """Initialize GUI.
 
-        Starts timers, renders all components, initializes .hive record, and starts Tkinter's mainloop.
+        Starts timers, renders all components, initializes .hive record, and starts Tkinter's mainloop. Once the
+        mainloop exits, any pending changes to the .hive record are written and React's render profile is dumped if
+        profiling is on.
 
         """
         self.init_timers()
@@ -267,8 +299,21 @@ class GUI(Component):
         self.render()
 
         react_ctrl.set_immediate(self.init_hive_record)
+
+        if JOB_FILE is not None:
+            react_ctrl.set_immediate(lambda: self.queue_jobs(JOB_FILE))
+
         react_ctrl.get_root().mainloop()
 
+        self.analysis_pool.close()
+
+        if self.hive_record is not None:
+            self.hive_record.close()
+
+        if PROFILE is not None:
+            print react_ctrl.format_profile_report(limit=20)
+            react_ctrl.dump_profile(PROFILE)
+
     def init_timers(self):
         """Initialize timers.
 
@@ -287,10 +332,13 @@ class GUI(Component):
         of the .hive record initialization attempt.
 
         """
-        if LOG > 0:
-            print_status("INIT HIVE RECORD")
+        trace.info('gui', "INIT HIVE RECORD")
 
         self.block_actions = True
+
+        if self.hive_record is not None:
+            self.hive_record.close()
+
         self.hive_record = HiveRecord(self.log_messages)
         self.block_actions = False
 
@@ -320,7 +368,6 @@ class GUI(Component):
 
         """
         msgs = []
-        latest_errors = None
         callbacks = []
 
         #: Props related to the connection and disconnection of the device.
@@ -328,7 +375,6 @@ class GUI(Component):
             if self.props.is_device_connected != props.is_device_connected:
                 if props.is_device_connected:
                     msgs.append(("Connected to device.", 0))
-                    latest_errors = CLEAR_USB_LATEST_ERRORS
                 else:
                     callbacks.append((0, lambda: self.set_state(dict(form_validated=False))))
 
@@ -341,16 +387,18 @@ class GUI(Component):
                     self.fetching_data = False
 
                 if props.usb_status == sBUSY:
+                    stage_timer.mark('busy')
                     msg = "Waiting for EIS to finish..."
                 elif props.usb_status == sSIGN:
                     pass
                 elif props.usb_status == sDAV:
+                    stage_timer.mark('dav')
                     freq_id = 0 if self.props.data is None else len(self.props.data)
                     msg = "Data available. Requesting frequency number %i..." % (freq_id + 1)
 
                     self.block_actions = True
 
-                    if self.state.n_freqs - freq_id > 0:
+                    if self.n_freqs_requested - freq_id > 0:
                         callbacks.append((0, lambda: self.props.usb.start_eis_data_transfer(self.props.usb_handle,
                                                                                             self.status_queue,
                                                                                             freq_id)))
@@ -367,28 +415,48 @@ class GUI(Component):
 
         #: Props related to the voltage and current data returned by the device.
         if hasattr(props, 'data'):
-            if props.data is not None and (self.props.data is None or len(self.props.data) != len(props.data)):
+            if props.data is not None and len(props.data) > 0 and \
+                    (self.props.data is None or self.props.data.version != props.data.version):
                 self.block_actions = False
-                freqs_left = self.state.n_freqs - len(props.data)
-                freq_id = 0 if self.props.data is None else len(self.props.data)
+                freqs_left = self.n_freqs_requested - len(props.data)
+                freq_id = 0 if self.props.data is None or self.props.data.id != props.data.id else len(self.props.data)
+
+                for i in xrange(freq_id, len(props.data)):
+                    callbacks.append((0, partial(self.props.analysis.analyze_frequency, self.analysis_pool, props.data,
+                                                 i)))
+
+                if self.__analysis_timer is None:
+                    self.__analysis_timer = react_ctrl.set_timeout(ANALYSIS_POLL_INTERVAL, self.poll_analyses)
 
                 msgs.append(("Received data. %i frequenc%s left." % (freqs_left, "ies" if freqs_left != 1 else 'y'),
                              0))
 
                 if freqs_left <= 0:
-                    msgs.append(("Done with %i frequencies." % self.state.n_freqs, 0))
-
-                    callbacks.append((0,
-                                      lambda: csv_files.write_current_voltage_csv(self.hive_record.default_csv_path,
-                                                                                  'test_raw', self.props.data,
-                                                                                  self.freqs_explicit,
-                                                                                  N_SAMPLES, N_PERIODS,
-                                                                                  self.current_range,
-                                                                                  self.battery_voltage,
-                                                                                  '0123456789', self.start_time,
-                                                                                  self.log_messages)))
-
-                    if self.toggles_db.buttons.force_disabled:
+                    msgs.append(("Done with %i frequencies." % self.n_freqs_requested, 0))
+
+                    if LOG_LINK_STATS:
+                        msgs.append(("USB link: %s." % link_stats.sweep, -1))
+
+                    if self.job_queue.running:  #: Start the next run right away, then write this one's file
+                        job = self.job_queue.current
+                        file_name = self.job_queue.csv_name
+
+                        self.job_queue.finish_run()
+                        self.schedule_next_run(job.delay)
+                    else:
+                        job = None
+                        file_name = 'test_raw'
+
+                    callbacks.append((0, partial(csv_files.write_current_voltage_csv,
+                                                 self.hive_record.default_csv_path, file_name, props.data,
+                                                 self.current_range, self.battery_voltage,
+                                                 DEFAULT_DEVICE if job is None else job.device, self.start_time,
+                                                 self.log_messages)))
+
+                    if LOG_STAGE_LATENCIES:
+                        callbacks.append((0, self.report_latencies))
+
+                    if self.toggles_db.buttons.force_disabled and len(self.job_queue) == 0:
                         self.toggles_db.buttons.toggle_force_disable()
 
         #: Props related to usb errors.
@@ -400,7 +468,10 @@ class GUI(Component):
 
                     self.block_actions = False
 
-                    if self.toggles_db.buttons.force_disabled:
+                    if self.job_queue.running:  #: The run is lost, move on to the next one
+                        self.job_queue.finish_run(ok=False)
+                        self.schedule_next_run(self.job_queue.current.delay)
+                    elif self.toggles_db.buttons.force_disabled and len(self.job_queue) == 0:
                         self.toggles_db.buttons.toggle_force_disable()
 
         #: Update props on this components.
@@ -408,7 +479,7 @@ class GUI(Component):
 
         #: Log any messages generated.
         if len(msgs) > 0:
-            self.log_messages(msgs, latest_errors)
+            self.log_messages(msgs)
 
         #: Call any pending callbacks
         if len(callbacks) > 0:
@@ -469,64 +540,58 @@ class GUI(Component):
 
         react_ctrl.set_timeout(timeout, self.poll_eis_status)
 
-    def log_messages(self, messages, latest_errors=None):
-        """Log new messages.
-
-        Update the state of this component to reflect new messages that need to be logged and pass this information
-        down to the Console component as props.
+    def poll_analyses(self):
+        """Collect the analyses finished by `self.analysis_pool`.
 
-        Args:
-            messages (list of (str, int)): The messages to be logged plus their respective codes.
-            latest_errors (dict of str: str, optional): Any errors that should be remembered to prevent logging the
-                same message twice.
+        Keeps calling itself every `ANALYSIS_POLL_INTERVAL` milliseconds for as long as analyses are pending.
 
         """
-        state = dict(new_msgs=(self.state.new_msgs + messages))
+        self.props.analysis.collect_analyses(self.analysis_pool)
 
-        if latest_errors is not None:
-            state['latest_errors'] = self.state.latest_errors[:]
+        if self.analysis_pool.pending > 0:
+            self.__analysis_timer = react_ctrl.set_timeout(ANALYSIS_POLL_INTERVAL, self.poll_analyses)
+        else:
+            self.__analysis_timer = None
 
-            for item in latest_errors.items():
-                key, val = item
-                state['latest_errors'][int(key)] = val
+    def log_messages(self, messages):
+        """Log new messages.
 
-        self.set_state(state)
+        The messages go through `self.message_pipeline`, which folds repeated messages, rate-limits errors, and
+        eventually flushes them to `self.flush_messages` in a single batch.
 
-    def clear_new_msgs(self):
-        """Indicate that all messages have been logged and can now be deleted.
+        Args:
+            messages (list of (str, int)): The messages to be logged plus their respective codes.
 
         """
-        self.set_state(dict(new_msgs=[]))
-
-    def clear_latest_errors(self):
-        """Erase all tracks of previous errors.
+        self.message_pipeline.push(messages)
 
-        """
-        self.set_state(dict(latest_errors=new_latest_errors({})))
+    def flush_messages(self, entries):
+        """`self.message_pipeline` sink.
 
-    def update_latest_errors(self, errors):
-        """Add new errors to be remembered.
+        Update the state of this component to reflect new messages that need to be logged and pass this information
+        down to the Console component as props.
 
         Args:
-            errors (dict of str: str): The errors to be remembered.
+            entries (list of (tuple, int, int)): The messages to be logged plus their respective codes and repeat
+                counters.
 
         """
-        out = {}
+        with stage_timer.span('console'):
+            self.set_state(dict(new_msgs=(self.state.new_msgs + entries)))
 
-        for i in range(len(self.state.latest_errors)):
-            if str(i) not in errors.keys():
-                out[str(i)] = self.state.latest_errors[i]
+    def report_latencies(self):
+        """Log where the time of the last EIS sweep went, and trace the latencies of each stage across all sweeps.
 
-        self.set_state(dict(latest_errors=new_latest_errors(out)))
+        """
+        self.log_messages([("Sweep timing: %s." % stage_timer.summary(), -1)])
 
-    def update_console_messages(self, console_msgs):
-        """Update the list that contains all logged messages with the messages most recently passed down to the console.
+        trace.info('gui', "Stage latencies:\n%s", stage_timer.report())
 
-        Args:
-            console_msgs (list of (int, str)): The updated list of messages.
+    def clear_new_msgs(self):
+        """Indicate that all messages have been logged and can now be deleted.
 
         """
-        self.set_state(dict(console_msgs=console_msgs))
+        self.set_state(dict(new_msgs=[]))
 
     def update_freqs(self, start_frequency, end_frequency, n_freqs):
         """Pass up the validated form input to this component pertaining to frequencies.
@@ -566,11 +631,9 @@ class GUI(Component):
 
         Given the validated form, do the following steps:
             1) Disable the form and save the correct input to each entry's input history in the .hive record.
-            2) Extract all parameters from the form and check whether the request includes just a single frequency or
-                more.
-            3) Calculate the explicit binary string representing the frequencies requested and print all the request
-                parameters to the console.
-            4) Start EIS with the specified parameters, making a note of the starting time.
+            2) Extract all parameters from the form.
+            3) Get the plan of the frequencies requested, which includes the binary string sent to the device, and start
+                EIS.
 
         """
         self.toggles_db.buttons.toggle_force_disable()  #: Step 1
@@ -578,42 +641,130 @@ class GUI(Component):
         history_dict = dict(start_frequency=int(self.toggles_db.form.start_frequency_en.get(), 10),
                             amplitude=self.state.amplitude)
 
+        if self.state.end_frequency is not None:
+            history_dict['end_frequency'] = int(self.toggles_db.form.end_frequency_en.get(), 10)
+
+        self.hive_record.add_field_history(history_dict)
+
         amplitude_type = self.amplitude_int_var.get()  #: Step 2
         amplitude = self.state.amplitude
 
-        freqs_exp = [self.state.start_frequency, self.state.end_frequency]
-        n_freqs = self.state.n_freqs
+        plan = get_frequency_plan(self.state.start_frequency, self.state.end_frequency, self.state.n_freqs,  #: Step 3
+                                  N_PERIODS)
 
-        if freqs_exp[1] is None:  #: Step 3
-            freq_bytes = bin(2 ** freqs_exp[0])[2:].zfill(24)
-            self.freqs_explicit = bytes.map_ones_to_decimal(freq_bytes, factor=F_MIN)[:1]
-            msg = "Requesting EIS with %i frequency (mHz): %.2E," % (n_freqs, (Decimal(self.freqs_explicit[0]) / 1000))
-        else:
-            history_dict['end_frequency'] = int(self.toggles_db.form.end_frequency_en.get(), 10)
-            freq_bytes = "".join("0" for i in range(23 - freqs_exp[1]))
-            freq_bytes += bin(int(bytes.balance_binary_string(F_MIN,
-                                                              2 ** (freqs_exp[1] - freqs_exp[0] - 1)
-                                                              * F_MIN, n_freqs - 2),
-                                  2))[2:]
-            freq_bytes += "".join("0" for i in range(freqs_exp[0]))
+        self.start_sweep(plan, amplitude, amplitude_type)
+
+    def start_sweep(self, plan, amplitude, amplitude_type):
+        """Start an EIS sweep.
 
-            self.freqs_explicit = bytes.map_ones_to_decimal(freq_bytes, factor=F_MIN)
+        Print all the request parameters to the console, and start EIS with them, making a note of the starting time.
 
+        Args:
+            plan (src.common.frequency.frequency_plan.FrequencyPlan): The frequencies requested.
+            amplitude (int): The amplitude.
+            amplitude_type (int): 0 for voltage, 1 for current.
+
+        """
+        self.frequency_plan = plan
+        freqs_hz = plan.frequencies / 1000
+        n_freqs = len(freqs_hz)
+
+        if plan.end is None:
+            msg = "Requesting EIS with %i frequency (mHz): %.2E," % (n_freqs, freqs_hz[0])
+        else:
             msg = "Requesting EIS with %i frequencies (Hz): %s" % \
-                  (n_freqs, ", ".join(['%.2E' % (Decimal(freq_exp) / 1000) for freq_exp in self.freqs_explicit[:-1]]))
+                  (n_freqs, ", ".join(['%.2E' % freq_hz for freq_hz in freqs_hz[:-1]]))
 
-            if len(self.freqs_explicit[:-1]) > 1:
+            if len(freqs_hz[:-1]) > 1:
                 msg += ","
 
-            msg += " and %.2E" % (Decimal(self.freqs_explicit[-1]) / 1000) + ","
+            msg += " and %.2E" % freqs_hz[-1] + ","
 
         msg += " and amplitude (mV): %i." % amplitude
 
         self.log_messages([(msg, -1)])
-        self.hive_record.add_field_history(history_dict)
 
-        self.start_time = datetime.datetime.now()  #: Step 4
-        self.props.usb.start_eis(self.props.usb_handle, freq_bytes, amplitude, amplitude_type, N_SAMPLES, N_PERIODS)
+        self.start_time = datetime.datetime.now()
+        self.props.usb.start_eis(self.props.usb_handle, plan, amplitude, amplitude_type, N_SAMPLES, N_PERIODS)
+
+    def open_job_file(self):
+        """Ask the user for a sweep job file and queue its jobs.
+
+        """
+        path = react_ctrl.AskOpenFilename(title="Sweep jobs", filetypes=[("Sweep jobs", "*.json")])
+
+        if path:
+            self.queue_jobs(path)
+
+    def queue_jobs(self, path):
+        """Queue the sweep jobs of a job file, and start running them unless they're already running.
+
+        Args:
+            path (str): The path of the job file. See `src.common.file.job_file`.
+
+        """
+        try:
+            jobs = read_jobs(path)
+        except (IOError, ValueError) as e:
+            self.log_messages([((path, e), ERR_JOB_FILE)])
+
+            return
+
+        self.job_queue.extend(jobs)
+        self.log_messages([("Queued %i sweep job%s (%s)." % (len(jobs), "s" if len(jobs) != 1 else "",
+                                                              self.job_queue.progress()), 0)])
+        self.schedule_next_run(0)
+
+    def stop_jobs(self):
+        """Drop the sweep jobs that haven't started. The current run, if any, is finished.
+
+        """
+        self.job_queue.clear()
+        self.log_messages([("Stopped sweep jobs (%s)." % self.job_queue.progress(), -3)])
+
+    def schedule_next_run(self, mseconds):
+        """Start the next run of the sweep jobs after a delay, unless it's already scheduled or a run is ongoing.
+
+        Args:
+            mseconds (int): The delay.
+
+        """
+        if self.__job_timer is None and not self.job_queue.running:
+            self.__job_timer = react_ctrl.set_timeout(mseconds, self.start_next_run)
+
+    def start_next_run(self):
+        """Start the next run of the sweep jobs.
+
+        The run waits for the device to be connected and the .hive record to be ready. Once every run has finished, the
+        buttons are enabled again.
+
+        """
+        self.__job_timer = None
+
+        if self.job_queue.running:
+            return
+
+        if self.block_actions or not self.props.is_device_connected or not self.state.hive_record_ready:
+            self.schedule_next_run(500)
+
+            return
+
+        job = self.job_queue.start_run()
+
+        if job is None:
+            self.log_messages([("Done with sweep jobs: %s, %i failed." % (self.job_queue.progress(),
+                                                                          self.job_queue.n_failed), 0)])
+
+            if self.toggles_db.buttons.force_disabled:
+                self.toggles_db.buttons.toggle_force_disable()
+
+            return
+
+        if not self.toggles_db.buttons.force_disabled:
+            self.toggles_db.buttons.toggle_force_disable()
+
+        self.log_messages([("Running sweep %s." % self.job_queue.progress(), -1)])
+        self.start_sweep(job.plan, job.amplitude, job.amplitude_type)
 
     def render(self):
         """GUI Render method.
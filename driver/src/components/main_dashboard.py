@@ -46,7 +46,7 @@ class MainDashboard(Component):
         self.label = Label(self, self.status, frame=self.dashboard, bg=BG_COLOR, foreground=TEXT_COLOR,
                            font=("Helvetica", 30))
         self.nyquist_plot = Plot(self, frame=self.dashboard, width=self.width, height=self.height,
-                                 x=self.x, y=0, data=self.props.data, freqs_explicit=self.props.freqs_explicit)
+                                 x=self.x, y=0, data=self.props.data, analyses=self.props.analyses)
 
     def render(self):
         """Main Dashboard Component Render method.
@@ -10,12 +10,15 @@ Todo:
 from __future__ import absolute_import
 
 from matplotlib import pyplot as plt
-import numpy as np
 import json
 
 from react.index import FigureCanvas, get_root, set_close_window_handler
 from react.component import Component
 
+from src.common.data_structures.sweep_log import SweepLog
+from src.common.file.sweep_csv import SweepCSV
+from src.common.log import trace
+from src.common.log.stage_timer import stage_timer
 from src.methods import fourier
 from src.config.config import *
 
@@ -36,13 +39,21 @@ class Plot(Component):
             ],
         }.
 
-    If this file does not exists, then an exception is raised to indicate that the normal execution of EIS will be done
-    instead.
+    A csv file written by `src.common.file.csv_files.write_current_voltage_csv` can be replayed instead, by copying it
+    to `src/temp/raw_data.csv`, which takes precedence over `raw_data.json`. Only its header is read up front, and the
+    samples of each frequency are loaded as the device sends the data set they replace. The frequencies beyond those of
+    the file aren't plotted, and a file that doesn't follow the layout is ignored.
+
+    If neither file exists, then an exception is raised to indicate that the normal execution of EIS will be done
+    instead: the impedances are then read from the `analyses` prop, which `src.common.analysis_pool.AnalysisPool` fills
+    off the Tk thread.
 
     Attributes:
         __drew_axes (bool): Whether the axes should be displayed.
+        __line (matplotlib.lines.Line2D): The line through the impedances plotted so far, or None.
         voltage (list of float): The voltage data for all frequencies.
         current (list of float): The current data for all frequencies.
+        replay (src.common.file.sweep_csv.SweepCSV): The csv file replayed, or None.
         fig (matplotlib.Figure): The matplotlib figure object.
         a (matplotlib.Axes): The matplotlib axes object.
         plot (react.widget_wrappers.FigureCanvas): The canvas that contains all the plot data.
@@ -64,12 +75,21 @@ class Plot(Component):
         """
         super(Plot, self).__init__(parent, frame, **props)
 
-        self.state = dict(impedance_data=[], coords=None)
+        self.state = dict(impedance_data=SweepLog(), coords=None)
 
         self.__draw_axes = False
+        self.__line = None
 
         self.voltages = None
         self.currents = None
+        self.replay = None
+
+        try:
+            self.replay = SweepCSV.open('./temp/raw_data.csv')
+        except (OSError, IOError) as e:
+            trace.debug('plot', "No sample csv: %s", e)
+        except ValueError as e:  #: A malformed file is ignored, which falls back on the EIS data
+            trace.warning('plot', "Ignored the sample csv: %s", e)
 
         try:
             f = open('./temp/raw_data.json', 'rb')
@@ -90,7 +110,7 @@ class Plot(Component):
                 for i in range(len(self.real_data)):
                     curr_freq.append(self.real_data[i][j])
         except (OSError, IOError) as e:
-            print e
+            trace.debug('plot', "No sample data: %s", e)
 
         self.fig, self.a = plt.subplots()
 
@@ -110,9 +130,9 @@ class Plot(Component):
         """Overrides Component's `component_will_receive_props`.
 
         Plot the impedance data according to the current frequency's voltage and current data. This method behaves
-        according to whether `src/temp/raw_data.json` exists. If it exists, then we use the sample data corresponding
-        to that frequency's id. Otherwise, use the actual data generated by EIS and passed down as a prop to this
-        component.
+        according to whether `src/temp/raw_data.csv` or `src/temp/raw_data.json` exists. If it exists, then we use the
+        sample data corresponding to that frequency's id. Otherwise, plot the analyses passed down as a prop to this
+        component, in frequency order, as they arrive.
 
         Args:
             props: The new props that haven't been updated on this component.
@@ -121,38 +141,56 @@ class Plot(Component):
             React module :py:mod:`component`.
 
         """
-        if hasattr(props, 'data'):
-            data = props.data
+        if hasattr(props, 'data') and (props.data is None or len(props.data) == 0):
+            self.a.clear()
+            self.__draw_axes = False
+            self.__line = None
+        elif self.replay is not None or self.voltages is not None:
+            if hasattr(props, 'data') and (self.props.data is None or self.props.data.version != props.data.version):
+                freq_id = len(props.data) - 1
 
-            if data is None:
-                self.a.clear()
-                self.__draw_axes = False
-            elif len(data) > 0:
-                if not self.drew_axes:
-                    self.prepare_axes()
+                if self.replay is not None and freq_id >= len(self.replay):
+                    trace.warning('plot', "Frequency %i is beyond the %i frequencies of the sample csv, so it isn't "
+                                  "plotted.", freq_id + 1, len(self.replay))
+                else:
+                    with stage_timer.span('impedance'):
+                        if self.replay is not None:
+                            impedance = fourier.get_impedance(self.replay.load([freq_id])[0],
+                                                              self.replay.samples_per_period[freq_id])
+                        else:
+                            impedance = fourier.get_impedance(self.voltages[freq_id] + self.currents[freq_id],
+                                                              props.data.samples_per_period[freq_id])
 
-                freq_id = len(props.data) - 1
+                    impedance_data = (SweepLog() if len(props.data) == 1 else self.state.impedance_data).append(
+                        impedance)
 
-                curr_data = props.data[-1][1] if self.voltages is None \
-                    else self.voltages[freq_id] + self.currents[freq_id]
+                    self.plot_impedances(impedance_data)
+                    self.set_state(dict(impedance_data=impedance_data))
+        elif hasattr(props, 'analyses') and props.analyses is not self.props.analyses:
+            impedances = [analysis.impedance for analysis in props.analyses if analysis is not None]
 
-                freq_bit = int(np.round(np.log2(float(self.props.freqs_explicit()[freq_id]) / F_MIN))) & 23
-                freq_explicit = 2 ** (27 - freq_bit) if freq_bit >= 21 else 128
+            if len(impedances) > 0:
+                self.plot_impedances(impedances)
 
-                impedance = fourier.get_impedance(curr_data, freq_explicit)
+    def plot_impedances(self, impedance_data):
+        """Redraw the line through the impedances.
 
-                if len(props.data) == 1:
-                    impedance_data = [impedance]
-                else:
-                    impedance_data = self.state.impedance_data + [impedance]
+        Args:
+            impedance_data (iterable of complex): The impedances, in frequency order.
+
+        """
+        if not self.__draw_axes:
+            self.prepare_axes()
 
-                impedance_real = [z.real for z in impedance_data]
-                impedance_imag = [z.imag for z in impedance_data]
+        impedance_real = [z.real for z in impedance_data]
+        impedance_imag = [z.imag for z in impedance_data]
 
-                self.a.plot(impedance_real, impedance_imag, '-go')
-                self.plot.plot_show()
+        with stage_timer.span('plot'):
+            if self.__line is not None:  #: Analyses may arrive out of order, so the whole line is replaced
+                self.__line.remove()
 
-                self.set_state(dict(impedance_data=impedance_data))
+            self.__line, = self.a.plot(impedance_real, impedance_imag, '-go')
+            self.plot.plot_show()
 
     def prepare_axes(self):
         """Configure axes with their corresponding labels, ticks, and grid lines.
@@ -168,7 +206,7 @@ class Plot(Component):
             tick.label.set_color(TEXT_COLOR)
 
         self.a.grid(which='both')
-        self.a.set_axis_bgcolor(FG_COLOR)
+        self.a.set_facecolor(FG_COLOR)
 
         self.a.minorticks_on()
 
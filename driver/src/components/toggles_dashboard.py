@@ -49,12 +49,10 @@ class TogglesDashboard(Component):
 
         self.form = Form(self, self.dashboard, width=self.width, height=self.height - 50,
                          toggle_form=self.props.toggle_form, form_validated=self.props.form_validated,
-                         latest_errors=self.props.latest_errors, on_form_validated=self.props.on_form_validated,
+                         on_form_validated=self.props.on_form_validated,
                          update_freqs=self.props.update_freqs, log_messages=self.props.log_messages,
                          n_freqs_str_var=self.props.n_freqs_str_var, n_freqs=self.props.n_freqs,
                          amplitude_str_var=self.props.amplitude_str_var, amplitude_int_var=self.props.amplitude_int_var,
-                         clear_latest_errors=self.props.clear_latest_errors,
-                         update_latest_errors=self.props.update_latest_errors,
                          poll_history=lambda key, d: self.props.poll_history(key, d),
                          is_device_connected=self.props.is_device_connected,
                          hive_record_ready=self.props.hive_record_ready)
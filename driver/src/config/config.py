@@ -7,7 +7,21 @@ Provides a quick and easy way to configure certain aspects of the GUI via global
 #: Configuration params
 LOG = 0
 """int: Determines what kind of logging should occur. 0 means no logging, 1 means light logging e.g. status updates
-about actions and the EIS parameters, and 2 means logging everything.
+about actions and the EIS parameters, and 2 means logging everything. See `src.common.log.trace`.
+"""
+TRACE_SUBSYSTEMS = None
+"""tuple of str: The subsystems whose events are traced e.g. ('usb', 'reducer'). None means all of them. See
+`src.common.log.trace.SUBSYSTEMS`.
+"""
+TRACE_FILE = None
+"""str: The path of the file where the trace is appended as JSON lines. None means the standard output.
+"""
+TRACE_BUFFER_SIZE = 4096
+"""int: The max number of events buffered before being written to the trace. Older events are dropped once full.
+"""
+PROFILE = None
+"""str: The path of the JSON file where React's render profile will be dumped when the GUI closes. None means no
+profiling.
 """
 DEV = False
 """bool: True if the GUI should simulate a device connection, False otherwise.
@@ -24,6 +38,35 @@ N_PERIODS = 8
 MAX_HISTORY_RECORDS = 10
 """int: The max number of input stored in the entries' input history arrays.
 """
+MAX_CONSOLE_MESSAGES = 1000
+"""int: The max number of lines kept by the console. Older lines are dropped, or spilled to `CONSOLE_LOG_FILE`.
+"""
+CONSOLE_LOG_FILE = None
+"""str: The path of the file where the lines dropped by the console are appended. None means they are discarded.
+"""
+LOG_LINK_STATS = False
+"""bool: True if the traffic of the USB link should be logged to the console at the end of each EIS sweep, False
+otherwise.
+"""
+LOG_STAGE_LATENCIES = False
+"""bool: True if the time spent in each stage of an EIS sweep should be logged to the console at the end of each sweep,
+and the latencies of each stage across all sweeps traced, False otherwise.
+"""
+JOB_FILE = None
+"""str: The path of a sweep job file (see `src.common.file.job_file`) queued at startup, to run sweeps unattended. None
+means jobs are only queued from the 'File' menu.
+"""
+ANALYSIS_WORKERS = 2
+"""int: The number of workers analyzing the data sets of each sweep off the Tk thread. 0 means they are analyzed on the
+Tk thread.
+"""
+ANALYSIS_PROCESSES = False
+"""bool: True if the analysis workers should be processes, which scale with cores, False if they should be threads,
+which are cheaper to start.
+"""
+ANALYSIS_POLL_INTERVAL = 20
+"""int: The number of milliseconds between checks for finished analyses, while any is pending.
+"""
 
 #: Aesthetics
 BG_COLOR = '#%02x%02x%02x' % (56, 59, 61)
@@ -53,6 +96,9 @@ ACTION_CANCELED_COLOR = '#FFAB91'
 ERROR_COLOR = '#EF9A9A'
 """str: The color associated with failures.
 """
+SUPPRESSED_COLOR = '#E0E0E0'
+"""str: The color of the notices about messages that were suppressed by the console's rate limit.
+"""
 WIDTH = 1000
 """int: The width of the GUI. The height is the golden ratio of the width.
 """
@@ -0,0 +1,82 @@
+"""Provides the analysis of the data sets of an EIS sweep.
+
+These functions run in the workers of `src.common.analysis_pool`, so they only take and return picklable values.
+
+.. _src-methods-analysis:
+    https://github.com/hivebattery/gui/blob/master/driver/src/methods/analysis.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+from collections import namedtuple
+
+import numpy as np
+
+from src.methods import fourier
+
+ANALYSIS_VERSION = 1
+"""int: Bumped whenever `analyze` changes its results, so that analyses cached by `src.methods.reprocess` are redone.
+"""
+
+Analysis = namedtuple('Analysis', ['impedance', 'voltage_amplitude', 'current_amplitude', 'voltage_snr',
+                                   'current_snr'])
+"""type: The analysis of a frequency: its impedance, the amplitudes of the voltage and current at the frequency
+measured, and their signal-to-noise ratios in dB, i.e. the power at the frequency measured over the power at every
+other frequency but DC.
+"""
+
+
+def get_spectrum_metrics(spectra, target, n_samples):
+    """Measure the amplitude and signal-to-noise ratio of signals out of their spectra.
+
+    Args:
+        spectra (numpy.ndarray of complex): One real Fourier transform per row.
+        target (int): The bin of the frequency measured.
+        n_samples (int): The number of samples transformed.
+
+    Returns:
+        (numpy.ndarray of float, numpy.ndarray of float): The amplitude and the signal-to-noise ratio in dB of each row.
+
+    """
+    power = np.abs(spectra) ** 2
+    signal = power[:, target]
+    noise = power[:, 1:].sum(axis=1) - signal
+
+    with np.errstate(divide='ignore'):
+        snr = 10 * np.log10(signal / noise)
+
+    return 2 * np.sqrt(signal) / n_samples, snr
+
+
+def analyze(data_sets, samples_per_period):
+    """Analyze many frequencies at once.
+
+    The impedance is computed as in `src.methods.fourier.get_impedances`, and the rest of the analysis reuses the same
+    transforms.
+
+    Args:
+        data_sets (numpy.ndarray): See `src.methods.fourier.get_spectra`.
+        samples_per_period (array_like of int): See `src.methods.fourier.get_spectra`.
+
+    Returns:
+        list of Analysis: The analysis of each frequency.
+
+    """
+    samples_per_period = np.asarray(samples_per_period, dtype=int)
+
+    k = np.shape(data_sets)[1] // 2
+    analyses = [None] * len(samples_per_period)
+
+    for rows, target, voltage, current in fourier.get_spectra(data_sets, samples_per_period):
+        n_transformed = k - samples_per_period[rows[0]]
+
+        impedances = voltage[:, target] / current[:, target]
+        voltage_amplitudes, voltage_snrs = get_spectrum_metrics(voltage, target, n_transformed)
+        current_amplitudes, current_snrs = get_spectrum_metrics(current, target, n_transformed)
+
+        for j, row in enumerate(rows):
+            analyses[row] = Analysis(complex(impedances[j]), float(voltage_amplitudes[j]),
+                                     float(current_amplitudes[j]), float(voltage_snrs[j]), float(current_snrs[j]))
+
+    return analyses
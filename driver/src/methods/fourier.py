@@ -20,31 +20,59 @@ def get_impedance(data_set, n_samples):
         n_samples (int): The number of samples.
 
     Returns:
-        list of complex: The real and imaginary impedance.
+        complex: The real and imaginary impedance.
 
     """
-    k = len(data_set) // 2
-    periods = k // n_samples
+    return get_impedances(np.asarray(data_set)[np.newaxis], [n_samples])[0]
 
-    voltage = data_set[:k]
-    current = data_set[k:]
 
-    n = len(voltage) - n_samples
+def get_spectra(data_sets, samples_per_period):
+    """Transform many frequencies at once.
 
-    fft_data_voltage = (np.fft.fft(voltage[n_samples:]) / n)[:(n // 2)]
-    fft_data_current = (np.fft.fft(current[n_samples:]) / n)[:(n // 2)]
+    The first period of each data set is discarded, and the voltage and current of the remaining samples are
+    transformed. The transform is computed once for all the data sets sharing a number of samples per period, rather
+    than once per data set.
 
-    fft_voltage = [fft_data_voltage[0]]
-    fft_curr = [fft_data_current[0]]
+    Args:
+        data_sets (numpy.ndarray, src.common.linear_algebra.matrix.Matrix): One row per frequency, made up of its
+            voltage samples followed by its current samples, all rows being the same length.
+        samples_per_period (array_like of int): The number of samples per period of each frequency.
+
+    Yields:
+        (numpy.ndarray of int, int, numpy.ndarray of complex, numpy.ndarray of complex): For each number of samples
+            per period, the rows that share it, the bin of the frequency measured i.e. the number of periods
+            transformed minus one, and the real Fourier transforms of their voltage and of their current, one row each.
+
+    """
+    data_sets = np.asarray(getattr(data_sets, 'matrix', data_sets))
+    samples_per_period = np.asarray(samples_per_period, dtype=int)
+
+    k = data_sets.shape[1] // 2
+
+    for n_samples in np.unique(samples_per_period):
+        rows = np.flatnonzero(samples_per_period == n_samples)
+
+        yield rows, k // n_samples - 1, np.fft.rfft(data_sets[rows, n_samples:k], axis=1), \
+            np.fft.rfft(data_sets[rows, k + n_samples:], axis=1)
 
-    for i in range(1, len(fft_data_voltage)):
-        fft_voltage.append(fft_data_voltage[i] * 2)
-        fft_curr.append(fft_data_current[i] * 2)
 
-    target_voltage = fft_voltage[periods - 1]
-    target_current = fft_curr[periods - 1]
+def get_impedances(data_sets, samples_per_period):
+    """Calculate the impedance of many frequencies at once.
+
+    The impedance is the ratio between the voltage and the current at the frequency measured, i.e. at the bin of the
+    transforms of `get_spectra` that corresponds to their number of periods.
+
+    Args:
+        data_sets (numpy.ndarray, src.common.linear_algebra.matrix.Matrix): See `get_spectra`.
+        samples_per_period (array_like of int): See `get_spectra`.
+
+    Returns:
+        numpy.ndarray of complex: The impedance of each frequency.
+
+    """
+    impedances = np.empty(len(samples_per_period), dtype=complex)
 
-    mag = np.abs(target_voltage) / np.abs(target_current)
-    angle = np.angle(target_voltage) - np.angle(target_current)
+    for rows, target, voltage, current in get_spectra(data_sets, samples_per_period):
+        impedances[rows] = voltage[:, target] / current[:, target]
 
-    return mag * np.cos(angle) + 1j * mag * np.sin(angle)
+    return impedances
@@ -0,0 +1,246 @@
+"""Batch re-processing of archived sweeps.
+
+Walks a directory of csv files written by `src.common.file.csv_files.write_current_voltage_csv`, and parses and
+analyzes them in worker processes, e.g. after the analysis changed. Results are cached by the SHA-1 of each file's
+contents together with `src.methods.analysis.ANALYSIS_VERSION` (see `src.common.file.analysis_cache`), so that a rerun
+only parses the files that are new or changed: the others are only read to be hashed.
+
+Run from the 'driver' directory:
+
+    python -m src.methods.reprocess path/to/sweeps -o spectra.csv
+    python -m src.methods.reprocess path/to/sweeps -j 8 --no-cache
+
+.. _src-methods-reprocess:
+    https://github.com/hivebattery/gui/blob/master/driver/src/methods/reprocess.py
+
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import argparse
+import csv
+import hashlib
+import itertools
+import multiprocessing
+import os
+import sys
+from collections import namedtuple
+
+from src.common.clock import monotonic
+from src.common.file.analysis_cache import AnalysisCache, CACHE_FILE_NAME
+from src.common.file.sweep_csv import SweepCSV
+from src.methods.analysis import Analysis, analyze
+
+CHUNK_SIZE = 8
+"""int: The number of files handed to a worker process at once.
+"""
+SPECTRA_COLUMNS = ['File', 'Device Serial Number', 'Start Date and Time', 'Frequency (Hz)', 'Re(Z) (Ohms)',
+                   'Im(Z) (Ohms)', 'Voltage Amplitude', 'Current Amplitude', 'Voltage SNR (dB)', 'Current SNR (dB)']
+"""list of str: The columns of the spectra file written by `write_spectra`, with one row per file and frequency.
+"""
+
+Reprocessed = namedtuple('Reprocessed', ['path', 'digest', 'serial', 'start', 'frequencies', 'analyses', 'error',
+                                         'cached'])
+"""type: The results of a csv file: its path, the SHA-1 of its contents, the device serial number and start date and
+time it was written with, the frequency in Hz and `src.methods.analysis.Analysis` of each of its columns, the error if
+it couldn't be read or analyzed (in which case the results are None), and whether the results came from the cache.
+"""
+
+_cached = frozenset()
+"""frozenset of str: In a worker, the SHA-1 of the files whose results are cached, which are not parsed again.
+"""
+
+
+def init_worker(cached):
+    """Initialize a worker.
+
+    Args:
+        cached (frozenset of str): `_cached`.
+
+    """
+    global _cached
+    _cached = cached
+
+
+def reprocess_file(file_path):
+    """Parse and analyze a csv file, unless its results are cached.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        (str, str, dict, str): The path of the file, the SHA-1 of its contents (or None if it couldn't be read), its
+            results as cached by `src.common.file.analysis_cache.AnalysisCache` (or None if they already are, or if
+            the file couldn't be read or analyzed) and the error (or None), or None if the file isn't a sweep csv file.
+
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            text = f.read()
+    except IOError as e:
+        return file_path, None, None, "%s: %s" % (type(e).__name__, e)
+
+    digest = hashlib.sha1(text).hexdigest()
+
+    if digest in _cached:
+        return file_path, digest, None, None
+
+    try:
+        sweep = SweepCSV.parse(text)
+    except ValueError:  #: Another csv file, e.g. the spectra written by an earlier run
+        return None
+
+    try:
+        analyses = analyze(sweep.load(), sweep.samples_per_period)
+    except Exception as e:  #: A malformed file must not bring the batch down
+        return file_path, digest, None, "%s: %s" % (type(e).__name__, e)
+
+    results = dict(serial=sweep.header['Device Serial Number'], start=sweep.header['Start Date and Time'],
+                   frequencies=sweep.frequencies,
+                   analyses=[[a.impedance.real, a.impedance.imag] + list(a[1:]) for a in analyses])
+
+    return file_path, digest, results, None
+
+
+def find_sweep_files(directory, exclude=()):
+    """Find the csv files in a directory and its subdirectories.
+
+    Args:
+        directory (str): The directory.
+        exclude (iterable of str, optional): The paths of files to leave out e.g. written by the run. Default is none.
+
+    Returns:
+        list of str: The path of every csv file, sorted.
+
+    """
+    exclude = set(os.path.realpath(file_path) for file_path in exclude)
+
+    return sorted(os.path.join(root, name) for root, _, names in os.walk(directory) for name in names
+                  if name.lower().endswith('.csv') and os.path.realpath(os.path.join(root, name)) not in exclude)
+
+
+def reprocess(directory, n_workers=None, cache_path=None, use_cache=True, exclude=()):
+    """Analyze every sweep csv file in a directory and its subdirectories.
+
+    The csv files whose header doesn't follow the layout of `src.common.file.csv_files.write_current_voltage_csv` are
+    left out.
+
+    Args:
+        directory (str): The directory.
+        n_workers (int, optional): The number of worker processes, where 0 means analyzing in this process. Default
+            is None, which means one per CPU.
+        cache_path (str, optional): The path of the cache file. Default is None, which means
+            `src.common.file.analysis_cache.CACHE_FILE_NAME` in `directory`.
+        use_cache (bool, optional): False to analyze every file and leave the cache untouched. Default is True.
+        exclude (iterable of str, optional): See `find_sweep_files`.
+
+    Returns:
+        list of Reprocessed: The results of each file, sorted by path.
+
+    """
+    files = find_sweep_files(directory, exclude)
+    cache = AnalysisCache(cache_path or AnalysisCache.default_path(directory)) if use_cache else None
+    cached = frozenset() if cache is None else cache.digests
+    n_workers = multiprocessing.cpu_count() if n_workers is None else n_workers
+    pool = None
+
+    if n_workers > 0 and len(files) > 1:
+        pool = multiprocessing.Pool(min(n_workers, len(files)), init_worker, (cached,))
+        finished = pool.imap_unordered(reprocess_file, files, chunksize=CHUNK_SIZE)
+    else:
+        init_worker(cached)
+        finished = itertools.imap(reprocess_file, files)
+
+    reprocessed = []
+
+    try:
+        for result in finished:
+            if result is None:
+                continue
+
+            file_path, digest, results, error = result
+            is_cached = results is None and error is None
+
+            if is_cached:
+                results = cache.get(digest)
+            elif cache is not None and error is None:
+                cache.put(digest, results)
+
+            if results is None:
+                reprocessed.append(Reprocessed(file_path, digest, None, None, None, None, error, False))
+            else:
+                analyses = [Analysis(complex(a[0], a[1]), *a[2:]) for a in results['analyses']]
+                reprocessed.append(Reprocessed(file_path, digest, results['serial'], results['start'],
+                                               results['frequencies'], analyses, None, is_cached))
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+        if cache is not None:
+            cache.save()
+
+    return sorted(reprocessed, key=lambda r: r.path)
+
+
+def write_spectra(file_path, reprocessed):
+    """Write the results of many csv files to a single one, with one row per file and frequency.
+
+    Args:
+        file_path (str): The path of the file to write.
+        reprocessed (list of Reprocessed): The results, of which the files that failed are left out.
+
+    """
+    with open(file_path, 'wb') as f:
+        writer = csv.writer(f)
+        writer.writerow(SPECTRA_COLUMNS)
+
+        for r in reprocessed:
+            if r.error is not None:
+                continue
+
+            for frequency, a in zip(r.frequencies, r.analyses):
+                writer.writerow([r.path, r.serial, r.start, frequency, a.impedance.real, a.impedance.imag] +
+                                list(a[1:]))
+
+
+def main(argv=None):
+    """Re-process a directory from the command line.
+
+    Args:
+        argv (list of str, optional): The arguments. Default is None, which means `sys.argv`.
+
+    Returns:
+        int: 0 if every sweep csv file was analyzed, 1 otherwise.
+
+    """
+    parser = argparse.ArgumentParser(description="Analyze every sweep csv file in a directory.")
+    parser.add_argument('directory', help="the directory, searched recursively")
+    parser.add_argument('-o', '--output', help="write the impedance spectra of every file to this csv file")
+    parser.add_argument('-j', '--workers', type=int, help="the number of worker processes (default: one per CPU)")
+    parser.add_argument('--cache', help="the cache file (default: %s in the directory)" % CACHE_FILE_NAME)
+    parser.add_argument('--no-cache', action='store_true', help="analyze every file, without using the cache")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        parser.error("%s is not a directory" % args.directory)
+
+    start = monotonic()
+    reprocessed = reprocess(args.directory, args.workers, args.cache, not args.no_cache,
+                            () if args.output is None else [args.output])
+    failed = [r for r in reprocessed if r.error is not None]
+
+    for r in failed:
+        print >> sys.stderr, "%s: %s" % (r.path, r.error)
+
+    if args.output is not None:
+        write_spectra(args.output, reprocessed)
+
+    print >> sys.stderr, "Analyzed %i files (%i cached, %i failed) in %.1f s." % \
+                         (len(reprocessed), sum(r.cached for r in reprocessed), len(failed), monotonic() - start)
+
+    return 1 if len(failed) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Analysis Reducer Class Definition.
+
+.. _src-reducers-analysis_reducer:
+    https://github.com/hivebattery/gui/blob/master/driver/src/reducer/analysis_reducer.py
+
+"""
+from __future__ import absolute_import
+
+from react.redux.reducer import Reducer
+
+from src.actions.analysis_actions import ACTION_TYPES
+from src.common.log import trace
+from src.common.log.stage_timer import stage_timer
+
+DEFAULT_STATE = dict(sweep_id=None, analyses=())
+"""dict: The reducers initial state.
+"""
+
+
+class AnalysisReducer(Reducer):
+    """AnalysisReducer
+
+    Defines a way to reduce the analyses returned by the analysis actions to pass down as props to the connected
+    components. Only the analyses of the latest sweep submitted are kept: those of older sweeps are dropped.
+
+    """
+    def __init__(self):
+        super(AnalysisReducer, self).__init__(DEFAULT_STATE)
+
+    def reduce_action(self, action):
+        """Reduces the data generated by the analysis actions into props for components.
+
+        Args:
+            action (react.data_structures.named_tuple.NamedTuple): The results returned by the analysis actions.
+
+        Returns:
+            react.data_structures.named_tuple.NamedTuple: The new state of the reducer to pass down as props.
+
+        """
+        t = action.type
+        current_state = {}
+
+        trace.info('reducer', "%s ACTION", t)
+
+        if t == ACTION_TYPES.ANALYZE_FREQUENCY:
+            if action.data != self.state.sweep_id:  #: a new sweep, with no analysis yet
+                current_state['sweep_id'] = action.data
+                current_state['analyses'] = (None,) * action.args
+        elif t == ACTION_TYPES.COLLECT_ANALYSES:
+            analyses = list(self.state.analyses)
+
+            for (sweep_id, freq_id), analysis, seconds, error in action.data:
+                stage_timer.record('analysis', seconds)
+
+                if error is not None:
+                    trace.error('reducer', "Analysis of frequency %i failed: %s", freq_id + 1, error)
+                elif sweep_id == self.state.sweep_id:
+                    analyses[freq_id] = analysis
+
+            current_state['analyses'] = tuple(analyses)
+
+        self.update(current_state)
+
+        return self.state
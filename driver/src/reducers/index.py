@@ -1,13 +1,15 @@
 """Root Reducer Definition.
 
-Up to this point, the USB reducer is the only one implemented.
+The USB reducer holds the state of the device and the data it transfers, and the analysis reducer holds the analyses of
+that data.
 
 """
 from __future__ import absolute_import
 
 from react.redux.index import combine_reducers
+from .analysis_reducer import AnalysisReducer
 from .usb_reducer import USBReducer
 
-root_reducer = combine_reducers(usb=USBReducer())
-"""react.data_structures.named_tuple.NamedTuple: Contains the USB reducer as its only attributes.
+root_reducer = combine_reducers(usb=USBReducer(), analysis=AnalysisReducer())
+"""react.data_structures.named_tuple.NamedTuple: Contains the USB and analysis reducers as its attributes.
 """
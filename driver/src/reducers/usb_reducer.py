@@ -9,9 +9,13 @@ import datetime
 
 from react.redux.reducer import Reducer
 
+from src.common.data_structures.sweep import Sweep
+from src.common.log.stage_timer import stage_timer
+
 from src.actions.actions import ACTION_TYPES, sSIGN
-from src.common.log.console_message import print_status, ERR_USB_OTHER
-from src.config.config import LOG, DEV
+from src.common.log import trace
+from src.common.log.console_message import ERR_USB_OTHER
+from src.config.config import DEV
 
 DEFAULT_STATE = dict(data=None, usb_handle=None, message=None, current_range=None, status=None, is_connected=False,
                      error=None, args=None)
@@ -43,11 +47,11 @@ class USBReducer(Reducer):
         err = None
         t = action.type
         current_state = {}
-        update = None if LOG < 1 else "%s ACTION " % t
 
         if t == ACTION_TYPES.POLL_EIS and action.data is not None:
-            if LOG > 0:
-                update += "0x%02X" % action.data
+            trace.info('reducer', "%s ACTION 0x%02X", t, action.data)
+        else:
+            trace.info('reducer', "%s ACTION", t)
 
         if action.error is not None:
             current_state['status'] = None
@@ -68,6 +72,10 @@ class USBReducer(Reducer):
             elif t == ACTION_TYPES.START_EIS:
                 current_state['message'] = action.data
                 current_state['data'] = None
+
+                if action.args is not None:  #: a new, empty sweep
+                    plan, n_samples, n_periods = action.args
+                    current_state['data'] = Sweep(plan, n_samples, n_periods)
             elif t == ACTION_TYPES.POLL_EIS:
                 current_state['message'] = None
                 current_state['status'] = action.data
@@ -78,14 +86,12 @@ class USBReducer(Reducer):
             elif t == ACTION_TYPES.CLEAR_USB_ERRORS:
                 pass
             elif t == ACTION_TYPES.START_EIS_DATA_TRANSFER:
-                data_set = (datetime.datetime.now(), action.data)
-
-                if self.state.data is None:
-                    current_state['data'] = [data_set]
+                if len(self.state.data) >= len(self.state.data.plan):  #: Only the frequencies requested are analyzed
+                    trace.warning('reducer', "Dropped a data set beyond the %i frequencies requested.",
+                                  len(self.state.data.plan))
                 else:
-                    x = self.state.data[:]
-                    x.append(data_set)
-                    current_state['data'] = x
+                    with stage_timer.span('reduce'):
+                        current_state['data'] = self.state.data.append(datetime.datetime.now(), action.data)
             elif t == ACTION_TYPES.UPDATE_USB_STATUS:
                 current_state['status'] = action.data
             else:
@@ -98,9 +104,6 @@ class USBReducer(Reducer):
             current_state['usb_handle'] = "n"
             current_state['error'] = None, None
 
-        self.state = self.state._replace(**current_state)
-
-        if update is not None:
-            print_status(update)
+        self.update(current_state)
 
         return self.state